@@ -0,0 +1,89 @@
+"""Benchmark of `fingerprint` against `pd.util.hash_pandas_object` and BLAKE2b on GB-scale DataFrames.
+
+A wide frame of float columns is generated along with a mixed frame of nullable integer, categorical, datetime, and
+float columns, and each is fingerprinted in full, in sampled mode, and with the alternatives.
+
+    python benchmarks/fingerprint_benchmark.py --gigabytes 1
+"""
+import argparse
+import hashlib
+import time
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils import fingerprint
+
+
+def _wide_frame(num_bytes: int, num_columns: int = 200) -> pd.DataFrame:
+    num_rows = num_bytes // (8 * num_columns)
+    values = np.random.default_rng(0).random((num_rows, num_columns))
+    return pd.DataFrame(values, columns=[f"Col_{i}" for i in range(num_columns)])
+
+
+def _mixed_frame(num_bytes: int) -> pd.DataFrame:
+    num_rows = num_bytes // 30
+    rng = np.random.default_rng(0)
+    integers = pd.array(rng.integers(0, 1000, num_rows), dtype="Int64")
+    integers[::10] = pd.NA
+    return pd.DataFrame(
+        {
+            "nullable": integers,
+            "category": pd.Categorical.from_codes(
+                rng.integers(0, 50, num_rows), [f"level_{i}" for i in range(50)]
+            ),
+            "datetime": pd.date_range("2000-01-01", periods=num_rows, freq="s"),
+            "float": rng.random(num_rows),
+        }
+    )
+
+
+def _blake2b(data: pd.DataFrame) -> str:
+    """A cryptographic hash of the raw buffers of numpy columns, as a baseline."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for _, column in data.items():
+        hasher.update(np.ascontiguousarray(column.to_numpy()).view(np.uint8))
+    return hasher.hexdigest()
+
+
+def _time(function, data) -> float:
+    start = time.perf_counter()
+    function(data)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gigabytes", type=float, default=1.0)
+    parser.add_argument("--sample-rows", type=int, default=100_000)
+    args = parser.parse_args()
+    num_bytes = int(args.gigabytes * 1024**3)
+
+    for label, data in [
+        ("wide float", _wide_frame(num_bytes)),
+        ("mixed", _mixed_frame(num_bytes)),
+    ]:
+        size = data.memory_usage(index=False).sum() / 1024**3
+        print(
+            f"{label} frame: {data.shape[0]} rows x {data.shape[1]} columns, {size:.2f} GB"
+        )
+        methods = [
+            ("fingerprint", fingerprint),
+            (
+                f"fingerprint sampled ({args.sample_rows} rows)",
+                lambda frame: fingerprint(frame, sample_rows=args.sample_rows),
+            ),
+            (
+                "hash_pandas_object",
+                lambda frame: pd.util.hash_pandas_object(frame, index=False),
+            ),
+        ]
+        if label == "wide float":
+            methods.append(("blake2b of raw buffers", _blake2b))
+        for name, function in methods:
+            seconds = _time(function, data)
+            print(f"{name:>40}: {seconds:7.3f} s, {size / seconds:6.2f} GB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark of `forecast_many` throughput in series per second as the number of worker processes grows.
+
+The panel forecast is compared against the Python loop it replaces, which calls `forecast` once per series.
+
+    python benchmarks/forecast_many_benchmark.py --series 2000 --jobs 1 2 4
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from facilyst.models import CrostonOptimizedRegressor
+
+
+def _panel(num_series: int, num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "series_id": np.repeat(np.arange(num_series), num_rows),
+            "date": np.tile(
+                pd.date_range("2020-01-01", periods=num_rows, freq="D"), num_series
+            ),
+            "target": rng.poisson(1, num_series * num_rows).astype(float),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=104)
+    parser.add_argument("--horizon", type=int, default=14)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    data = _panel(args.series, args.rows)
+    model = CrostonOptimizedRegressor()
+
+    start = time.perf_counter()
+    for _, series in data.groupby("series_id"):
+        model.forecast(y_train=series.set_index("date")["target"], horizon=args.horizon)
+    elapsed = time.perf_counter() - start
+    print(f"{'forecast loop':>22}: {args.series / elapsed:9.1f} series/s")
+
+    for n_jobs in args.jobs:
+        start = time.perf_counter()
+        model.forecast_many(
+            data, "series_id", "date", "target", args.horizon, n_jobs=n_jobs
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{f'forecast_many n_jobs={n_jobs}':>22}: {args.series / elapsed:9.1f} series/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
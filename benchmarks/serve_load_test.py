@@ -0,0 +1,99 @@
+"""Load test that shows the throughput gain of micro-batching in `facilyst serve`.
+
+The same fitted model is served twice in-process, once with every request predicted on by itself (a batch size of 1)
+and once with concurrent requests coalesced into micro-batches, and each server is hit by the same number of
+concurrent clients sending single-row requests.
+
+    python benchmarks/serve_load_test.py --clients 64 --requests 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+from sklearn.datasets import make_regression
+
+from facilyst.models import RandomForestRegressor
+from facilyst.utils.serving_utils import start_server
+
+
+async def _client(port: int, rows: np.ndarray, num_requests: int, latencies: list):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for index in range(num_requests):
+            body = json.dumps(
+                {"instances": [rows[index % len(rows)].tolist()]}
+            ).encode()
+            start = time.perf_counter()
+            writer.write(
+                b"POST /predict HTTP/1.1\r\nHost: localhost\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            content_length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    content_length = int(line.split(b":")[1])
+            await reader.readexactly(content_length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _run(model, rows, max_batch_size, max_wait_ms, clients, requests) -> dict:
+    server, batcher = await start_server(
+        model, port=0, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+    )
+    port = server.sockets[0].getsockname()[1]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_client(port, rows, requests, latencies) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    await batcher.stop()
+    latencies_ms = np.asarray(latencies) * 1000
+    return {
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "mean_batch_size": batcher.metrics.to_dict()["batch_size"]["mean"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    x, y = make_regression(n_samples=2000, n_features=20, random_state=0)
+    model = RandomForestRegressor(n_estimators=100, n_jobs=1).fit(x, y)
+
+    for label, max_batch_size in [
+        ("unbatched", 1),
+        ("micro-batched", args.max_batch_size),
+    ]:
+        results = asyncio.run(
+            _run(
+                model, x, max_batch_size, args.max_wait_ms, args.clients, args.requests
+            )
+        )
+        print(
+            f"{label:>14}: {results['requests_per_second']:8.1f} req/s, "
+            f"p50 {results['p50_ms']:7.2f} ms, p99 {results['p99_ms']:7.2f} ms, "
+            f"mean batch {results['mean_batch_size']:5.1f} rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
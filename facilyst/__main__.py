@@ -1,4 +1,5 @@
 """CLI commands."""
+import asyncio
 
 import click
 
@@ -7,3 +8,138 @@ import click
 def cli():
     """CLI command with no arguments. Does nothing."""
     pass
+
+
+@cli.command()
+@click.argument("model_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--host", default="127.0.0.1", show_default=True, help="The host to listen on."
+)
+@click.option("--port", default=8000, show_default=True, help="The port to listen on.")
+@click.option(
+    "--max-batch-size",
+    default=64,
+    show_default=True,
+    help="The maximum number of rows predicted on together.",
+)
+@click.option(
+    "--max-wait-ms",
+    default=5.0,
+    show_default=True,
+    help="The maximum time a request waits for others to join its batch.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    help="The number of batches that can be predicted on at the same time.",
+)
+def serve(model_path, host, port, max_batch_size, max_wait_ms, workers):
+    """Serves a model saved with `ModelBase.save` over HTTP, batching concurrent requests together."""
+    from facilyst.models.utils import load_model
+    from facilyst.utils.serving_utils import serve_model
+
+    model = load_model(model_path)
+    click.echo(f"Serving {model.name} on http://{host}:{port}")
+    try:
+        asyncio.run(
+            serve_model(
+                model,
+                host=host,
+                port=port,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                num_workers=workers,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.option(
+    "--model",
+    "model_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="The model saved with `ModelBase.save`.",
+)
+@click.option(
+    "--input",
+    "input_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="The CSV or Parquet file to score.",
+)
+@click.option(
+    "--output",
+    "output_path",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="The CSV or Parquet file to write the results to.",
+)
+@click.option(
+    "--chunk-size",
+    default=100_000,
+    show_default=True,
+    help="The number of rows read and scored at a time.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    help="The number of worker processes scoring chunks in parallel.",
+)
+@click.option(
+    "--id-column",
+    default=None,
+    help="A column copied to the output, or the column identifying each series for time series models.",
+)
+@click.option(
+    "--target-column",
+    default=None,
+    help="The column holding the target values of each series for time series models.",
+)
+@click.option(
+    "--horizon",
+    default=None,
+    type=int,
+    help="The number of steps to forecast per series for time series models.",
+)
+def predict(
+    model_path,
+    input_path,
+    output_path,
+    chunk_size,
+    workers,
+    id_column,
+    target_column,
+    horizon,
+):
+    """Streams a CSV or Parquet file through a saved model in chunks, writing the predictions as it goes."""
+    from facilyst.utils.scoring_utils import score_file
+
+    def report(num_rows, elapsed):
+        click.echo(
+            f"Scored {num_rows} rows ({num_rows / elapsed if elapsed else 0.0:.1f} rows/sec)",
+            err=True,
+        )
+
+    try:
+        results = score_file(
+            model_path,
+            input_path,
+            output_path,
+            chunk_size=chunk_size,
+            workers=workers,
+            id_column=id_column,
+            target_column=target_column,
+            horizon=horizon,
+            progress=report,
+        )
+    except ValueError as error:
+        raise click.UsageError(str(error))
+    click.echo(
+        f"Scored {results['rows']} rows in {results['seconds']:.2f} seconds "
+        f"({results['rows_per_second']:.1f} rows/sec) to {output_path}"
+    )
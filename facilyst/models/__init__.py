@@ -1,5 +1,10 @@
 from .model_base import ModelBase
 from .time_series_model_base import TimeSeriesModelBase
+from .ensemble_model_base import EnsembleModelBase
+from .boosting_model_base import BoostingModelBase
+from .hist_gradient_boosting_model_base import HistGradientBoostingModelBase
+from .nearest_neighbors_model_base import NearestNeighborsModelBase
+from .forest_model_base import ForestModelBase
 from .neural_networks import (
     BERTBinaryClassifier,
     BERTQuestionAnswering,
@@ -12,7 +17,11 @@ from .classifiers import (
     CatBoostClassifier,
     DecisionTreeClassifier,
     ExtraTreesClassifier,
+    HistGradientBoostingClassifier,
+    KNearestNeighborsClassifier,
     RandomForestClassifier,
+    StackingClassifier,
+    VotingClassifier,
     XGBoostClassifier,
 )
 from .regressors import (
@@ -20,14 +29,19 @@ from .regressors import (
     ADIDARegressor,
     AutoARIMARegressor,
     AutoETSRegressor,
+    AutoForecasterRegressor,
     AutoThetaRegressor,
     BaggingRegressor,
     CatBoostRegressor,
     CrostonOptimizedRegressor,
     DecisionTreeRegressor,
     ExtraTreesRegressor,
+    HistGradientBoostingRegressor,
     IMAPARegressor,
+    KNearestNeighborsRegressor,
     RandomForestRegressor,
+    StackingRegressor,
     TSBRegressor,
+    VotingRegressor,
     XGBoostRegressor,
 )
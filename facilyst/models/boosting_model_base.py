@@ -0,0 +1,362 @@
+"""Base class for gradient boosting models that train on a native data container."""
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from facilyst.models.model_base import ModelBase
+from facilyst.utils import import_errors_dict, import_or_raise
+from facilyst.utils.cache_utils import LRUCache
+from facilyst.utils.conversion_utils import to_array, to_model_input
+from facilyst.utils.fingerprint_utils import fingerprint
+
+
+class BoostingModelBase(ModelBase):
+    """Base initialization for gradient boosting models that train on a native data container.
+
+    XGBoost trains on a `DMatrix`, or on a lower memory `QuantileDMatrix` when `tree_method` is set to "hist", and
+    CatBoost trains and predicts on a `Pool`. Once `enable_native_cache` has been called, each container is built once
+    per unique data and reused by every later `fit`, `predict`, and `score` call, with XGBoost then trained through
+    `xgboost.train` on the cached containers. Containers are keyed by a fingerprint of the data, so changing the data
+    always builds a new container. Both libraries support early stopping on a validation set through `fit`.
+
+    :param model: The model to be used.
+    :type model: object
+    :param parameters: The parameters of the model.
+    :type parameters: dict
+    """
+
+    native_data_type: str = "DMatrix"
+    fit_cache_excluded: tuple = ModelBase.fit_cache_excluded + ("native_cache",)
+
+    def __init__(
+        self, model: Optional[Any] = None, parameters: Optional[dict] = None
+    ) -> None:
+        super().__init__(model=model, parameters=parameters)
+        self.native_cache = None
+        self.best_iteration = None
+
+    def enable_native_cache(
+        self,
+        cache: Optional[LRUCache] = None,
+        max_bytes: Optional[int] = 1024**3,
+    ) -> "BoostingModelBase":
+        """Caches the native data containers built from the data passed to the model.
+
+        :param cache: An existing cache to store the containers in. Passing the same cache to several models lets them
+        share containers, for example across the trials of an optimizer. Defaults to a new cache.
+        :type cache: LRUCache, optional
+        :param max_bytes: The maximum size of a new cache in bytes, after which the least recently used containers are
+        evicted. Defaults to 1 GB.
+        :type max_bytes: int, optional
+        :return: Returns self.
+        :rtype class:
+        """
+        self.native_cache = cache if cache is not None else LRUCache(max_bytes)
+        return self
+
+    def disable_native_cache(self) -> "BoostingModelBase":
+        """Removes the native data cache, without clearing a cache that is shared with other models.
+
+        :return: Returns self.
+        :rtype class:
+        """
+        self.native_cache = None
+        return self
+
+    def _native_data(
+        self, data: dict, parameters: tuple, build: Callable[[], Any]
+    ) -> Any:
+        """Returns the cached container for the data and construction parameters, building and storing it on a miss."""
+        if self.native_cache is None:
+            return build()
+        key = (
+            (self.native_data_type,)
+            + parameters
+            + tuple(
+                (name, None if value is None else fingerprint(value))
+                for name, value in sorted(data.items())
+            )
+        )
+        container = self.native_cache.get(key)
+        if container is None:
+            container = build()
+            self.native_cache.put(key, container)
+        return container
+
+    def _pool(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Optional[Union[pd.Series, np.ndarray]] = None,
+    ) -> Any:
+        """The CatBoost `Pool` of the data."""
+        catboost = import_or_raise("catboost", import_errors_dict["catboost"])
+        cat_features = self.model.get_params().get("cat_features")
+        return self._native_data(
+            data={"data": x, "label": y},
+            parameters=(("cat_features", repr(cat_features)),),
+            build=lambda: catboost.Pool(x, label=y, cat_features=cat_features),
+        )
+
+    def _dmatrix(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Optional[np.ndarray] = None,
+        reference: Optional[tuple] = None,
+    ) -> Any:
+        """The XGBoost `DMatrix` of the data, or a `QuantileDMatrix` when `tree_method` is set to "hist".
+
+        An evaluation `QuantileDMatrix` reuses the quantile cuts of the training matrix passed in `reference` as the
+        pair of the training data and its matrix, so it is keyed on the fingerprint of that training data.
+        """
+        xgboost = import_or_raise("xgboost", import_errors_dict["xgboost"])
+        model_params = self.model.get_params()
+        ref_data, ref = reference if reference is not None else (None, None)
+        quantile = model_params["tree_method"] in ("hist", "gpu_hist") and hasattr(
+            xgboost, "QuantileDMatrix"
+        )
+        max_bin = (model_params["max_bin"] or 256) if quantile else None
+        matrix_params = {
+            "missing": model_params["missing"],
+            "enable_categorical": model_params["enable_categorical"],
+            "feature_types": model_params["feature_types"],
+            "nthread": model_params["n_jobs"],
+        }
+
+        def _build() -> Any:
+            if quantile:
+                try:
+                    return xgboost.QuantileDMatrix(
+                        x,
+                        label=y,
+                        ref=ref,
+                        max_bin=max_bin,
+                        **matrix_params,
+                    )
+                except TypeError:
+                    pass
+            return xgboost.DMatrix(x, label=y, **matrix_params)
+
+        return self._native_data(
+            data={"data": x, "label": y, "reference": ref_data},
+            parameters=(
+                ("quantile", quantile),
+                ("max_bin", max_bin),
+                ("missing", repr(model_params["missing"])),
+                ("enable_categorical", model_params["enable_categorical"]),
+                ("feature_types", repr(model_params["feature_types"])),
+            ),
+            build=_build,
+        )
+
+    def _trains_natively(self) -> bool:
+        """Whether XGBoost is trained on cached containers, which requires built-in objectives and metrics."""
+        if self.native_cache is None or self.native_data_type != "DMatrix":
+            return False
+        model_params = self.model.get_params()
+        return not (
+            callable(model_params["objective"]) or callable(model_params["eval_metric"])
+        )
+
+    def _train_native(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: np.ndarray,
+        x_valid: Optional[Union[pd.DataFrame, np.ndarray]],
+        y_valid: Optional[np.ndarray],
+        early_stopping_rounds: Optional[int],
+    ) -> None:
+        """Trains the booster with `xgboost.train` on cached containers and loads it into the scikit-learn model."""
+        xgboost = import_or_raise("xgboost", import_errors_dict["xgboost"])
+        params = self.model.get_xgb_params()
+        meta = {}
+        if self.primary_type == "classification":
+            classes = np.unique(y_train)
+            if not np.array_equal(classes, np.arange(len(classes))):
+                raise ValueError(
+                    f"Invalid classes inferred from unique values of `y`. Expected: {np.arange(len(classes))}, got "
+                    f"{classes}"
+                )
+            meta = {"classes_": classes.tolist(), "n_classes_": len(classes)}
+            if len(classes) > 2:
+                if params.get("objective") != "multi:softmax":
+                    params["objective"] = "multi:softprob"
+                params["num_class"] = len(classes)
+
+        dtrain = self._dmatrix(x_train, y_train)
+        evals = []
+        if x_valid is not None:
+            evals = [
+                (
+                    self._dmatrix(x_valid, y_valid, reference=(x_train, dtrain)),
+                    "validation_0",
+                )
+            ]
+        if early_stopping_rounds is None:
+            early_stopping_rounds = self.model.get_params()["early_stopping_rounds"]
+        evals_result = {}
+        booster = xgboost.train(
+            params,
+            dtrain,
+            num_boost_round=self.model.get_num_boosting_rounds(),
+            evals=evals,
+            early_stopping_rounds=early_stopping_rounds,
+            evals_result=evals_result,
+            verbose_eval=False,
+            callbacks=self.model.get_params()["callbacks"],
+        )
+
+        meta["objective"] = params["objective"]
+        if evals_result:
+            meta["evals_result_"] = evals_result
+        booster.set_attr(scikit_learn=json.dumps(meta))
+        self.model.load_model(bytearray(booster.save_raw(raw_format="json")))
+
+    @contextmanager
+    def _early_stopping(self, early_stopping_rounds: Optional[int]) -> Iterator[dict]:
+        """Sets up XGBoost early stopping for the duration of a fit, yielding any extra parameters `fit` needs."""
+        model_params = self.model.get_params()
+        if early_stopping_rounds is None:
+            yield {}
+        elif "early_stopping_rounds" not in model_params:
+            yield {"early_stopping_rounds": early_stopping_rounds}
+        else:
+            original_rounds = model_params["early_stopping_rounds"]
+            self.model.set_params(early_stopping_rounds=early_stopping_rounds)
+            try:
+                yield {}
+            finally:
+                self.model.set_params(early_stopping_rounds=original_rounds)
+
+    def _split_validation(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: np.ndarray,
+        validation_fraction: float,
+    ) -> tuple:
+        """Carves a validation set off the training data, stratified by class for classification."""
+        split_params = {
+            "test_size": validation_fraction,
+            "random_state": (self.parameters or {}).get("random_state"),
+        }
+        if self.primary_type == "classification":
+            try:
+                return train_test_split(
+                    x_train, y_train, stratify=y_train, **split_params
+                )
+            except ValueError:
+                pass
+        return train_test_split(x_train, y_train, **split_params)
+
+    def fit(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: Union[pd.Series, np.ndarray],
+        eval_set: Optional[tuple] = None,
+        early_stopping_rounds: Optional[int] = None,
+        validation_fraction: Optional[float] = 0.1,
+    ) -> Any:
+        """Fits model to the data, reusing the native data container if it has already been built.
+
+        If `early_stopping_rounds` is set, training stops once the score on the validation set hasn't improved for that
+        many rounds, and the model then predicts using only the trees up to the best iteration, stored in
+        `best_iteration`.
+
+        :param x_train: The training data for the model to be fitted on.
+        :type x_train: pd.DataFrame or np.ndarray
+        :param y_train: The training targets for the model to be fitted on.
+        :type y_train: pd.Series or np.ndarray
+        :param eval_set: The validation data and targets used for early stopping. If not passed, a validation set is
+        carved off the training data. Can only be passed alongside `early_stopping_rounds`.
+        :type eval_set: tuple, optional
+        :param early_stopping_rounds: The number of rounds without improvement on the validation set after which
+        training stops. Defaults to None, which trains every tree.
+        :type early_stopping_rounds: int, optional
+        :param validation_fraction: The fraction of the training data carved off as the validation set when no
+        `eval_set` is passed. Defaults to 0.1.
+        :type validation_fraction: float, optional
+        """
+        if eval_set is not None and early_stopping_rounds is None:
+            raise ValueError(
+                "The `eval_set` is only used for early stopping, please set `early_stopping_rounds` as well."
+            )
+        x_train, y_train = to_model_input(x_train), to_array(y_train)
+        x_valid = y_valid = None
+        fit_params = {}
+        if early_stopping_rounds is not None:
+            if eval_set is None:
+                x_train, x_valid, y_train, y_valid = self._split_validation(
+                    x_train, y_train, validation_fraction
+                )
+            else:
+                x_valid, y_valid = to_model_input(eval_set[0]), to_array(eval_set[1])
+            if self.native_data_type == "Pool":
+                fit_params = {
+                    "eval_set": self._pool(x_valid, y_valid),
+                    "early_stopping_rounds": early_stopping_rounds,
+                    "use_best_model": True,
+                }
+            else:
+                fit_params = {"eval_set": [(x_valid, y_valid)], "verbose": False}
+
+        with self._thread_budget():
+            if self.native_data_type == "Pool":
+                self.model.fit(self._pool(x_train, y_train), **fit_params)
+            elif self._trains_natively():
+                self._train_native(
+                    x_train, y_train, x_valid, y_valid, early_stopping_rounds
+                )
+            else:
+                with self._early_stopping(
+                    early_stopping_rounds
+                ) as early_stopping_params:
+                    self.model.fit(
+                        x_train, y_train, **fit_params, **early_stopping_params
+                    )
+
+        self.best_iteration = None
+        if early_stopping_rounds is not None:
+            if self.native_data_type == "Pool":
+                self.best_iteration = self.model.get_best_iteration()
+            else:
+                self.best_iteration = getattr(self.model, "best_iteration", None)
+        self._new_fit_generation()
+        return self
+
+    def score(
+        self,
+        x_test: Union[pd.DataFrame, np.ndarray],
+        y_actual: Union[pd.Series, np.ndarray],
+    ) -> float:
+        """Scores the predictions of the model using R2 for regression and accuracy for classification.
+
+        :param x_test: The testing data for the model to predict on.
+        :type x_test: pd.DataFrame or np.ndarray
+        :param y_actual: The actual target values to score against.
+        :type y_actual: pd.Series or np.ndarray
+        :return: Calculated score.
+        :rtype float:
+        """
+        if (
+            self.cache is not None
+            or self.native_cache is None
+            or self.native_data_type != "Pool"
+        ):
+            return super().score(x_test, y_actual)
+        x_test, y_actual = to_model_input(x_test), to_array(y_actual)
+        with self._thread_budget():
+            score = self.model.score(self._pool(x_test, y_actual))
+        return score
+
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if self.native_cache is not None and self.native_data_type == "Pool":
+            x_test = self._pool(x_test)
+        return super()._predict(x_test)
+
+    def _predict_proba(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if self.native_cache is not None and self.native_data_type == "Pool":
+            x_test = self._pool(x_test)
+        return super()._predict_proba(x_test)
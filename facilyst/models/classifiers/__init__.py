@@ -3,5 +3,9 @@ from .bagging import BaggingClassifier
 from .catboost import CatBoostClassifier
 from .decision_tree import DecisionTreeClassifier
 from .extra_trees import ExtraTreesClassifier
+from .hist_gradient_boosting import HistGradientBoostingClassifier
+from .k_nearest_neighbors import KNearestNeighborsClassifier
 from .random_forest import RandomForestClassifier
+from .stacking import StackingClassifier
+from .voting import VotingClassifier
 from .xgboost import XGBoostClassifier
@@ -5,11 +5,11 @@ import numpy as np
 import pandas as pd
 from hyperopt import hp
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.boosting_model_base import BoostingModelBase
 from facilyst.utils import import_errors_dict, import_or_raise
 
 
-class CatBoostClassifier(ModelBase):
+class CatBoostClassifier(BoostingModelBase):
     """The CatBoost Classifier (via catboost's library).
 
      This is a classifier that uses gradient boosting on decision trees alongside categorical encoding.
@@ -18,6 +18,7 @@ class CatBoostClassifier(ModelBase):
     max_depth (int): The maximum depth of the tree. Defaults to None.
     learning_rate (float): The learning rate.
     allow_writing_files (bool): Whether to allow the generation of files during training. Defaults to False.
+    thread_count (int): The number of cores to be used, -1 uses all available cores.
     """
 
     name: str = "Catboost Classifier"
@@ -26,6 +27,8 @@ class CatBoostClassifier(ModelBase):
     secondary_type: str = "None"
     tertiary_type: str = "tree"
 
+    native_data_type: str = "Pool"
+
     hyperparameters: dict = {
         "n_estimators": hp.choice("n_estimators", [10, 50, 100, 200, 300]),
         "max_depth": hp.randint("max_depth", 2, 10),
@@ -38,6 +41,7 @@ class CatBoostClassifier(ModelBase):
         max_depth: Optional[int] = None,
         learning_rate: Optional[float] = None,
         allow_writing_files: Optional[bool] = False,
+        thread_count: Optional[int] = -1,
         random_state: Optional[int] = 0,
         **kwargs,
     ) -> None:
@@ -46,6 +50,7 @@ class CatBoostClassifier(ModelBase):
             "max_depth": max_depth,
             "learning_rate": learning_rate,
             "allow_writing_files": allow_writing_files,
+            "thread_count": thread_count,
             "random_state": random_state,
         }
         parameters.update(kwargs)
@@ -56,15 +61,15 @@ class CatBoostClassifier(ModelBase):
 
         super().__init__(model=catboost_model, parameters=parameters)
 
-    def predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """Predicts on the data using the model. Catboost returns an n-dimension array and needs to be flattened.
 
         :param x_test: The testing data for the model to predict on.
         :type x_test: pd.DataFrame or np.ndarray
         :return: The predictions.
-        :rtype pd.Series:
+        :rtype np.ndarray:
         """
-        predictions = self.model.predict(x_test)
+        predictions = super()._predict(x_test)
         if predictions.ndim == 2 and predictions.shape[1] == 1:
-            predictions = predictions.flatten()
-        return pd.Series(predictions)
+            predictions = predictions.ravel()
+        return predictions
@@ -4,10 +4,10 @@ from typing import Optional
 from hyperopt import hp
 from sklearn.ensemble import ExtraTreesClassifier as et_classifier
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.forest_model_base import ForestModelBase
 
 
-class ExtraTreesClassifier(ModelBase):
+class ExtraTreesClassifier(ForestModelBase):
     """The Extra Trees Classifier (via sklearn's implementation).
 
      This is an ensemble classifier that fits randomized decision trees on the entire dataset each time.
@@ -0,0 +1,70 @@
+"""An instance-based model that votes between the classes of the nearest training rows for classification problems."""
+from typing import Optional
+
+from hyperopt import hp
+from sklearn.neighbors import KNeighborsClassifier as knn_classifier
+
+from facilyst.models.nearest_neighbors_model_base import NearestNeighborsModelBase
+
+
+class KNearestNeighborsClassifier(NearestNeighborsModelBase):
+    """The K Nearest Neighbors Classifier (via sklearn's implementation).
+
+     This is a classifier that predicts the most common class among the closest rows of the training data.
+
+    :param n_neighbors: The number of neighbors used for each prediction. Defaults to 5.
+    :type n_neighbors: int, optional
+    :param weights: How the neighbors are weighted, `uniform` weighs them equally and `distance` by the inverse of their
+    distance. Defaults to `uniform`.
+    :type weights: str, optional
+    :param metric: The distance metric between rows. Defaults to `euclidean`.
+    :type metric: str, optional
+    :param algorithm: The index used to find the neighbors, `brute`, `kd_tree`, or `ball_tree`. Defaults to `auto`, which
+    picks the index from the shape of the training data.
+    :type algorithm: str, optional
+    :param leaf_size: The leaf size of the KD or ball tree. Defaults to 30.
+    :type leaf_size: int, optional
+    :param approximate: Whether to use an approximate index from `pynndescent` for high dimensional data. Defaults to
+    False.
+    :type approximate: bool, optional
+    :param n_jobs: The number of cores that queries are run on in parallel, -1 uses all available cores.
+    :type n_jobs: int, optional
+    """
+
+    name: str = "K Nearest Neighbors Classifier"
+
+    primary_type: str = "classification"
+    secondary_type: str = "neighbors"
+    tertiary_type: str = "instance"
+
+    hyperparameters: dict = {
+        "n_neighbors": hp.choice("n_neighbors", [3, 5, 10, 15, 25, 50]),
+        "weights": hp.choice("weights", ["uniform", "distance"]),
+        "metric": hp.choice("metric", ["euclidean", "manhattan", "chebyshev"]),
+    }
+
+    def __init__(
+        self,
+        n_neighbors: Optional[int] = 5,
+        weights: Optional[str] = "uniform",
+        metric: Optional[str] = "euclidean",
+        algorithm: Optional[str] = "auto",
+        leaf_size: Optional[int] = 30,
+        approximate: Optional[bool] = False,
+        n_jobs: Optional[int] = -1,
+        **kwargs,
+    ) -> None:
+        parameters = {
+            "n_neighbors": n_neighbors,
+            "weights": weights,
+            "metric": metric,
+            "algorithm": algorithm,
+            "leaf_size": leaf_size,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        k_nearest_neighbors_model = knn_classifier(**parameters)
+
+        parameters["approximate"] = approximate
+        super().__init__(model=k_nearest_neighbors_model, parameters=parameters)
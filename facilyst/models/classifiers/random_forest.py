@@ -4,10 +4,10 @@ from typing import Optional
 from hyperopt import hp
 from sklearn.ensemble import RandomForestClassifier as rf_classifier
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.forest_model_base import ForestModelBase
 
 
-class RandomForestClassifier(ModelBase):
+class RandomForestClassifier(ForestModelBase):
     """The Random Forest Classifier (via sklearn's implementation).
 
      This is an ensemble classifier that fits multiple trees on the data.
@@ -0,0 +1,92 @@
+"""An ensemble model that learns how to combine the predictions of other models for classification problems."""
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import StackingClassifier as stacking_classifier
+
+from facilyst.models.ensemble_model_base import EnsembleModelBase
+from facilyst.models.model_base import ModelBase
+
+
+class StackingClassifier(EnsembleModelBase):
+    """The Stacking Classifier (via sklearn's implementation).
+
+     This is an ensemble classifier that trains a final estimator on the out-of-fold predicted probabilities of its
+     members. The out-of-fold predictions of every member are computed concurrently.
+
+    :param members: The members of the ensemble. Each entry can either be a model or the name or tag of the model(s) to
+    use, which will be retrieved through `get_models`. Defaults to the Decision Tree, Extra Trees, and Random Forest
+    classifiers.
+    :type members: list, optional
+    :param final_estimator: The model, or the name of the model, trained on the predictions of the members. Defaults to
+    sklearn's `LogisticRegression`.
+    :type final_estimator: str or ModelBase, optional
+    :param cv: The number of folds used to compute the out-of-fold predictions. Defaults to 5.
+    :type cv: int, optional
+    :param n_jobs: The number of processes used to fit the members, -1 uses all available cores.
+    :type n_jobs: int, optional
+    """
+
+    name: str = "Stacking Classifier"
+
+    primary_type: str = "classification"
+    secondary_type: str = "ensemble"
+    tertiary_type: str = "stacking"
+
+    hyperparameters: dict = {}
+
+    def __init__(
+        self,
+        members: Optional[List[Union[str, ModelBase]]] = None,
+        final_estimator: Optional[Union[str, ModelBase]] = None,
+        cv: Optional[int] = 5,
+        n_jobs: Optional[int] = -1,
+        **kwargs,
+    ) -> None:
+        members = members or [
+            "Decision Tree Classifier",
+            "Extra Trees Classifier",
+            "Random Forest Classifier",
+        ]
+        parameters = {
+            "members": members,
+            "final_estimator": final_estimator,
+            "cv": cv,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        self.members = self._collect_members(members, problem_type="classification")
+        self.final_estimator = self._collect_final_estimator(
+            final_estimator, problem_type="classification"
+        )
+
+        stacking_model = stacking_classifier(
+            estimators=[
+                (member_name, member.model) for member_name, member in self.members
+            ],
+            final_estimator=getattr(self.final_estimator, "model", None),
+            cv=cv,
+            stack_method="predict_proba",
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
+        super().__init__(model=stacking_model, parameters=parameters)
+
+    def _member_width(self) -> int:
+        num_classes = len(self.model.classes_)
+        return 1 if num_classes == 2 else num_classes
+
+    def _member_output(
+        self, estimator, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        probabilities = estimator.predict_proba(x_test)
+        if probabilities.shape[1] == 2:
+            probabilities = probabilities[:, 1:]
+        return probabilities
+
+    def _combine(self, member_outputs: np.ndarray) -> np.ndarray:
+        encoded_predictions = self.model.final_estimator_.predict(member_outputs)
+        return self.model.classes_[encoded_predictions]
@@ -0,0 +1,105 @@
+"""An ensemble model that combines the votes of other models for classification problems."""
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from hyperopt import hp
+from sklearn.ensemble import VotingClassifier as voting_classifier
+
+from facilyst.models.ensemble_model_base import EnsembleModelBase
+from facilyst.models.model_base import ModelBase
+
+
+class VotingClassifier(EnsembleModelBase):
+    """The Voting Classifier (via sklearn's implementation).
+
+     This is an ensemble classifier that fits each member on the whole dataset and combines their votes.
+
+    :param members: The members of the ensemble. Each entry can either be a model or the name or tag of the model(s) to
+    use, which will be retrieved through `get_models`. Defaults to the Decision Tree, Extra Trees, and Random Forest
+    classifiers.
+    :type members: list, optional
+    :param voting: If `hard`, uses the majority of the predicted labels. If `soft`, predicts the label with the largest
+    average predicted probability. Defaults to `hard`.
+    :type voting: str, optional
+    :param weights: The weight of each member when combining their votes. Defaults to equal weights.
+    :type weights: list, optional
+    :param n_jobs: The number of processes used to fit the members, -1 uses all available cores.
+    :type n_jobs: int, optional
+    """
+
+    name: str = "Voting Classifier"
+
+    primary_type: str = "classification"
+    secondary_type: str = "ensemble"
+    tertiary_type: str = "voting"
+
+    hyperparameters: dict = {
+        "voting": hp.choice("voting", ["hard", "soft"]),
+    }
+
+    def __init__(
+        self,
+        members: Optional[List[Union[str, ModelBase]]] = None,
+        voting: Optional[str] = "hard",
+        weights: Optional[List[float]] = None,
+        n_jobs: Optional[int] = -1,
+        **kwargs,
+    ) -> None:
+        members = members or [
+            "Decision Tree Classifier",
+            "Extra Trees Classifier",
+            "Random Forest Classifier",
+        ]
+        parameters = {
+            "members": members,
+            "voting": voting,
+            "weights": weights,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        self.members = self._collect_members(members, problem_type="classification")
+
+        voting_model = voting_classifier(
+            estimators=[
+                (member_name, member.model) for member_name, member in self.members
+            ],
+            voting=voting,
+            weights=weights,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
+        super().__init__(model=voting_model, parameters=parameters)
+
+    def _member_width(self) -> int:
+        if self.parameters["voting"] == "soft":
+            return len(self.model.classes_)
+        return 1
+
+    def _member_output(
+        self, estimator, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        if self.parameters["voting"] == "soft":
+            return estimator.predict_proba(x_test)
+        return estimator.predict(x_test)
+
+    def _combine(self, member_outputs: np.ndarray) -> np.ndarray:
+        num_rows, num_members = len(member_outputs), len(self.model.estimators_)
+        num_classes = len(self.model.classes_)
+        weights = self.parameters["weights"] or np.ones(num_members)
+        if self.parameters["voting"] == "soft":
+            probabilities = np.average(
+                member_outputs.reshape(num_rows, num_members, num_classes),
+                axis=1,
+                weights=weights,
+            )
+            encoded_predictions = np.argmax(probabilities, axis=1)
+        else:
+            votes = np.zeros((num_rows, num_classes), dtype=np.float64)
+            rows = np.arange(num_rows)
+            for index in range(num_members):
+                votes[rows, member_outputs[:, index].astype(np.intp)] += weights[index]
+            encoded_predictions = np.argmax(votes, axis=1)
+        return self.model.classes_[encoded_predictions]
@@ -0,0 +1,204 @@
+"""Base class for all ensemble models that combine other facilyst models."""
+import warnings
+from abc import abstractmethod
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, parallel_backend
+
+from facilyst.models.model_base import ModelBase
+from facilyst.utils.execution_utils import get_thread_budget, split_thread_budget
+
+
+class EnsembleModelBase(ModelBase):
+    """Base initialization for all ensemble models.
+
+    Members can be passed either as instantiated models or as names/tags that are resolved through `get_models`. The
+    underlying sklearn meta-estimator fits its members in parallel across a process pool, where large arrays are
+    memory mapped so that every worker shares the same read-only copy of the data. If a core budget has been set through
+    `execution_context`, it is split between the number of members fitted concurrently and the cores of each member.
+
+    :param model: The meta-estimator to be used.
+    :type model: object
+    :param parameters: The parameters of the ensemble.
+    :type parameters: dict
+    """
+
+    def __init__(
+        self, model: Optional[Any] = None, parameters: Optional[dict] = None
+    ) -> None:
+        super().__init__(model=model, parameters=parameters)
+
+    @staticmethod
+    def _collect_members(
+        members: List[Union[str, ModelBase]], problem_type: str
+    ) -> List[Tuple[str, ModelBase]]:
+        """Resolves every name, tag, or model passed into a list of uniquely named, instantiated models."""
+        from facilyst.models.utils import get_models
+
+        collected = []
+        for member in members:
+            if isinstance(member, ModelBase):
+                collected.append(member)
+                continue
+            member_classes = sorted(
+                get_models(member, problem_type=problem_type), key=lambda x: x.name
+            )
+            for member_class in member_classes:
+                if issubclass(member_class, EnsembleModelBase):
+                    continue
+                try:
+                    collected.append(member_class())
+                except ImportError as import_error:
+                    warnings.warn(
+                        f"Skipping `{member_class.name}` as an ensemble member: {import_error}"
+                    )
+
+        if not collected:
+            raise ValueError(
+                "No models were found to build the ensemble from. Please pass at least one model name, tag, or model."
+            )
+
+        named_members = []
+        used_names = set()
+        for member in collected:
+            member_name = member.name.lower().replace(" ", "_").replace("-", "_")
+            unique_name = member_name
+            index = 1
+            while unique_name in used_names:
+                unique_name = f"{member_name}_{index}"
+                index += 1
+            used_names.add(unique_name)
+            named_members.append((unique_name, member))
+        return named_members
+
+    @staticmethod
+    def _collect_final_estimator(
+        final_estimator: Optional[Union[str, ModelBase]], problem_type: str
+    ) -> Optional[ModelBase]:
+        """Resolves the meta-learner passed by name into a single instantiated model."""
+        if final_estimator is None or isinstance(final_estimator, ModelBase):
+            return final_estimator
+        members = EnsembleModelBase._collect_members([final_estimator], problem_type)
+        if len(members) != 1:
+            raise ValueError(
+                f"The final estimator `{final_estimator}` matches {len(members)} models, it must match exactly one."
+            )
+        return members[0][1]
+
+    def _thread_budget_parameters(self, budget: int) -> dict:
+        outer, inner = split_thread_budget(len(self.members), budget)
+        budget_params = {"n_jobs": outer}
+        for member_name, member in self.members:
+            for param, value in member._thread_budget_parameters(inner).items():
+                budget_params[f"{member_name}__{param}"] = value
+        final_estimator = getattr(self, "final_estimator", None)
+        if final_estimator is not None:
+            for param, value in final_estimator._thread_budget_parameters(
+                budget
+            ).items():
+                budget_params[f"final_estimator__{param}"] = value
+        return budget_params
+
+    @contextmanager
+    def _thread_budget(self) -> Iterator[None]:
+        """Applies the core budget to the meta-estimator and to its fitted members for the duration of a call.
+
+        The members are cloned when the ensemble is fitted, so the budget has to be set on the fitted `estimators_` and
+        `final_estimator_` as well as on the templates that the next fit clones.
+        """
+        budget = get_thread_budget()
+        if budget is None or self.model is None:
+            yield
+            return
+        fitted_members = [
+            estimator
+            for estimator in getattr(self.model, "estimators_", [])
+            if hasattr(estimator, "get_params")
+        ]
+        _, inner = split_thread_budget(max(len(self.members), 1), budget)
+        with ExitStack() as stack:
+            stack.enter_context(super()._thread_budget())
+            for estimator in fitted_members:
+                stack.enter_context(
+                    self._set_parameters(
+                        estimator, self._capped_thread_parameters(estimator, inner)
+                    )
+                )
+            final_estimator = getattr(self.model, "final_estimator_", None)
+            if final_estimator is not None:
+                stack.enter_context(
+                    self._set_parameters(
+                        final_estimator,
+                        self._capped_thread_parameters(final_estimator, budget),
+                    )
+                )
+            yield
+
+    def fit(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: Union[pd.Series, np.ndarray],
+    ) -> Any:
+        """Fits every member of the ensemble to the data in parallel.
+
+        :param x_train: The training data for the model to be fitted on.
+        :type x_train: pd.DataFrame or np.ndarray
+        :param y_train: The training targets for the model to be fitted on.
+        :type y_train: pd.Series or np.ndarray
+        """
+        budget = get_thread_budget()
+        if budget is None:
+            return super().fit(x_train, y_train)
+        _, inner = split_thread_budget(len(self.members), budget)
+        with parallel_backend("loky", inner_max_num_threads=inner):
+            return super().fit(x_train, y_train)
+
+    @abstractmethod
+    def _member_width(self) -> int:
+        """Number of columns each member contributes to the gathered predictions."""
+
+    @abstractmethod
+    def _member_output(
+        self, estimator: Any, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        """The output of a single fitted member that is combined by the ensemble."""
+
+    @abstractmethod
+    def _combine(self, member_outputs: np.ndarray) -> np.ndarray:
+        """Combines the gathered member outputs into the final predictions."""
+
+    def _gather_member_outputs(
+        self, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        """Runs every fitted member on the data and writes their outputs into one preallocated matrix."""
+        estimators = self.model.estimators_
+        width = self._member_width()
+        num_rows = len(x_test)
+        member_outputs = np.empty((num_rows, width * len(estimators)), dtype=np.float64)
+
+        def _fill(index, estimator):
+            output = self._member_output(estimator, x_test)
+            member_outputs[:, index * width : (index + 1) * width] = np.reshape(
+                output, (num_rows, width)
+            )
+
+        n_jobs = self.parameters.get("n_jobs")
+        budget = get_thread_budget()
+        if budget is not None:
+            n_jobs, _ = split_thread_budget(len(estimators), budget)
+
+        Parallel(n_jobs=n_jobs, require="sharedmem")(
+            delayed(_fill)(index, estimator)
+            for index, estimator in enumerate(estimators)
+        )
+        return member_outputs
+
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        with self._thread_budget():
+            if getattr(self.model, "passthrough", False):
+                return self.model.predict(x_test)
+            member_outputs = self._gather_member_outputs(x_test)
+            return self._combine(member_outputs)
@@ -0,0 +1,163 @@
+"""Base class for forests of independently fitted trees that can be pruned after fitting."""
+import copy
+import time
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from facilyst.models.model_base import ModelBase
+from facilyst.utils.conversion_utils import to_array, to_model_input
+
+
+class ForestModelBase(ModelBase):
+    """Base initialization for forests of independently fitted trees, such as Random Forest and Extra Trees.
+
+    The predictions of a forest are the average of its trees, so after fitting any subset of the trees is a valid,
+    smaller, and faster forest. `prune` selects such a subset on validation data.
+
+    :param model: The model to be used.
+    :type model: object
+    :param parameters: The parameters of the model.
+    :type parameters: dict
+    """
+
+    def __init__(
+        self, model: Optional[Any] = None, parameters: Optional[dict] = None
+    ) -> None:
+        super().__init__(model=model, parameters=parameters)
+        self.pruning_summary = None
+
+    def _tree_outputs(self, x_val: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """The validation outputs of every tree stacked along the first axis, along with the time each tree took."""
+        x_val = to_array(x_val, dtype=np.float32)
+        outputs, latencies = [], []
+        for tree in self.model.estimators_:
+            start = time.perf_counter()
+            if self.primary_type == "classification":
+                output = tree.predict_proba(x_val, check_input=False)
+            else:
+                output = tree.predict(x_val, check_input=False)
+            latencies.append(time.perf_counter() - start)
+            outputs.append(output)
+        return np.stack(outputs).astype(np.float64), np.asarray(latencies)
+
+    def _ensemble_scores(
+        self, averaged_outputs: np.ndarray, y_val: np.ndarray
+    ) -> np.ndarray:
+        """Scores a stack of candidate forest outputs at once, where higher is better.
+
+        Regression candidates are scored by their negative mean squared error. Classification candidates are scored by
+        their accuracy, with ties broken by the mean probability given to the actual class.
+        """
+        if self.primary_type != "classification":
+            return -np.mean(np.square(averaged_outputs - y_val), axis=-1)
+        rows = np.arange(len(y_val))
+        accuracy = np.mean(np.argmax(averaged_outputs, axis=-1) == y_val, axis=-1)
+        actual_probability = np.mean(averaged_outputs[..., rows, y_val], axis=-1)
+        return accuracy + actual_probability / (len(y_val) + 1)
+
+    def _timed_score(
+        self, x_val: Union[pd.DataFrame, np.ndarray], y_val: np.ndarray
+    ) -> Tuple[float, float]:
+        start = time.perf_counter()
+        predictions = self.model.predict(x_val)
+        latency = time.perf_counter() - start
+        if self.primary_type == "classification":
+            return float(np.mean(predictions == y_val)), latency
+        residual = np.sum(np.square(y_val - predictions))
+        total = np.sum(np.square(y_val - np.mean(y_val)))
+        return float(1 - residual / total) if total else 0.0, latency
+
+    def prune(
+        self,
+        x_val: Union[pd.DataFrame, np.ndarray],
+        y_val: Union[pd.Series, np.ndarray],
+        max_estimators: Optional[int] = None,
+        max_latency: Optional[float] = None,
+    ) -> "ForestModelBase":
+        """Greedily selects the subset of the fitted trees that scores best on the validation data within the targets.
+
+        The validation outputs of every tree are computed once. Trees are then added one at a time, each time picking
+        the tree that improves the validation score the most, with every candidate scored in a single vectorized step.
+        Of all the subsets visited, the best scoring one is kept, preferring fewer trees on ties. The original model is
+        left untouched, and the pruned model records the size, score, and latency before and after pruning in
+        `pruning_summary`, where the score is R2 for regression and accuracy for classification.
+
+        :param x_val: The validation data used to select the trees.
+        :type x_val: pd.DataFrame or np.ndarray
+        :param y_val: The validation targets used to select the trees.
+        :type y_val: pd.Series or np.ndarray
+        :param max_estimators: The maximum number of trees to keep.
+        :type max_estimators: int, optional
+        :param max_latency: The maximum time in seconds that the kept trees may take to predict on `x_val`, summed over
+        the trees as measured when predicting with each of them.
+        :type max_latency: float, optional
+        :return: The pruned model.
+        :rtype class:
+        :raises ValueError: If neither `max_estimators` nor `max_latency` is passed.
+        """
+        if max_estimators is None and max_latency is None:
+            raise ValueError("Please pass `max_estimators`, `max_latency`, or both.")
+        x_val, y_val = to_model_input(x_val), to_array(y_val)
+        if self.primary_type == "classification":
+            codes = pd.Categorical(y_val, categories=self.model.classes_).codes
+            if np.any(codes < 0):
+                raise ValueError(
+                    "y_val contains labels that the model was not fitted on."
+                )
+        else:
+            codes = y_val.astype(np.float64)
+
+        tree_outputs, tree_latencies = self._tree_outputs(x_val)
+        num_trees = len(tree_outputs)
+        limit = num_trees if max_estimators is None else min(max_estimators, num_trees)
+
+        remaining = np.ones(num_trees, dtype=bool)
+        total_outputs = np.zeros_like(tree_outputs[0])
+        total_latency = 0.0
+        selected, scores = [], []
+        for size in range(1, limit + 1):
+            affordable = remaining.copy()
+            if max_latency is not None:
+                affordable &= total_latency + tree_latencies <= max_latency
+            if not affordable.any():
+                break
+            candidate_scores = self._ensemble_scores(
+                (total_outputs + tree_outputs) / size, codes
+            )
+            candidate_scores[~affordable] = -np.inf
+            best_tree = int(np.argmax(candidate_scores))
+            selected.append(best_tree)
+            scores.append(candidate_scores[best_tree])
+            remaining[best_tree] = False
+            total_outputs += tree_outputs[best_tree]
+            total_latency += tree_latencies[best_tree]
+        if not selected:
+            raise ValueError(
+                "No tree can predict on `x_val` within `max_latency` seconds."
+            )
+        selected = selected[: int(np.argmax(scores)) + 1]
+
+        pruned = copy.copy(self)
+        pruned.model = copy.copy(self.model)
+        pruned.model.estimators_ = [self.model.estimators_[tree] for tree in selected]
+        pruned.model.n_estimators = len(selected)
+        pruned.parameters = {**self.parameters, "n_estimators": len(selected)}
+        pruned.cache = None
+        if self.cache is not None:
+            pruned.enable_cache(self.cache.max_bytes)
+        pruned._new_fit_generation()
+
+        original_score, original_latency = self._timed_score(x_val, y_val)
+        score, latency = pruned._timed_score(x_val, y_val)
+        pruned.pruning_summary = {
+            "original_n_estimators": num_trees,
+            "n_estimators": len(selected),
+            "original_score": original_score,
+            "score": score,
+            "score_loss": original_score - score,
+            "original_latency": original_latency,
+            "latency": latency,
+        }
+        return pruned
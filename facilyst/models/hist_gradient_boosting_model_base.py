@@ -0,0 +1,100 @@
+"""Base class for histogram-based gradient boosting models with native categorical support."""
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from facilyst.models.model_base import ModelBase
+from facilyst.utils.conversion_utils import to_array
+
+
+class HistGradientBoostingModelBase(ModelBase):
+    """Base initialization for histogram-based gradient boosting models.
+
+    The features are bucketed into at most `max_bins` bins before training, which makes these models much faster than
+    exact-split trees on large datasets. Columns of a DataFrame with a categorical, string, or object dtype are encoded
+    into integer codes and passed to the model as categorical features, so they are split on natively instead of being
+    one hot encoded. Categories that weren't seen during fitting are treated as missing values.
+
+    :param model: The model to be used.
+    :type model: object
+    :param parameters: The parameters of the model.
+    :type parameters: dict
+    """
+
+    def __init__(
+        self, model: Optional[Any] = None, parameters: Optional[dict] = None
+    ) -> None:
+        super().__init__(model=model, parameters=parameters)
+        self.categories = {}
+
+    @staticmethod
+    def _is_categorical(column: pd.Series) -> bool:
+        return not (
+            pd.api.types.is_numeric_dtype(column.dtype)
+            or pd.api.types.is_datetime64_any_dtype(column.dtype)
+        )
+
+    def _encode_categoricals(
+        self, x: Union[pd.DataFrame, np.ndarray]
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """Replaces every categorical column seen during fitting by its integer codes, with NaN for unknown values."""
+        if not self.categories or not isinstance(x, pd.DataFrame):
+            return x
+        encoded = x.copy()
+        for column, categories in self.categories.items():
+            codes = pd.Categorical(x[column], categories=categories).codes
+            encoded[column] = np.where(codes < 0, np.nan, codes)
+        return to_array(encoded)
+
+    def fit(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: Union[pd.Series, np.ndarray],
+    ) -> Any:
+        """Fits model to the data, treating any categorical columns as native categorical features.
+
+        :param x_train: The training data for the model to be fitted on.
+        :type x_train: pd.DataFrame or np.ndarray
+        :param y_train: The training targets for the model to be fitted on.
+        :type y_train: pd.Series or np.ndarray
+        """
+        self.categories = {}
+        if isinstance(x_train, pd.DataFrame):
+            for column in x_train.columns:
+                if self._is_categorical(x_train[column]):
+                    self.categories[column] = pd.Categorical(
+                        x_train[column].dropna()
+                    ).categories
+        if self.parameters.get("categorical_features") is None:
+            categorical_features = None
+            if self.categories:
+                categorical_features = [
+                    column in self.categories for column in x_train.columns
+                ]
+            self.model.set_params(categorical_features=categorical_features)
+        return super().fit(self._encode_categoricals(x_train), y_train)
+
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        return super()._predict(self._encode_categoricals(x_test))
+
+    def _predict_proba(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        return super()._predict_proba(self._encode_categoricals(x_test))
+
+    def score(
+        self,
+        x_test: Union[pd.DataFrame, np.ndarray],
+        y_actual: Union[pd.Series, np.ndarray],
+    ) -> float:
+        """Scores the predictions of the model using R2 for regression and accuracy for classification.
+
+        :param x_test: The testing data for the model to predict on.
+        :type x_test: pd.DataFrame or np.ndarray
+        :param y_actual: The actual target values to score against.
+        :type y_actual: pd.Series or np.ndarray
+        :return: Calculated score.
+        :rtype float:
+        """
+        if self.cache is not None:
+            return super().score(x_test, y_actual)
+        return super().score(self._encode_categoricals(x_test), y_actual)
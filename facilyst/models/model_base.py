@@ -1,9 +1,63 @@
 """Base class for all models."""
+import copy
+import functools
+import hashlib
+import inspect
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Optional, TypeVar, Union
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
+import joblib
 import numpy as np
 import pandas as pd
+from sklearn.metrics import accuracy_score, r2_score
+
+from facilyst.utils.async_utils import run_in_executor
+from facilyst.utils.cache_utils import LRUCache, ModelCache
+from facilyst.utils.conversion_utils import to_array, to_model_input
+from facilyst.utils.execution_utils import _resolve_n_jobs, get_thread_budget
+from facilyst.utils.fingerprint_utils import fingerprint
+from facilyst.utils.metrics_utils import evaluate_predictions, needs_probabilities
+
+
+def _fit_cache_token(value: Any) -> Any:
+    """A JSON serializable token of a `fit` argument, fingerprinting any data in it."""
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return fingerprint(value)
+    if isinstance(value, (list, tuple)):
+        return [_fit_cache_token(each_value) for each_value in value]
+    if isinstance(value, dict):
+        return {str(key): _fit_cache_token(each) for key, each in value.items()}
+    return repr(value)
+
+
+def _cache_fit(fit: Callable) -> Callable:
+    """Wraps a `fit` method so that, when the model has a fit cache, a cached fitted model is loaded instead."""
+    signature = inspect.signature(fit)
+
+    @functools.wraps(fit)
+    def cached_fit(self, *args, **kwargs):
+        if getattr(self, "fit_cache", None) is None or self.__dict__.get("_fitting"):
+            return fit(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        del arguments.arguments[next(iter(signature.parameters))]
+        key, metadata = self._fit_cache_key(arguments.arguments)
+        fitted = self.fit_cache.get(key)
+        if fitted is not None:
+            self._restore_fitted_state(fitted)
+            return self
+        self._fitting = True
+        try:
+            output = fit(self, *args, **kwargs)
+        finally:
+            del self._fitting
+        self.fit_cache.put(key, self._fitted_state(), metadata)
+        return output
+
+    return cached_fit
 
 
 class ModelBase(ABC):
@@ -12,11 +66,22 @@ class ModelBase(ABC):
     model (object): The model to be used.
     """
 
+    thread_parameters: tuple = ("n_jobs", "thread_count")
+    fit_cache_excluded: tuple = ("cache", "fit_cache", "fit_generation")
+
     def __init__(
         self, model: Optional[Any] = None, parameters: Optional[dict] = None
     ) -> None:
         self.model = model
         self.parameters = parameters
+        self.fit_generation = 0
+        self.cache = None
+        self.fit_cache = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "fit" in cls.__dict__:
+            cls.fit = _cache_fit(cls.__dict__["fit"])
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, ModelBase):
@@ -59,6 +124,183 @@ class ModelBase(ABC):
     def hyperparameters(self):
         """Hyperparameter space for the model."""
 
+    @classmethod
+    def hyperparameters_for(
+        cls,
+        x: Optional[Union[pd.DataFrame, np.ndarray]],
+        y: Optional[Union[pd.Series, np.ndarray]],
+    ) -> dict:
+        """The hyperparameter space searched for the data, the model's full space unless it can be narrowed to it.
+
+        :param x: All feature data.
+        :type x: pd.DataFrame or np.ndarray
+        :param y: All target data.
+        :type y: pd.Series or np.ndarray
+        :return: The hyperparameter space.
+        :rtype dict:
+        """
+        return cls.hyperparameters
+
+    def _thread_budget_parameters(self, budget: int) -> dict:
+        """The parameters of the underlying model that control its number of cores, capped to the budget."""
+        return self._capped_thread_parameters(self.model, budget)
+
+    @classmethod
+    def _capped_thread_parameters(cls, estimator: Any, budget: int) -> dict:
+        """The parameters of an estimator that control its number of cores, capped to the budget."""
+        try:
+            model_params = estimator.get_params(deep=False)
+        except AttributeError:
+            return {}
+        budget_params = {}
+        for param in cls.thread_parameters:
+            if param in model_params:
+                requested = _resolve_n_jobs(model_params[param]) or budget
+                budget_params[param] = min(requested, budget)
+        return budget_params
+
+    @staticmethod
+    @contextmanager
+    def _set_parameters(estimator: Any, parameters: dict) -> Iterator[None]:
+        """Sets parameters on an estimator for the duration of a call, restoring the original values afterwards."""
+        if not parameters:
+            yield
+            return
+        model_params = estimator.get_params(deep=True)
+        original_params = {param: model_params[param] for param in parameters}
+        estimator.set_params(**parameters)
+        try:
+            yield
+        finally:
+            estimator.set_params(**original_params)
+
+    @contextmanager
+    def _thread_budget(self) -> Iterator[None]:
+        """Applies the facilyst-wide core budget to the model for the duration of a call.
+
+        The native BLAS and OpenMP thread pools are process-wide, so they are capped by `execution_context` and
+        `set_execution_config` rather than on every call.
+        """
+        budget = get_thread_budget()
+        if budget is None or self.model is None:
+            yield
+            return
+        with self._set_parameters(self.model, self._thread_budget_parameters(budget)):
+            yield
+
+    def enable_cache(self, max_bytes: Optional[int] = 64 * 1024**2) -> "ModelBase":
+        """Caches the outputs of `predict`, `predict_proba`, and `score` on the fitted model.
+
+        Repeated calls on data with identical contents are served from memory. Entries are keyed by a fingerprint of
+        the data and the number of times the model has been fitted, so refitting the model never serves stale values.
+
+        :param max_bytes: The maximum size of the cache in bytes, after which the least recently used entries are
+        evicted. Defaults to 64 MB.
+        :type max_bytes: int, optional
+        :return: Returns self.
+        :rtype class:
+        """
+        self.cache = LRUCache(max_bytes=max_bytes)
+        return self
+
+    def disable_cache(self) -> "ModelBase":
+        """Removes the cache and every value stored in it.
+
+        :return: Returns self.
+        :rtype class:
+        """
+        self.cache = None
+        return self
+
+    def enable_fit_cache(
+        self,
+        cache: Optional[ModelCache] = None,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = 10 * 1024**3,
+    ) -> "ModelBase":
+        """Caches the fitted model on disk, so fitting the same model on the same data again loads it instead.
+
+        Entries are keyed by the model class, its parameters, a fingerprint of every argument passed to `fit`, and the
+        versions of facilyst and the libraries it builds on, so a change to any of them trains the model again.
+
+        :param cache: An existing cache to store the fitted models in. Defaults to a new cache.
+        :type cache: ModelCache, optional
+        :param directory: The directory of a new cache. Defaults to the directory set in the `FACILYST_CACHE_DIR`
+        environment variable, or `~/.cache/facilyst/models`.
+        :type directory: str, optional
+        :param max_bytes: The maximum size of a new cache in bytes, after which the least recently used fitted models
+        are deleted. Defaults to 10 GB.
+        :type max_bytes: int, optional
+        :return: Returns self.
+        :rtype class:
+        """
+        self.fit_cache = (
+            cache if cache is not None else ModelCache(directory, max_bytes=max_bytes)
+        )
+        return self
+
+    def disable_fit_cache(self) -> "ModelBase":
+        """Stops loading and storing fitted models, without deleting the models already on disk.
+
+        :return: Returns self.
+        :rtype class:
+        """
+        self.fit_cache = None
+        return self
+
+    def _library_versions(self) -> dict:
+        """The versions of facilyst and of the libraries the fitted model depends on."""
+        libraries = {"facilyst", "numpy", "pandas", "sklearn"}
+        libraries.add(type(self.model).__module__.split(".")[0])
+        return {
+            library: getattr(sys.modules.get(library), "__version__", None)
+            for library in sorted(libraries)
+        }
+
+    def _fit_cache_key(self, arguments: dict) -> tuple:
+        """The fit cache key of the arguments passed to `fit`, along with a description of the entry."""
+        fit_token = {
+            "class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "parameters": _fit_cache_token(self.parameters),
+            "arguments": _fit_cache_token(arguments),
+            "versions": self._library_versions(),
+        }
+        key = hashlib.blake2b(repr(fit_token).encode(), digest_size=16).hexdigest()
+        return key, {"name": self.name, "versions": fit_token["versions"]}
+
+    def _fitted_state(self) -> "ModelBase":
+        """A shallow copy of the model without its caches, to be stored in the fit cache."""
+        fitted = copy.copy(self)
+        for attribute in self.fit_cache_excluded:
+            if attribute in fitted.__dict__:
+                setattr(fitted, attribute, None)
+        return fitted
+
+    def _restore_fitted_state(self, fitted: "ModelBase") -> None:
+        """Takes over everything a cached model learned, keeping this model's caches."""
+        self.__dict__.update(
+            {
+                attribute: value
+                for attribute, value in fitted.__dict__.items()
+                if attribute not in self.fit_cache_excluded
+            }
+        )
+        self._new_fit_generation()
+
+    def _cached(self, method: str, data: tuple, compute: Callable[[], Any]) -> Any:
+        """Returns the cached output of the method for the data, computing and storing it on a miss."""
+        if self.cache is None:
+            return compute()
+        key = (method, self.fit_generation) + tuple(
+            fingerprint(each_data) for each_data in data
+        )
+        output = self.cache.get(key)
+        if output is None:
+            output = compute()
+            self.cache.put(key, output)
+        return output.copy() if hasattr(output, "copy") else output
+
+    @_cache_fit
     def fit(
         self,
         x_train: Union[pd.DataFrame, np.ndarray],
@@ -71,24 +313,71 @@ class ModelBase(ABC):
         :param y_train: The training targets for the model to be fitted on.
         :type y_train: pd.Series or np.ndarray
         """
-        self.model.fit(x_train, y_train)
+        x_train, y_train = to_model_input(x_train), to_array(y_train)
+        with self._thread_budget():
+            self.model.fit(x_train, y_train)
+        self._new_fit_generation()
         return self
 
-    def predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
+    def _new_fit_generation(self) -> None:
+        """Marks the model as refitted, so cached outputs of the previous fit are no longer served."""
+        self.fit_generation += 1
+        if self.cache is not None:
+            self.cache.clear()
+
+    def predict(
+        self, x_test: Union[pd.DataFrame, np.ndarray], as_array: Optional[bool] = False
+    ) -> Union[pd.Series, np.ndarray]:
         """Predicts on the data using the model.
 
         x_test (pd.DataFrame or np.ndarray): The testing data for the model to predict on.
-        return (pd.Series): The predictions.
+        as_array (bool): Whether to return the raw array of predictions instead of wrapping them in a pd.Series.
+        return (pd.Series or np.ndarray): The predictions.
         """
-        predictions = pd.Series(self.model.predict(x_test))
+        x_test = to_model_input(x_test)
+        predictions = self._cached("predict", (x_test,), lambda: self._predict(x_test))
+        return predictions if as_array else pd.Series(predictions)
+
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        with self._thread_budget():
+            predictions = self.model.predict(x_test)
         return predictions
 
+    def predict_proba(
+        self, x_test: Union[pd.DataFrame, np.ndarray], as_array: Optional[bool] = False
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """Predicts the probability of each class on the data using the model.
+
+        :param x_test: The testing data for the model to predict on.
+        :type x_test: pd.DataFrame or np.ndarray
+        :param as_array: Whether to return the raw array of probabilities instead of wrapping them in a pd.DataFrame.
+        :type as_array: bool, optional
+        :return: The predicted probabilities, with one column per class.
+        :rtype pd.DataFrame or np.ndarray:
+        """
+        x_test = to_model_input(x_test)
+        probabilities = self._cached(
+            "predict_proba", (x_test,), lambda: self._predict_proba(x_test)
+        )
+        if as_array:
+            return probabilities
+        return pd.DataFrame(
+            probabilities, columns=getattr(self.model, "classes_", None)
+        )
+
+    def _predict_proba(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        with self._thread_budget():
+            probabilities = self.model.predict_proba(x_test)
+        return probabilities
+
     def score(
         self,
         x_test: Union[pd.DataFrame, np.ndarray],
         y_actual: Union[pd.Series, np.ndarray],
     ) -> float:
-        """Scores the predictions of the model using R2.
+        """Scores the predictions of the model using R2 for regression and accuracy for classification.
+
+        If the cache is enabled, the score is computed from the cached predictions instead of predicting again.
 
         :param x_test: The testing data for the model to predict on.
         :type x_test: pd.DataFrame or np.ndarray
@@ -97,8 +386,91 @@ class ModelBase(ABC):
         :return: Calculated score.
         :rtype float:
         """
-        score = self.model.score(x_test, y_actual)
-        return score
+        x_test, y_actual = to_model_input(x_test), to_array(y_actual)
+        if self.cache is None:
+            with self._thread_budget():
+                score = self.model.score(x_test, y_actual)
+            return score
+
+        def _score() -> float:
+            predictions = self.predict(x_test, as_array=True)
+            if self.primary_type == "classification":
+                return float(accuracy_score(y_actual, predictions))
+            return float(r2_score(y_actual, predictions))
+
+        return self._cached("score", (x_test, y_actual), _score)
+
+    @staticmethod
+    def _predict_in_chunks(
+        predict_method: Callable,
+        x_test: Union[pd.DataFrame, np.ndarray],
+        chunk_size: Optional[int] = None,
+    ) -> np.ndarray:
+        """Runs the predict method over chunks of rows, writing every chunk into one preallocated array."""
+        if chunk_size is None or len(x_test) <= chunk_size:
+            return predict_method(x_test, as_array=True)
+        outputs = None
+        for start in range(0, len(x_test), chunk_size):
+            if isinstance(x_test, pd.DataFrame):
+                chunk = x_test.iloc[start : start + chunk_size]
+            else:
+                chunk = x_test[start : start + chunk_size]
+            chunk_outputs = predict_method(chunk, as_array=True)
+            if outputs is None:
+                outputs = np.empty(
+                    (len(x_test),) + chunk_outputs.shape[1:], dtype=chunk_outputs.dtype
+                )
+            outputs[start : start + len(chunk_outputs)] = chunk_outputs
+        return outputs
+
+    def evaluate(
+        self,
+        x_test: Union[pd.DataFrame, np.ndarray],
+        y_actual: Union[pd.Series, np.ndarray],
+        metrics: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Computes several metrics from a single prediction pass over the data.
+
+        If any metric needs predicted probabilities, such as `log_loss` or `auc`, only `predict_proba` is called and
+        the predicted labels are taken as the most probable class.
+
+        :param x_test: The testing data for the model to predict on.
+        :type x_test: pd.DataFrame or np.ndarray
+        :param y_actual: The actual target values to score against.
+        :type y_actual: pd.Series or np.ndarray
+        :param metrics: The names of the metrics to compute, see `metrics_dict` for all options. Defaults to `r2`,
+        `rmse`, and `mae` for regression, and `accuracy` and `f1` for classification.
+        :type metrics: list, optional
+        :param chunk_size: The number of rows to predict on at a time, to bound memory. Defaults to all rows at once.
+        :type chunk_size: int, optional
+        :return: The value of each metric.
+        :rtype dict:
+        """
+        if metrics is None:
+            metrics = (
+                ["accuracy", "f1"]
+                if self.primary_type == "classification"
+                else ["r2", "rmse", "mae"]
+            )
+        classes = getattr(self.model, "classes_", None)
+        probabilities = None
+        if needs_probabilities(metrics):
+            probabilities = self._predict_in_chunks(
+                self.predict_proba, x_test, chunk_size
+            )
+            if classes is None:
+                classes = np.arange(probabilities.shape[1])
+            predictions = np.asarray(classes)[np.argmax(probabilities, axis=1)]
+        else:
+            predictions = self._predict_in_chunks(self.predict, x_test, chunk_size)
+        return evaluate_predictions(
+            y_actual=y_actual,
+            metrics=metrics,
+            predictions=predictions,
+            probabilities=probabilities,
+            classes=classes,
+        )
 
     def get_params(self) -> dict:
         """Gets the parameters for the model.
@@ -108,3 +480,59 @@ class ModelBase(ABC):
         """
         model_params = self.model.get_params(deep=True)
         return model_params
+
+    async def afit(self, *args, executor: Optional[Executor] = None, **kwargs) -> Any:
+        """Awaitable version of `fit` that trains the model on an executor without blocking the event loop.
+
+        Takes the same arguments as `fit`. If the awaiting task is cancelled before training starts, the model is never
+        fitted. Training that has already started can't be interrupted and finishes in the background.
+
+        :param executor: The executor to train on. Defaults to the executor set with `set_async_executor`, or the
+        default executor of the running event loop.
+        :type executor: concurrent.futures.Executor, optional
+        :return: Returns self.
+        :rtype class:
+        """
+        return await run_in_executor(self.fit, *args, executor=executor, **kwargs)
+
+    async def apredict(
+        self, *args, executor: Optional[Executor] = None, **kwargs
+    ) -> Union[pd.Series, np.ndarray]:
+        """Awaitable version of `predict` that predicts on an executor without blocking the event loop.
+
+        Takes the same arguments as `predict`.
+
+        :param executor: The executor to predict on. Defaults to the executor set with `set_async_executor`, or the
+        default executor of the running event loop.
+        :type executor: concurrent.futures.Executor, optional
+        :return: The predictions.
+        :rtype pd.Series or np.ndarray:
+        """
+        return await run_in_executor(self.predict, *args, executor=executor, **kwargs)
+
+    async def apredict_proba(
+        self, *args, executor: Optional[Executor] = None, **kwargs
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """Awaitable version of `predict_proba` that predicts on an executor without blocking the event loop.
+
+        Takes the same arguments as `predict_proba`.
+
+        :param executor: The executor to predict on. Defaults to the executor set with `set_async_executor`, or the
+        default executor of the running event loop.
+        :type executor: concurrent.futures.Executor, optional
+        :return: The predicted probabilities.
+        :rtype pd.DataFrame or np.ndarray:
+        """
+        return await run_in_executor(
+            self.predict_proba, *args, executor=executor, **kwargs
+        )
+
+    def save(self, path: str) -> None:
+        """Saves the model, along with everything it has learned, to a file that can be read with `load_model`.
+
+        Cached predictions and native data containers are not saved.
+
+        :param path: The path of the file to save the model to.
+        :type path: str
+        """
+        joblib.dump(self, path)
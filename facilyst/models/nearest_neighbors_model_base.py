@@ -0,0 +1,131 @@
+"""Base class for nearest neighbor models that pick their index from the shape of the data."""
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, r2_score
+from sklearn.neighbors import BallTree, KDTree
+
+from facilyst.models.model_base import ModelBase
+from facilyst.utils import import_errors_dict, import_or_raise
+from facilyst.utils.conversion_utils import to_array, to_model_input
+
+
+class NearestNeighborsModelBase(ModelBase):
+    """Base initialization for nearest neighbor models.
+
+    With `algorithm` set to `auto`, the index is chosen from the shape of the training data when the model is fitted:
+
+    - `brute` for small datasets, where building a tree costs more than it saves, and for high dimensional data, where
+      trees degrade to a linear scan.
+    - `kd_tree` for low dimensional data.
+    - `ball_tree` for moderately dimensional data, or metrics that a KD tree doesn't support.
+
+    If `approximate` is set, high dimensional data is indexed with an approximate nearest neighbor graph from
+    `pynndescent` instead of being scanned exhaustively. The index that was built is stored on the fitted model, so it
+    is kept when the model is pickled. Queries are split into batches that are run in parallel across `n_jobs` cores.
+
+    :param model: The model to be used.
+    :type model: object
+    :param parameters: The parameters of the model.
+    :type parameters: dict
+    """
+
+    brute_force_max_samples: int = 1000
+    kd_tree_max_features: int = 15
+    ball_tree_max_features: int = 50
+
+    def __init__(
+        self, model: Optional[Any] = None, parameters: Optional[dict] = None
+    ) -> None:
+        super().__init__(model=model, parameters=parameters)
+        self.index_type = None
+        self.approximate_index = None
+
+    def _choose_index(self, num_samples: int, num_features: int) -> str:
+        """The index that answers queries fastest on data of this shape."""
+        metric = self.parameters.get("metric", "euclidean")
+        if num_samples <= self.brute_force_max_samples:
+            return "brute"
+        if num_features <= self.kd_tree_max_features and metric in KDTree.valid_metrics:
+            return "kd_tree"
+        if num_features <= self.ball_tree_max_features:
+            if metric in BallTree.valid_metrics:
+                return "ball_tree"
+            return "brute"
+        return "approximate" if self.parameters.get("approximate") else "brute"
+
+    def fit(
+        self,
+        x_train: Union[pd.DataFrame, np.ndarray],
+        y_train: Union[pd.Series, np.ndarray],
+    ) -> Any:
+        """Builds the nearest neighbor index on the data.
+
+        :param x_train: The training data for the model to be fitted on.
+        :type x_train: pd.DataFrame or np.ndarray
+        :param y_train: The training targets for the model to be fitted on.
+        :type y_train: pd.Series or np.ndarray
+        """
+        x_train, y_train = to_model_input(x_train), to_array(y_train)
+        algorithm = self.parameters.get("algorithm", "auto")
+        if algorithm == "auto":
+            algorithm = self._choose_index(*np.shape(x_train))
+
+        self.approximate_index = None
+        with self._thread_budget():
+            if algorithm == "approximate":
+                pynndescent = import_or_raise(
+                    "pynndescent", import_errors_dict["pynndescent"]
+                )
+                self.approximate_index = pynndescent.PyNNDescentTransformer(
+                    n_neighbors=self.model.get_params()["n_neighbors"] + 1,
+                    metric=self.parameters.get("metric", "euclidean"),
+                    n_jobs=self.parameters.get("n_jobs"),
+                    random_state=self.parameters.get("random_state"),
+                )
+                self.model.set_params(algorithm="brute", metric="precomputed")
+                x_train = self.approximate_index.fit_transform(x_train)
+            else:
+                self.model.set_params(
+                    algorithm=algorithm,
+                    metric=self.parameters.get("metric", "euclidean"),
+                )
+            self.model.fit(x_train, y_train)
+        self.index_type = algorithm
+        self._new_fit_generation()
+        return self
+
+    def _query_input(self, x_test: Union[pd.DataFrame, np.ndarray]) -> Any:
+        """The data to query the fitted model with, mapped onto the approximate neighbor graph if there is one."""
+        if self.approximate_index is None:
+            return x_test
+        return self.approximate_index.transform(x_test)
+
+    def _predict(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        return super()._predict(self._query_input(x_test))
+
+    def _predict_proba(self, x_test: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        return super()._predict_proba(self._query_input(x_test))
+
+    def score(
+        self,
+        x_test: Union[pd.DataFrame, np.ndarray],
+        y_actual: Union[pd.Series, np.ndarray],
+    ) -> float:
+        """Scores the predictions of the model using R2 for regression and accuracy for classification.
+
+        :param x_test: The testing data for the model to predict on.
+        :type x_test: pd.DataFrame or np.ndarray
+        :param y_actual: The actual target values to score against.
+        :type y_actual: pd.Series or np.ndarray
+        :return: Calculated score.
+        :rtype float:
+        """
+        if self.approximate_index is None:
+            return super().score(x_test, y_actual)
+        y_actual = to_array(y_actual)
+        predictions = self.predict(x_test, as_array=True)
+        if self.primary_type == "classification":
+            return float(accuracy_score(y_actual, predictions))
+        return float(r2_score(y_actual, predictions))
@@ -1,13 +1,19 @@
 """An optimizer used for hyperparameter tuning via Bayesian optimization."""
-from typing import Optional, Tuple, Union
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from hyperopt import STATUS_OK, Trials, fmin, space_eval, tpe
 from sklearn.model_selection import train_test_split
 
-from facilyst.models import ModelBase
+from facilyst.models import BoostingModelBase, EnsembleModelBase, ModelBase
 from facilyst.models.utils import get_models
+from facilyst.utils.async_utils import run_in_executor
+from facilyst.utils.cache_utils import LRUCache
+from facilyst.utils.metrics_utils import _get_metric, metric_to_loss
 
 
 class HyperoptOptimizer:
@@ -30,6 +36,13 @@ class HyperoptOptimizer:
     the name of the model and values should be the number of iterations. If more models are selected than those specified
     in the dict, then they will be set to a default number of iterations of 50.
     :type split: int or dict, optional
+    :param metric: The metric each trial is scored on, see `metrics_dict` for all options. Defaults to the model's own
+    `score` method.
+    :type metric: str, optional
+    :param early_stopping_rounds: The number of rounds without improvement after which boosting models stop adding
+    trees during each trial, using a validation set carved off the training split. The model returned by `optimize` is
+    set to build as many trees as the best trial kept. Set to None to train every tree. Defaults to 10.
+    :type early_stopping_rounds: int, optional
     """
 
     name: str = "Hyperopt Optimizer"
@@ -40,12 +53,18 @@ class HyperoptOptimizer:
         regressor: Optional[str] = None,
         split: Optional[float] = 0.8,
         iterations_per_model: Optional[Union[int, dict]] = 50,
+        metric: Optional[str] = None,
+        early_stopping_rounds: Optional[int] = 10,
     ) -> None:
         self.classifier = classifier
         self.regressor = regressor
         self.split = split
         self.iterations_per_model = iterations_per_model
+        self.metric = metric
+        self.early_stopping_rounds = early_stopping_rounds
         self.results = {}
+        self.best_model = None
+        self.best_score = None
 
         if not (self.classifier or self.regressor):
             raise ValueError("Either classifier or regressor must be set.")
@@ -57,6 +76,8 @@ class HyperoptOptimizer:
                 "The parameter `iterations_per_model` must be either an int or a dict specifying the "
                 "number of iterations per model."
             )
+        if self.metric is not None:
+            _get_metric(self.metric)
 
         self.collected_models = self.collect_models()
 
@@ -65,13 +86,18 @@ class HyperoptOptimizer:
     def collect_models(self) -> set:
         """Collect all models requested for the optimizer.
 
+        Ensemble models are skipped when other models match the request, as each of their trials fits every member.
+
         :rtype set:
         """
-        return (
-            get_models(self.classifier)
-            if self.classifier
-            else get_models(self.regressor)
-        )
+        requested = self.classifier or self.regressor
+        collected_models = get_models(requested)
+        non_ensemble_models = {
+            each_model
+            for each_model in collected_models
+            if not issubclass(each_model, EnsembleModelBase)
+        }
+        return non_ensemble_models or collected_models
 
     def hyperparameter_space(self) -> list:
         """The collected hyperparameter space for all models selected to search through.
@@ -96,9 +122,80 @@ class HyperoptOptimizer:
         :return: The best model selected with the corresponding best hyperparameters, and the score achieved.
         :rtype tuple: object, float
         """
+        return self._optimize_models(x, y)
+
+    async def aoptimize(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray],
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[dict]:
+        """Awaitable version of `optimize` that runs on an executor and streams the result of every trial as it finishes.
+
+        Each trial result is a dict with the `model` name, the `trial` number for that model, the `hyperparameters`
+        tried, and the `loss` achieved. Once every trial has been streamed, the best model and its score are available
+        as `best_model` and `best_score`. Closing the iterator early or cancelling the task consuming it stops the
+        optimization after the trial that is running finishes.
+
+        :param x: All feature data.
+        :type x: pd.DataFrame or np.ndarray
+        :param y: All target data.
+        :type y: pd.Series or np.ndarray
+        :param executor: The executor to optimize on. Defaults to the executor set with `set_async_executor`, or the
+        default executor of the running event loop.
+        :type executor: concurrent.futures.Executor, optional
+        :return: The result of every trial, in the order they finish.
+        :rtype AsyncIterator[dict]:
+        """
+        loop = asyncio.get_running_loop()
+        trial_results = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def on_trial(trial_result: dict) -> None:
+            loop.call_soon_threadsafe(trial_results.put_nowait, trial_result)
+
+        optimization = asyncio.ensure_future(
+            run_in_executor(
+                self._optimize_models,
+                x,
+                y,
+                on_trial=on_trial,
+                stop=stop,
+                executor=executor,
+            )
+        )
+        optimization.add_done_callback(lambda _: trial_results.put_nowait(done))
+        try:
+            while True:
+                trial_result = await trial_results.get()
+                if trial_result is done:
+                    break
+                yield trial_result
+            await optimization
+        finally:
+            if not optimization.done():
+                stop.set()
+                optimization.cancel()
+
+    def _optimize_models(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray],
+        on_trial: Optional[Callable[[dict], None]] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Tuple[ModelBase, float]:
+        """Optimizes every collected model, reporting each trial to `on_trial` and stopping early once `stop` is set."""
         for model in self.collected_models:
+            if stop is not None and stop.is_set():
+                break
             self.results[model.name] = self._optimize(
-                x, y, model, model.hyperparameters
+                x,
+                y,
+                model,
+                model.hyperparameters_for(x, y),
+                on_trial=on_trial,
+                stop=stop,
             )
 
         best_score = np.Inf
@@ -110,8 +207,11 @@ class HyperoptOptimizer:
                 best_score = model_data["best_score"]
                 best_model_hyp = model_data["best_hyperparameters"]
 
+        if best_model_name is None:
+            return self.best_model, self.best_score
         best_model = next(iter(get_models(best_model_name)))
-        return best_model(**best_model_hyp), best_score
+        self.best_model, self.best_score = best_model(**best_model_hyp), best_score
+        return self.best_model, self.best_score
 
     def _optimize(
         self,
@@ -119,20 +219,61 @@ class HyperoptOptimizer:
         y: Union[pd.Series, np.ndarray],
         model: ModelBase,
         space: dict,
+        on_trial: Optional[Callable[[dict], None]] = None,
+        stop: Optional[threading.Event] = None,
     ) -> dict:
-        """Optimization per model over hyperparameter space."""
+        """Optimization per model over hyperparameter space.
+
+        The data is split once per model, so that every trial is scored on the same split and boosting models can share
+        the native data containers built from it.
+        """
+        x_train, x_test, y_train, y_test = train_test_split(x, y, train_size=self.split)
+        native_cache = LRUCache(max_bytes=1024**3)
+        trial_count = 0
 
         def cost_function(parameters: dict) -> dict:
             """Cost function definition."""
             parameters = {hyp: parameters[hyp] for hyp in parameters.keys()}
 
-            x_train, x_test, y_train, y_test = train_test_split(
-                x, y, train_size=self.split
-            )
             model_ = model(**parameters)  # pytype: disable=not-callable
-            model_.fit(x_train, y_train)
-            score = model_.score(x_test, y_test)
-            return {"loss": -score, "status": STATUS_OK}
+            if isinstance(model_, BoostingModelBase):
+                model_.enable_native_cache(cache=native_cache)
+                model_.fit(
+                    x_train,
+                    y_train,
+                    early_stopping_rounds=self.early_stopping_rounds,
+                )
+            else:
+                model_.fit(x_train, y_train)
+            if self.metric is None:
+                loss = -model_.score(x_test, y_test)
+            else:
+                value = model_.evaluate(x_test, y_test, metrics=[self.metric])
+                loss = metric_to_loss(self.metric, value[self.metric])
+            nonlocal trial_count
+            trial_count += 1
+            if on_trial is not None:
+                on_trial(
+                    {
+                        "model": model.name,
+                        "trial": trial_count,
+                        "hyperparameters": parameters,
+                        "loss": loss,
+                    }
+                )
+            return {
+                "loss": loss,
+                "status": STATUS_OK,
+                "best_iteration": getattr(model_, "best_iteration", None),
+            }
+
+        if not space:
+            # Every trial of a model without hyperparameters would be identical, so it is only scored once.
+            result = cost_function({})
+            return {
+                "best_hyperparameters": {},
+                "best_score": round(result["loss"], 3),
+            }
 
         trials = Trials()
 
@@ -146,11 +287,17 @@ class HyperoptOptimizer:
             algo=tpe.suggest,
             max_evals=model_iter or 50,
             trials=trials,
+            early_stop_fn=lambda _, *args: (stop is not None and stop.is_set(), args),
         )
 
         best_trial = trials.best_trial
+        best_hyperparameters = space_eval(space, best_hyp)
+        best_iteration = best_trial["result"].get("best_iteration")
+        if best_iteration is not None:
+            # The best trial stopped early, so the returned model only builds the trees that trial used.
+            best_hyperparameters["n_estimators"] = best_iteration + 1
         best_dict = {
-            "best_hyperparameters": space_eval(model.hyperparameters, best_hyp),
+            "best_hyperparameters": best_hyperparameters,
             "best_score": round(best_trial["result"]["loss"], 3),
         }
 
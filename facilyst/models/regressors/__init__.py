@@ -3,12 +3,17 @@ from .bagging import BaggingRegressor
 from .catboost import CatBoostRegressor
 from .decision_tree import DecisionTreeRegressor
 from .extra_trees import ExtraTreesRegressor
+from .hist_gradient_boosting import HistGradientBoostingRegressor
+from .k_nearest_neighbors import KNearestNeighborsRegressor
 from .random_forest import RandomForestRegressor
+from .stacking import StackingRegressor
+from .voting import VotingRegressor
 from .xgboost import XGBoostRegressor
 from .time_series import (
     ADIDARegressor,
     AutoARIMARegressor,
     AutoETSRegressor,
+    AutoForecasterRegressor,
     AutoThetaRegressor,
     CrostonOptimizedRegressor,
     IMAPARegressor,
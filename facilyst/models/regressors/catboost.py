@@ -3,11 +3,11 @@ from typing import Optional
 
 from hyperopt import hp
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.boosting_model_base import BoostingModelBase
 from facilyst.utils import import_errors_dict, import_or_raise
 
 
-class CatBoostRegressor(ModelBase):
+class CatBoostRegressor(BoostingModelBase):
     """The CatBoost Regressor (via catboost's library).
 
      This is a regressor that uses gradient boosting on decision trees alongside categorical encoding.
@@ -16,6 +16,7 @@ class CatBoostRegressor(ModelBase):
     max_depth (int): The maximum depth of the tree. Defaults to None.
     learning_rate (float): The learning rate.
     allow_writing_files (bool): Whether to allow the generation of files during training. Defaults to False.
+    thread_count (int): The number of cores to be used, -1 uses all available cores.
     """
 
     name: str = "Catboost Regressor"
@@ -24,6 +25,8 @@ class CatBoostRegressor(ModelBase):
     secondary_type: str = "None"
     tertiary_type: str = "tree"
 
+    native_data_type: str = "Pool"
+
     hyperparameters: dict = {
         "n_estimators": hp.choice("n_estimators", [10, 50, 100, 200, 300]),
         "max_depth": hp.randint("max_depth", 2, 10),
@@ -36,6 +39,7 @@ class CatBoostRegressor(ModelBase):
         max_depth: Optional[int] = None,
         learning_rate: Optional[float] = None,
         allow_writing_files: Optional[bool] = False,
+        thread_count: Optional[int] = -1,
         random_state: Optional[int] = 0,
         **kwargs,
     ) -> None:
@@ -44,6 +48,7 @@ class CatBoostRegressor(ModelBase):
             "max_depth": max_depth,
             "learning_rate": learning_rate,
             "allow_writing_files": allow_writing_files,
+            "thread_count": thread_count,
             "random_state": random_state,
         }
         parameters.update(kwargs)
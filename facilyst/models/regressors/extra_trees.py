@@ -4,10 +4,10 @@ from typing import Optional
 from hyperopt import hp
 from sklearn.ensemble import ExtraTreesRegressor as et_regressor
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.forest_model_base import ForestModelBase
 
 
-class ExtraTreesRegressor(ModelBase):
+class ExtraTreesRegressor(ForestModelBase):
     """The Extra Trees Regressor (via sklearn's implementation).
 
      This is an ensemble regressor that fits randomized decision trees on the entire dataset each time.
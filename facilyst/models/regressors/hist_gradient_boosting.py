@@ -0,0 +1,79 @@
+"""A histogram-based gradient boosting model for regression problems on large tabular data."""
+from typing import Optional
+
+from hyperopt import hp
+from sklearn.ensemble import HistGradientBoostingRegressor as hgb_regressor
+
+from facilyst.models.hist_gradient_boosting_model_base import (
+    HistGradientBoostingModelBase,
+)
+
+
+class HistGradientBoostingRegressor(HistGradientBoostingModelBase):
+    """The Histogram-based Gradient Boosting Regressor (via sklearn's implementation).
+
+     This is a regressor that uses gradient boosting on decision trees built over binned features, which is much faster
+     than exact-split trees on datasets with many rows. Categorical columns are supported natively.
+
+    :param max_iter: The maximum number of boosting iterations. Defaults to 100.
+    :type max_iter: int, optional
+    :param learning_rate: The multiplicative factor applied to the leaf values of each tree. Defaults to 0.1.
+    :type learning_rate: float, optional
+    :param max_leaf_nodes: The maximum number of leaves of each tree. Defaults to 31.
+    :type max_leaf_nodes: int, optional
+    :param max_depth: The maximum depth of each tree. Defaults to no maximum depth.
+    :type max_depth: int, optional
+    :param min_samples_leaf: The minimum number of samples per leaf. Defaults to 20.
+    :type min_samples_leaf: int, optional
+    :param l2_regularization: The L2 regularization of the leaf values. Defaults to 0.0.
+    :type l2_regularization: float, optional
+    :param max_bins: The maximum number of bins used for the non-missing values of each feature. Defaults to 255.
+    :type max_bins: int, optional
+    :param categorical_features: The mask or indices of the categorical features. Defaults to None, which treats every
+    column of a DataFrame with a categorical, string, or object dtype as categorical.
+    :type categorical_features: list, optional
+    """
+
+    name: str = "Hist Gradient Boosting Regressor"
+
+    primary_type: str = "regression"
+    secondary_type: str = "ensemble"
+    tertiary_type: str = "tree"
+
+    hyperparameters: dict = {
+        "max_iter": hp.choice("max_iter", [50, 100, 200, 300]),
+        "learning_rate": hp.uniform("learning_rate", 0.01, 0.3),
+        "max_leaf_nodes": hp.choice("max_leaf_nodes", [15, 31, 63, 127]),
+        "min_samples_leaf": hp.choice("min_samples_leaf", [5, 10, 20, 50]),
+        "l2_regularization": hp.uniform("l2_regularization", 0.0, 1.0),
+    }
+
+    def __init__(
+        self,
+        max_iter: Optional[int] = 100,
+        learning_rate: Optional[float] = 0.1,
+        max_leaf_nodes: Optional[int] = 31,
+        max_depth: Optional[int] = None,
+        min_samples_leaf: Optional[int] = 20,
+        l2_regularization: Optional[float] = 0.0,
+        max_bins: Optional[int] = 255,
+        categorical_features: Optional[list] = None,
+        random_state: Optional[int] = 0,
+        **kwargs,
+    ) -> None:
+        parameters = {
+            "max_iter": max_iter,
+            "learning_rate": learning_rate,
+            "max_leaf_nodes": max_leaf_nodes,
+            "max_depth": max_depth,
+            "min_samples_leaf": min_samples_leaf,
+            "l2_regularization": l2_regularization,
+            "max_bins": max_bins,
+            "categorical_features": categorical_features,
+            "random_state": random_state,
+        }
+        parameters.update(kwargs)
+
+        hist_gradient_boosting_model = hgb_regressor(**parameters)
+
+        super().__init__(model=hist_gradient_boosting_model, parameters=parameters)
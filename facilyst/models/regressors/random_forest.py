@@ -4,10 +4,10 @@ from typing import Optional
 from hyperopt import hp
 from sklearn.ensemble import RandomForestRegressor as rf_regressor
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.forest_model_base import ForestModelBase
 
 
-class RandomForestRegressor(ModelBase):
+class RandomForestRegressor(ForestModelBase):
     """The Random Forest Regressor (via sklearn's implementation).
 
      This is an ensemble regressor that fits multiple trees on the data.
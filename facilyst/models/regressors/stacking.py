@@ -0,0 +1,86 @@
+"""An ensemble model that learns how to combine the predictions of other models for regression problems."""
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import StackingRegressor as stacking_regressor
+
+from facilyst.models.ensemble_model_base import EnsembleModelBase
+from facilyst.models.model_base import ModelBase
+
+
+class StackingRegressor(EnsembleModelBase):
+    """The Stacking Regressor (via sklearn's implementation).
+
+     This is an ensemble regressor that trains a final estimator on the out-of-fold predictions of its members. The
+     out-of-fold predictions of every member are computed concurrently.
+
+    :param members: The members of the ensemble. Each entry can either be a model or the name or tag of the model(s) to
+    use, which will be retrieved through `get_models`. Defaults to the Decision Tree, Extra Trees, and Random Forest
+    regressors.
+    :type members: list, optional
+    :param final_estimator: The model, or the name of the model, trained on the predictions of the members. Defaults to
+    sklearn's `RidgeCV`.
+    :type final_estimator: str or ModelBase, optional
+    :param cv: The number of folds used to compute the out-of-fold predictions. Defaults to 5.
+    :type cv: int, optional
+    :param n_jobs: The number of processes used to fit the members, -1 uses all available cores.
+    :type n_jobs: int, optional
+    """
+
+    name: str = "Stacking Regressor"
+
+    primary_type: str = "regression"
+    secondary_type: str = "ensemble"
+    tertiary_type: str = "stacking"
+
+    hyperparameters: dict = {}
+
+    def __init__(
+        self,
+        members: Optional[List[Union[str, ModelBase]]] = None,
+        final_estimator: Optional[Union[str, ModelBase]] = None,
+        cv: Optional[int] = 5,
+        n_jobs: Optional[int] = -1,
+        **kwargs,
+    ) -> None:
+        members = members or [
+            "Decision Tree Regressor",
+            "Extra Trees Regressor",
+            "Random Forest Regressor",
+        ]
+        parameters = {
+            "members": members,
+            "final_estimator": final_estimator,
+            "cv": cv,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        self.members = self._collect_members(members, problem_type="regression")
+        self.final_estimator = self._collect_final_estimator(
+            final_estimator, problem_type="regression"
+        )
+
+        stacking_model = stacking_regressor(
+            estimators=[
+                (member_name, member.model) for member_name, member in self.members
+            ],
+            final_estimator=getattr(self.final_estimator, "model", None),
+            cv=cv,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
+        super().__init__(model=stacking_model, parameters=parameters)
+
+    def _member_width(self) -> int:
+        return 1
+
+    def _member_output(
+        self, estimator, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        return estimator.predict(x_test)
+
+    def _combine(self, member_outputs: np.ndarray) -> np.ndarray:
+        return self.model.final_estimator_.predict(member_outputs)
@@ -1,6 +1,7 @@
 from .adida import ADIDARegressor
 from .auto_arima import AutoARIMARegressor
 from .auto_ets import AutoETSRegressor
+from .auto_forecaster import AutoForecasterRegressor
 from .auto_theta import AutoThetaRegressor
 from .croston_optimized import CrostonOptimizedRegressor
 from .imapa import IMAPARegressor
@@ -1,7 +1,16 @@
 """A temporal aggregation model used with sparse data for time series regression problems."""
+from typing import Optional
+
+import numpy as np
 from statsforecast.models import ADIDA
 
 from facilyst.models import TimeSeriesModelBase
+from facilyst.utils.smoothing_utils import (
+    aggregate_state,
+    aggregation_level,
+    batch_adida_forecasts,
+    update_aggregate_state,
+)
 
 
 class ADIDARegressor(TimeSeriesModelBase):
@@ -32,3 +41,16 @@ class ADIDARegressor(TimeSeriesModelBase):
         adida_regressor_model = ADIDA(**parameters)
 
         super().__init__(model=adida_regressor_model, parameters=parameters)
+
+    def _initial_state(self, y_train: np.ndarray) -> dict:
+        return aggregate_state(y_train, aggregation_level(y_train))
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        forecast = update_aggregate_state(self.state, y_new)
+        self.model.model_ = {"mean": np.array([forecast])}
+
+    def _batch_forecast(
+        self, values: np.ndarray, offsets: np.ndarray, horizon: int
+    ) -> np.ndarray:
+        forecasts = batch_adida_forecasts(values, offsets)
+        return np.repeat(forecasts[:, np.newaxis], horizon, axis=1)
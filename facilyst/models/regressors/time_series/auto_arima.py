@@ -1,7 +1,9 @@
 """An automatic autoregressive integrated moving average model for time series regression problems."""
 from typing import Optional
 
+import numpy as np
 from hyperopt import hp
+from statsforecast.arima import arima_like
 from statsforecast.models import AutoARIMA
 
 from facilyst.models import TimeSeriesModelBase
@@ -29,7 +31,8 @@ class AutoARIMARegressor(TimeSeriesModelBase):
     seasonal (bool): If False, restricts search to non-seasonal models.
     ic (str): Information criterion to be used in model selection.
     nmodels (int): Number of models considered in stepwise search.
-    season_length (int): Number of observations per unit of time.
+    season_length (int): Number of observations per unit of time. Detected from each series the model is fitted on if
+        not passed.
     """
 
     name: str = "AutoARIMA Regressor"
@@ -62,7 +65,7 @@ class AutoARIMARegressor(TimeSeriesModelBase):
         seasonal: bool = True,
         ic: str = "aicc",
         nmodels: int = 94,
-        season_length: int = 1,
+        season_length: Optional[int] = None,
         **kwargs,
     ) -> None:
         parameters = {
@@ -89,3 +92,53 @@ class AutoARIMARegressor(TimeSeriesModelBase):
         autoarima_regressor_model = AutoARIMA(**parameters)
 
         super().__init__(model=autoarima_regressor_model, parameters=parameters)
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        fitted = self.model.model_
+        names = list(fitted["coef"])
+        coefficients = np.array(list(fitted["coef"].values()), dtype=np.float64)
+        num_arma = sum(fitted["arma"][:4])
+        num_observed = len(fitted["x"])
+
+        regressors, feature = {}, 0
+        for name in names[num_arma:]:
+            if name == "intercept":
+                regressors[name] = np.ones(len(y_new))
+            elif name == "drift":
+                regressors[name] = np.arange(
+                    num_observed + 1, num_observed + len(y_new) + 1, dtype=np.float64
+                )
+            else:
+                if x_new is None or feature >= x_new.shape[1]:
+                    raise ValueError(
+                        "x_new must have the features the model was fitted with."
+                    )
+                regressors[name] = np.asarray(x_new[:, feature], dtype=np.float64)
+                feature += 1
+        y_filtered = y_new.copy()
+        if regressors:
+            y_filtered -= (
+                np.column_stack(list(regressors.values())) @ coefficients[num_arma:]
+            )
+
+        # The Kalman filter runs from the last filtered state, without the initial covariance.
+        state_space = fitted["model"]
+        a, P = state_space["a"].copy(), state_space["P"].copy()
+        arima_like(
+            y_filtered,
+            state_space["phi"],
+            state_space["theta"],
+            state_space["delta"],
+            a,
+            P,
+            state_space["Pn"].copy(),
+            -1,
+            False,
+        )
+        state_space["a"], state_space["P"] = a, P
+        fitted["x"] = np.concatenate([fitted["x"], y_new])
+        if fitted["xreg"] is not None:
+            new_xreg = [
+                each for name, each in regressors.items() if name != "intercept"
+            ]
+            fitted["xreg"] = np.concatenate([fitted["xreg"], np.column_stack(new_xreg)])
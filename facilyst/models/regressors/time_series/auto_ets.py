@@ -1,7 +1,9 @@
 """An automatic exponential smoothing model for time series regression problems."""
 from typing import Optional
 
+import numpy as np
 from hyperopt import hp
+from statsforecast.ets import pegelsresid_C
 from statsforecast.models import AutoETS
 
 from facilyst.models import TimeSeriesModelBase
@@ -13,7 +15,8 @@ class AutoETSRegressor(TimeSeriesModelBase):
     This is a time series regressor that automatically selects the best ETS (Error, Trend, Seasonality) model using an
     information criterion.
 
-    season_length (int): Number of observations per unit of time. Optional.
+    season_length (int): Number of observations per unit of time. Detected from each series the model is fitted on if
+        not passed.
     model (str): Controls the state space equations. Options are M (multiplicative), A (additive), Z (optimized), and
         N (ommited).
         The E (error) can be: M, A, or Z
@@ -36,7 +39,7 @@ class AutoETSRegressor(TimeSeriesModelBase):
 
     def __init__(
         self,
-        season_length: int = 1,
+        season_length: Optional[int] = None,
         model: str = "ZZZ",
         damped: Optional[bool] = None,
         **kwargs,
@@ -51,3 +54,26 @@ class AutoETSRegressor(TimeSeriesModelBase):
         autoets_regressor_model = AutoETS(**parameters)
 
         super().__init__(model=autoets_regressor_model, parameters=parameters)
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        fitted = self.model.model_
+        error, trend, season, damped = fitted["components"]
+        alpha, beta, gamma, phi = fitted["par"][:4]
+        _, residuals, states, _ = pegelsresid_C(
+            y_new,
+            fitted["m"],
+            fitted["states"][-1],
+            error,
+            trend,
+            season,
+            damped == "D",
+            alpha,
+            beta,
+            gamma,
+            phi,
+            3,
+        )
+        fitted_values = y_new - residuals if error == "A" else y_new / (1 + residuals)
+        fitted["states"] = np.concatenate([fitted["states"], states[1:]])
+        fitted["residuals"] = np.concatenate([fitted["residuals"], residuals])
+        fitted["fitted"] = np.concatenate([fitted["fitted"], fitted_values])
@@ -0,0 +1,364 @@
+"""An automatic model selection and ensembling approach for time series regression problems."""
+import copy
+import inspect
+import warnings
+from typing import Any, List, Optional, Union
+
+import numpy as np
+from hyperopt import hp
+
+from facilyst.models import TimeSeriesModelBase
+from facilyst.utils.demand_utils import (
+    classify_demand,
+    demand_families,
+    demand_statistics,
+)
+from facilyst.utils.panel_utils import map_shards
+
+default_candidates: List[str] = [
+    "AutoARIMA Regressor",
+    "AutoETS Regressor",
+    "AutoTheta Regressor",
+    "sparse",
+]
+
+
+def _score_candidates(
+    candidates: List[TimeSeriesModelBase],
+    y: np.ndarray,
+    x: Optional[np.ndarray],
+    start: int,
+    holdout: int,
+) -> List[float]:
+    """The mean absolute error on the holdout tail of each candidate trained on `y[start:-holdout]`, inf if it fails."""
+    end = len(y) - holdout
+    errors = []
+    for candidate in candidates:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                candidate._set_season_length(y[start:end])
+                forecasts = candidate.model.forecast(
+                    y=y[start:end],
+                    h=holdout,
+                    X=None if x is None else x[start:end],
+                    X_future=None if x is None else x[end:],
+                )["mean"]
+            error = float(np.mean(np.abs(y[end:] - forecasts)))
+        except Exception:
+            error = np.inf
+        errors.append(error if np.isfinite(error) else np.inf)
+    return errors
+
+
+def _fit_candidates(
+    candidates: List[TimeSeriesModelBase], y: np.ndarray, x: Optional[np.ndarray]
+) -> List[Optional[TimeSeriesModelBase]]:
+    """Fits each candidate on the whole series, returning None for the candidates that fail."""
+    fitted = []
+    for candidate in candidates:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                fitted.append(candidate.fit(y, x))
+        except Exception:
+            fitted.append(None)
+    return fitted
+
+
+def _weighted_median(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """The weighted median of every column of a 2D array, where each row has a weight."""
+    order = np.argsort(values, axis=0)
+    cumulative_weights = np.cumsum(weights[order], axis=0)
+    median_rows = np.argmax(cumulative_weights >= cumulative_weights[-1] / 2, axis=0)
+    columns = np.arange(values.shape[1])
+    return values[order[median_rows, columns], columns]
+
+
+class AutoForecast:
+    """Selects, per series, the time series model or weighted median ensemble of models that forecasts best.
+
+    This is the estimator behind `AutoForecasterRegressor` and has the same `fit`, `predict`, and `forecast` interface as
+    the statsforecast models, so that it's used the same way by every method of `TimeSeriesModelBase`.
+
+    candidates (list): The candidate models, as instantiated models or as names or tags resolved through `get_models`.
+    season_length (int): Number of observations per unit of time, passed to the candidates that take it. If None, the
+        candidates detect it on each series.
+    holdout (int): The number of observations at the end of the series that candidates are scored on. Defaults to a
+        fifth of the series.
+    rounds (int): The number of scoring rounds. Each round trains the remaining candidates on twice as much history as
+        the previous one, ending with all the history before the holdout.
+    prune_ratio (float): After each round, candidates whose holdout error is more than this many times the best one
+        are dropped.
+    ensemble (bool): Whether to forecast with the weighted median of every remaining candidate, weighted by the
+        inverse of their holdout error, instead of with the best candidate only.
+    demand_routing (bool): Whether to only score the candidates suited to the demand pattern of the series, the sparse
+        models for intermittent and lumpy demand and the others for smooth and erratic demand. All candidates are
+        scored if none of them suit the series.
+    n_jobs (int): The number of cores to score and fit candidates on, -1 uses all available cores. Defaults to the
+        current core budget, or every core if none is set.
+    """
+
+    def __init__(
+        self,
+        candidates: Optional[List[Union[str, TimeSeriesModelBase]]] = None,
+        season_length: Optional[int] = None,
+        holdout: Optional[int] = None,
+        rounds: int = 3,
+        prune_ratio: float = 1.5,
+        ensemble: bool = False,
+        demand_routing: bool = True,
+        n_jobs: Optional[int] = None,
+    ) -> None:
+        self.candidates = candidates
+        self.season_length = season_length
+        self.holdout = holdout
+        self.rounds = rounds
+        self.prune_ratio = prune_ratio
+        self.ensemble = ensemble
+        self.demand_routing = demand_routing
+        self.n_jobs = n_jobs
+
+    def __repr__(self) -> str:
+        return "AutoForecast"
+
+    def _collect_candidates(self) -> List[TimeSeriesModelBase]:
+        """Resolves the candidates into fresh, instantiated models."""
+        from facilyst.models.utils import get_models
+
+        collected = []
+        for candidate in self.candidates or default_candidates:
+            if isinstance(candidate, TimeSeriesModelBase):
+                collected.append(copy.deepcopy(candidate))
+                continue
+            for candidate_class in sorted(
+                get_models(candidate, problem_type="time series"),
+                key=lambda x: x.name,
+            ):
+                if issubclass(candidate_class, AutoForecasterRegressor):
+                    continue
+                if "season_length" in inspect.signature(candidate_class).parameters:
+                    collected.append(candidate_class(season_length=self.season_length))
+                else:
+                    collected.append(candidate_class())
+        if not collected:
+            raise ValueError("No candidate time series models were found.")
+        return collected
+
+    def _route_candidates(
+        self, candidates: List[TimeSeriesModelBase], demand_class: str
+    ) -> List[TimeSeriesModelBase]:
+        """Keeps the candidates of the model family suited to the demand class, or all of them if none are."""
+        sparse = demand_families[demand_class] == "sparse"
+        routed = [
+            candidate
+            for candidate in candidates
+            if (candidate.tertiary_type == "sparse") == sparse
+        ]
+        return routed or candidates
+
+    def _score(
+        self,
+        candidates: List[TimeSeriesModelBase],
+        y: np.ndarray,
+        x: Optional[np.ndarray],
+        start: int,
+        holdout: int,
+    ) -> np.ndarray:
+        shards = map_shards(
+            _score_candidates,
+            len(candidates),
+            lambda shard_start, shard_end: (
+                candidates[shard_start:shard_end],
+                y,
+                x,
+                start,
+                holdout,
+            ),
+            n_jobs=self.n_jobs,
+        )
+        return np.array([error for shard in shards for error in shard])
+
+    def fit(self, y: np.ndarray, X: Optional[np.ndarray] = None) -> "AutoForecast":
+        """Scores the candidates on the holdout tail, pruning the ones that clearly lose, and refits the winners.
+
+        With demand routing, only the candidates suited to the demand pattern of the series are scored.
+
+        y (np.ndarray): The series.
+        X (np.ndarray): The features of the series. Optional.
+        return (AutoForecast): The fitted estimator.
+        """
+        y = np.asarray(y, dtype=np.float64)
+        candidates = self._collect_candidates()
+        demand_class = classify_demand(*demand_statistics(y, np.array([0, len(y)])))[0]
+        if self.demand_routing:
+            candidates = self._route_candidates(candidates, demand_class)
+        holdout = self.holdout or max(1, len(y) // 5)
+        train_size = len(y) - holdout
+        min_train_size = max(4, 2 * (self.season_length or 1))
+
+        errors = np.zeros(len(candidates))
+        if train_size >= min_train_size:
+            sizes = sorted(
+                {
+                    max(min_train_size, train_size // 2**round_index)
+                    for round_index in range(self.rounds)
+                }
+            )
+            for size in sizes:
+                errors = self._score(candidates, y, X, train_size - size, holdout)
+                if np.isfinite(errors).any():
+                    keep = errors <= self.prune_ratio * errors.min()
+                    candidates = [
+                        candidate for candidate, kept in zip(candidates, keep) if kept
+                    ]
+                    errors = errors[keep]
+
+        ranking = np.argsort(errors, kind="stable")
+        groups = [ranking] if self.ensemble else [[index] for index in ranking]
+        for group in groups:
+            shards = map_shards(
+                _fit_candidates,
+                len(group),
+                lambda start, end: (
+                    [candidates[index] for index in group[start:end]],
+                    y,
+                    X,
+                ),
+                n_jobs=self.n_jobs,
+            )
+            fitted = [
+                (model, errors[index])
+                for index, model in zip(
+                    group, [each for shard in shards for each in shard]
+                )
+                if model is not None
+            ]
+            if fitted:
+                break
+        else:
+            raise ValueError("None of the candidate models could be fitted.")
+
+        models = [model for model, _ in fitted]
+        model_errors = np.array([error for _, error in fitted], dtype=np.float64)
+        weights = 1 / np.maximum(model_errors, np.finfo(np.float64).eps)
+        if not np.isfinite(weights).all() or not weights.sum():
+            weights = np.ones(len(models))
+        self.model_ = {
+            "models": models,
+            "weights": weights / weights.sum(),
+            "errors": dict(zip([model.name for model in models], model_errors)),
+            "demand_class": demand_class,
+        }
+        return self
+
+    def predict(self, h: int, X: Optional[np.ndarray] = None) -> dict:
+        """Forecasts with the selected model, or the weighted median of the selected models.
+
+        h (int): The forecast horizon.
+        X (np.ndarray): The features over the forecast horizon. Optional.
+        return (dict): The forecasts, under `mean`.
+        """
+        models = self.model_["models"]
+        forecasts = np.stack(
+            [model.predict(horizon=h, x_test=X, as_array=True) for model in models]
+        )
+        if len(models) == 1:
+            return {"mean": forecasts[0]}
+        return {"mean": _weighted_median(forecasts, self.model_["weights"])}
+
+    def forecast(
+        self,
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+    ) -> dict:
+        """Fits and forecasts without keeping the fitted models.
+
+        y (np.ndarray): The series.
+        h (int): The forecast horizon.
+        X (np.ndarray): The features of the series. Optional.
+        X_future (np.ndarray): The features over the forecast horizon. Optional.
+        return (dict): The forecasts, under `mean`.
+        """
+        return copy.copy(self).fit(y, X).predict(h, X_future)
+
+
+class AutoForecasterRegressor(TimeSeriesModelBase):
+    """The Auto Forecaster Regressor.
+
+    This is a time series regressor that picks the best of several time series models for each series. Candidates are
+    scored on a holdout tail of the series over a few rounds, training on more history each round, and the ones that
+    clearly lose are pruned after every round so that the expensive models aren't fitted on the whole history for
+    nothing. The candidates of each round are scored concurrently, and only the winner, or the weighted median ensemble
+    of the remaining candidates, is refitted on the whole series. Used with `forecast_many`, every series of a panel
+    gets its own selection.
+
+    candidates (list): The candidate models, as instantiated models or as names or tags resolved through `get_models`.
+        Defaults to the AutoARIMA, AutoETS, and AutoTheta models along with every sparse model.
+    season_length (int): Number of observations per unit of time, passed to the candidates that take it. If None, the
+        candidates detect it on each series.
+    holdout (int): The number of observations at the end of the series that candidates are scored on. Defaults to a
+        fifth of the series.
+    rounds (int): The number of scoring rounds.
+    prune_ratio (float): After each round, candidates whose holdout error is more than this many times the best one
+        are dropped.
+    ensemble (bool): Whether to forecast with the weighted median of the remaining candidates instead of the best one.
+    demand_routing (bool): Whether to only score the candidates suited to the demand pattern of the series, so that
+        intermittent series skip the expensive smooth models and smooth series skip the sparse ones.
+    n_jobs (int): The number of cores to score and fit candidates on, -1 uses all available cores. Optional.
+    """
+
+    name: str = "Auto Forecaster Regressor"
+
+    primary_type: str = "time series"
+    secondary_type: str = "regression"
+    tertiary_type: str = "automatic"
+
+    hyperparameters: dict = {
+        "ensemble": hp.choice("ensemble", [True, False]),
+        "prune_ratio": hp.uniform("prune_ratio", 1.1, 3.0),
+    }
+
+    def __init__(
+        self,
+        candidates: Optional[List[Union[str, TimeSeriesModelBase]]] = None,
+        season_length: Optional[int] = None,
+        holdout: Optional[int] = None,
+        rounds: int = 3,
+        prune_ratio: float = 1.5,
+        ensemble: bool = False,
+        demand_routing: bool = True,
+        n_jobs: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        parameters = {
+            "candidates": candidates,
+            "season_length": season_length,
+            "holdout": holdout,
+            "rounds": rounds,
+            "prune_ratio": prune_ratio,
+            "ensemble": ensemble,
+            "demand_routing": demand_routing,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        auto_forecaster_model = AutoForecast(**parameters)
+
+        super().__init__(model=auto_forecaster_model, parameters=parameters)
+
+    @property
+    def demand_class(self) -> str:
+        """The demand class of the series the model was fitted on: `smooth`, `erratic`, `intermittent`, or `lumpy`."""
+        return self.model.model_["demand_class"]
+
+    @property
+    def selected_models(self) -> List[TimeSeriesModelBase]:
+        """The fitted models that the forecasts come from."""
+        return self.model.model_["models"]
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        for model in self.selected_models:
+            model.update(y_new, x_new)
@@ -1,8 +1,10 @@
 """An automatic theta-based and MSE-determined model for time series regression problems."""
 from typing import Optional
 
+import numpy as np
 from hyperopt import hp
 from statsforecast.models import AutoTheta
+from statsforecast.theta import switch_theta, thetaupdate
 
 from facilyst.models import TimeSeriesModelBase
 
@@ -13,7 +15,8 @@ class AutoThetaRegressor(TimeSeriesModelBase):
     This is a time series regressor that automatically selects the best Theta (Standard Theta Model (‘STM’), Optimized
     Theta Model (‘OTM’), Dynamic Standard Theta Model (‘DSTM’), Dynamic Optimized Theta Model (‘DOTM’)) model using mse.
 
-    season_length (int): Number of observations per unit of time. Optional.
+    season_length (int): Number of observations per unit of time. Detected from each series the model is fitted on if
+        not passed.
     decomposition_type (str): Seasonal decomposition type, ‘multiplicative’ (default) or ‘additive’.
     model (str): A parameter that "dampens" the trend. Optional.
     """
@@ -34,7 +37,7 @@ class AutoThetaRegressor(TimeSeriesModelBase):
 
     def __init__(
         self,
-        season_length: int = 1,
+        season_length: Optional[int] = None,
         decomposition_type: str = "multiplicative",
         model: Optional[str] = "DOTM",
         **kwargs,
@@ -49,3 +52,31 @@ class AutoThetaRegressor(TimeSeriesModelBase):
         autotheta_regressor_model = AutoTheta(**parameters)
 
         super().__init__(model=autotheta_regressor_model, parameters=parameters)
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        fitted = self.model.model_
+        if fitted.get("decompose", False):
+            # The new observations are deseasonalized with the seasonal forecast of the fit, which then moves ahead.
+            seasonal = fitted["seas_forecast"]["mean"]
+            factors = np.resize(seasonal, len(y_new))
+            if fitted["decomposition_type"] == "multiplicative":
+                y_new = y_new / factors
+            else:
+                y_new = y_new - factors
+            fitted["seas_forecast"] = {"mean": np.roll(seasonal, -len(y_new))}
+        n = fitted["n"]
+        states = np.concatenate(
+            [fitted["states"], np.zeros((len(y_new), 5), dtype=fitted["states"].dtype)]
+        )
+        modeltype = switch_theta(fitted["modeltype"])
+        for step, value in enumerate(y_new):
+            thetaupdate(
+                states,
+                n + step,
+                modeltype,
+                fitted["par"]["alpha"],
+                fitted["par"]["theta"],
+                value,
+                0,
+            )
+        fitted["states"], fitted["n"] = states, n + len(y_new)
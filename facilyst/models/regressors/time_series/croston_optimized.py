@@ -1,7 +1,15 @@
 """A decomposition model used with sparse data for time series regression problems."""
+from typing import Optional
+
+import numpy as np
 from statsforecast.models import CrostonOptimized
 
 from facilyst.models import TimeSeriesModelBase
+from facilyst.utils.smoothing_utils import (
+    batch_croston_forecasts,
+    croston_state,
+    update_croston_state,
+)
 
 
 class CrostonOptimizedRegressor(TimeSeriesModelBase):
@@ -31,3 +39,16 @@ class CrostonOptimizedRegressor(TimeSeriesModelBase):
         croston_opt_regressor_model = CrostonOptimized(**parameters)
 
         super().__init__(model=croston_opt_regressor_model, parameters=parameters)
+
+    def _initial_state(self, y_train: np.ndarray) -> dict:
+        return croston_state(y_train)
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        forecast = update_croston_state(self.state, y_new)
+        self.model.model_ = {"mean": np.array([forecast])}
+
+    def _batch_forecast(
+        self, values: np.ndarray, offsets: np.ndarray, horizon: int
+    ) -> np.ndarray:
+        forecasts = batch_croston_forecasts(values, offsets)
+        return np.repeat(forecasts[:, np.newaxis], horizon, axis=1)
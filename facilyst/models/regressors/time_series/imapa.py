@@ -1,7 +1,15 @@
 """A multiple temporal aggregation model used with sparse data for time series regression problems."""
+from typing import Optional
+
+import numpy as np
 from statsforecast.models import IMAPA
 
 from facilyst.models import TimeSeriesModelBase
+from facilyst.utils.smoothing_utils import (
+    batch_imapa_forecasts,
+    imapa_states,
+    update_imapa_states,
+)
 
 
 class IMAPARegressor(TimeSeriesModelBase):
@@ -32,3 +40,16 @@ class IMAPARegressor(TimeSeriesModelBase):
         imapa_regressor_model = IMAPA(**parameters)
 
         super().__init__(model=imapa_regressor_model, parameters=parameters)
+
+    def _initial_state(self, y_train: np.ndarray) -> list:
+        return imapa_states(y_train)
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        forecast = update_imapa_states(self.state, y_new)
+        self.model.model_ = {"mean": np.array([forecast])}
+
+    def _batch_forecast(
+        self, values: np.ndarray, offsets: np.ndarray, horizon: int
+    ) -> np.ndarray:
+        forecasts = batch_imapa_forecasts(values, offsets)
+        return np.repeat(forecasts[:, np.newaxis], horizon, axis=1)
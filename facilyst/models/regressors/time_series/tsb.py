@@ -1,8 +1,16 @@
 """A decomposition, demand probability-based model used with sparse data for time series regression problems."""
+from typing import Optional
+
+import numpy as np
 from hyperopt import hp
 from statsforecast.models import TSB
 
 from facilyst.models import TimeSeriesModelBase
+from facilyst.utils.smoothing_utils import (
+    batch_tsb_forecasts,
+    tsb_state,
+    update_tsb_state,
+)
 
 
 class TSBRegressor(TimeSeriesModelBase):
@@ -43,3 +51,20 @@ class TSBRegressor(TimeSeriesModelBase):
         tsb_regressor_model = TSB(**parameters)
 
         super().__init__(model=tsb_regressor_model, parameters=parameters)
+
+    def _initial_state(self, y_train: np.ndarray) -> dict:
+        return tsb_state(
+            y_train, self.parameters["alpha_d"], self.parameters["alpha_p"]
+        )
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        forecast = update_tsb_state(self.state, y_new)
+        self.model.model_ = {"mean": np.array([forecast])}
+
+    def _batch_forecast(
+        self, values: np.ndarray, offsets: np.ndarray, horizon: int
+    ) -> np.ndarray:
+        forecasts = batch_tsb_forecasts(
+            values, offsets, self.parameters["alpha_d"], self.parameters["alpha_p"]
+        )
+        return np.repeat(forecasts[:, np.newaxis], horizon, axis=1)
@@ -0,0 +1,76 @@
+"""An ensemble model that averages the predictions of other models for regression problems."""
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import VotingRegressor as voting_regressor
+
+from facilyst.models.ensemble_model_base import EnsembleModelBase
+from facilyst.models.model_base import ModelBase
+
+
+class VotingRegressor(EnsembleModelBase):
+    """The Voting Regressor (via sklearn's implementation).
+
+     This is an ensemble regressor that fits each member on the whole dataset and averages their predictions.
+
+    :param members: The members of the ensemble. Each entry can either be a model or the name or tag of the model(s) to
+    use, which will be retrieved through `get_models`. Defaults to the Decision Tree, Extra Trees, and Random Forest
+    regressors.
+    :type members: list, optional
+    :param weights: The weight of each member when averaging their predictions. Defaults to equal weights.
+    :type weights: list, optional
+    :param n_jobs: The number of processes used to fit the members, -1 uses all available cores.
+    :type n_jobs: int, optional
+    """
+
+    name: str = "Voting Regressor"
+
+    primary_type: str = "regression"
+    secondary_type: str = "ensemble"
+    tertiary_type: str = "voting"
+
+    hyperparameters: dict = {}
+
+    def __init__(
+        self,
+        members: Optional[List[Union[str, ModelBase]]] = None,
+        weights: Optional[List[float]] = None,
+        n_jobs: Optional[int] = -1,
+        **kwargs,
+    ) -> None:
+        members = members or [
+            "Decision Tree Regressor",
+            "Extra Trees Regressor",
+            "Random Forest Regressor",
+        ]
+        parameters = {
+            "members": members,
+            "weights": weights,
+            "n_jobs": n_jobs,
+        }
+        parameters.update(kwargs)
+
+        self.members = self._collect_members(members, problem_type="regression")
+
+        voting_model = voting_regressor(
+            estimators=[
+                (member_name, member.model) for member_name, member in self.members
+            ],
+            weights=weights,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
+        super().__init__(model=voting_model, parameters=parameters)
+
+    def _member_width(self) -> int:
+        return 1
+
+    def _member_output(
+        self, estimator, x_test: Union[pd.DataFrame, np.ndarray]
+    ) -> np.ndarray:
+        return estimator.predict(x_test)
+
+    def _combine(self, member_outputs: np.ndarray) -> np.ndarray:
+        return np.average(member_outputs, axis=1, weights=self.parameters["weights"])
@@ -3,11 +3,11 @@ from typing import Optional
 
 from hyperopt import hp
 
-from facilyst.models.model_base import ModelBase
+from facilyst.models.boosting_model_base import BoostingModelBase
 from facilyst.utils import import_errors_dict, import_or_raise
 
 
-class XGBoostRegressor(ModelBase):
+class XGBoostRegressor(BoostingModelBase):
     """The XGBoost Regressor (via xgboost's library).
 
      This is a regressor that uses gradient boosting on decision trees.
@@ -26,6 +26,8 @@ class XGBoostRegressor(ModelBase):
     secondary_type: str = "ensemble"
     tertiary_type: str = "tree"
 
+    native_data_type: str = "DMatrix"
+
     hyperparameters: dict = {
         "n_estimators": hp.choice("n_estimators", [10, 50, 100, 200, 300]),
         "max_depth": hp.randint("max_depth", 2, 10),
@@ -1,10 +1,68 @@
 """Base class for all time series models."""
-from typing import Any, Optional, Union
+import hashlib
+import os
+import warnings
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from hyperopt import hp
 
 from facilyst.models import ModelBase
+from facilyst.models.model_base import _fit_cache_token
+from facilyst.utils.async_utils import run_in_executor
+from facilyst.utils.cache_utils import ModelCache, _default_cache_directory
+from facilyst.utils.conversion_utils import to_array
+from facilyst.utils.metrics_utils import evaluate_predictions
+from facilyst.utils.panel_utils import future_times, map_shards, split_panel
+from facilyst.utils.seasonality_utils import (
+    detect_season_length,
+    season_length_candidates,
+)
+
+
+def _forecast_shard(
+    model: "TimeSeriesModelBase", values: np.ndarray, offsets: np.ndarray, horizon: int
+) -> np.ndarray:
+    """Forecasts every series of a shard with the underlying model, leaving NaN for series that can't be forecast."""
+    forecasts = np.full((len(offsets) - 1, horizon), np.nan)
+    for index, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        series = values[start:end]
+        try:
+            forecasts[index] = model._cached_forecast(
+                _data_fingerprint(series, None)
+                if model.forecast_cache is not None
+                else None,
+                horizon,
+                None,
+                lambda: _forecast_series(model, series, horizon),
+            )
+        except Exception:
+            continue
+    return forecasts
+
+
+def _forecast_series(
+    model: "TimeSeriesModelBase",
+    y_train: np.ndarray,
+    horizon: int,
+    x_train: Optional[np.ndarray] = None,
+    x_test: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Forecasts a series with the underlying model, detecting its season length first if the model needs one."""
+    model._set_season_length(np.asarray(y_train, dtype=np.float64))
+    return model.model.forecast(y=y_train, h=horizon, X=x_train, X_future=x_test)[
+        "mean"
+    ]
+
+
+def _data_fingerprint(*data: Any) -> str:
+    """A short fingerprint of the data a time series model is fitted or updated on."""
+    return hashlib.blake2b(
+        repr([_fit_cache_token(each_data) for each_data in data]).encode(),
+        digest_size=16,
+    ).hexdigest()
 
 
 class TimeSeriesModelBase(ModelBase):
@@ -13,6 +71,8 @@ class TimeSeriesModelBase(ModelBase):
     model (object): The model to be used.
     """
 
+    fit_cache_excluded: tuple = ModelBase.fit_cache_excluded + ("forecast_cache",)
+
     def __init__(
         self, model: Optional[Any] = None, parameters: Optional[dict] = None
     ) -> None:
@@ -20,6 +80,9 @@ class TimeSeriesModelBase(ModelBase):
         self.parameters = parameters
         self.frequency = None
         self.final_training_index = 0
+        self.state = None
+        self.forecast_cache = None
+        self.training_fingerprint = None
         super().__init__(model=self.model, parameters=self.parameters)
 
     def __eq__(self, other) -> bool:
@@ -51,13 +114,39 @@ class TimeSeriesModelBase(ModelBase):
 
     @staticmethod
     def _convert_data(y, x):
-        # pytype: disable=attribute-error
-        if isinstance(x, pd.DataFrame):
-            x = x.to_numpy()
-        if isinstance(y, pd.Series):
-            y = y.to_numpy()
-        # pytype: enable=attribute-error
-        return y, x
+        return to_array(y), to_array(x)
+
+    def _set_season_length(self, y_train: np.ndarray) -> None:
+        """Sets the season length of the underlying model to the one detected on the series, if it wasn't passed."""
+        parameters = self.parameters or {}
+        if "season_length" in parameters and parameters["season_length"] is None:
+            self.model.season_length = detect_season_length(y_train)
+
+    @classmethod
+    def hyperparameters_for(
+        cls,
+        x: Optional[Union[pd.DataFrame, np.ndarray]],
+        y: Optional[Union[pd.Series, np.ndarray]],
+    ) -> dict:
+        """The hyperparameter space searched for a series, only trying the season lengths detected on it.
+
+        Fitting a seasonal model is much more expensive than a non-seasonal one, so rather than every common season
+        length, only no seasonality and the peaks of the autocorrelation of the series are tried.
+
+        x (pd.DataFrame or np.ndarray): The features of the series. Unused.
+        y (pd.Series or np.ndarray): The series.
+        return (dict): The hyperparameter space.
+        """
+        space = dict(cls.hyperparameters)
+        if "season_length" not in space or y is None:
+            return space
+        values = np.asarray(to_array(y), dtype=np.float64).reshape(-1)
+        values = values[~np.isnan(values)]
+        candidates = season_length_candidates(values, np.array([0, len(values)]))[0]
+        space["season_length"] = hp.choice(
+            "season_length", [1] + sorted(int(each) for each in candidates if each > 1)
+        )
+        return space
 
     def fit(
         self,
@@ -71,9 +160,168 @@ class TimeSeriesModelBase(ModelBase):
         """
         x_train = self._store_final_training_index(y_train, x_train)
         y_train, x_train = TimeSeriesModelBase._convert_data(y=y_train, x=x_train)
-        self.model.fit(y=y_train, X=x_train)
+        self._set_season_length(np.asarray(y_train, dtype=np.float64))
+        with self._thread_budget():
+            self.model.fit(y=y_train, X=x_train)
+        self.state = self._initial_state(np.asarray(y_train, dtype=np.float64))
+        self.training_fingerprint = (
+            _data_fingerprint(y_train, x_train)
+            if self.forecast_cache is not None
+            else None
+        )
+        self._new_fit_generation()
+        return self
+
+    def _initial_state(self, y_train: np.ndarray) -> Any:
+        """The state advanced by `update`, for models whose fitted estimator doesn't keep it. None by default.
+
+        y_train (np.ndarray): The training targets the model was fitted on.
+        return (object): The state.
+        """
+        return None
+
+    def _update_state(self, y_new: np.ndarray, x_new: Optional[np.ndarray]) -> None:
+        """Advances the fitted estimator, or `self.state`, by new observations without refitting.
+
+        y_new (np.ndarray): The new targets.
+        x_new (np.ndarray): The new features. Optional.
+        """
+        raise NotImplementedError(f"{self.name} can't be updated without refitting.")
+
+    def _batch_forecast(
+        self, values: np.ndarray, offsets: np.ndarray, horizon: int
+    ) -> np.ndarray:
+        """Forecasts many series at once with vectorized kernels, for the batch mode of `forecast_many`.
+
+        values (np.ndarray): The targets of every series, one series after the other.
+        offsets (np.ndarray): The start of each series in `values`, followed by the total number of values.
+        horizon (int): The number of steps to forecast for each series.
+        return (np.ndarray): The forecasts, with a row per series.
+        """
+        raise NotImplementedError(f"{self.name} can't forecast series in a batch.")
+
+    def _advance_final_training_index(self, y_new, x_new) -> None:
+        # pytype: disable=attribute-error
+        if isinstance(x_new, pd.DataFrame) and isinstance(
+            x_new.index, pd.DatetimeIndex
+        ):
+            self.final_training_index = x_new.index[-1]
+        elif isinstance(y_new, pd.Series) and isinstance(y_new.index, pd.DatetimeIndex):
+            self.final_training_index = y_new.index[-1]
+        elif self.frequency is None:
+            self.final_training_index += len(y_new)
+        else:
+            self.final_training_index += len(y_new) * pd.tseries.frequencies.to_offset(
+                self.frequency
+            )
+        # pytype: enable=attribute-error
+
+    def update(
+        self,
+        y_new: Union[pd.Series, np.ndarray],
+        x_new: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    ) -> Any:
+        """Advances the fitted time series model by new observations without refitting it.
+
+        The model structure and parameters selected by `fit` are kept, and only the state is advanced: by filtering for
+        ETS, Theta, and ARIMA models, and by the smoothing recursions of the sparse models. This makes forecasting after
+        every new observation cheap, while refitting periodically to select new parameters is left to the caller.
+
+        y_new (pd.Series or np.ndarray): The targets observed since the end of the training data.
+        x_new (pd.DataFrame or np.ndarray): The features observed since the end of the training data. Required if the
+            model was fitted with features.
+        return (TimeSeriesModelBase): The updated model.
+        """
+        if getattr(self.model, "model_", None) is None:
+            raise ValueError(
+                "The time series model must be fitted before it's updated."
+            )
+        y_values, x_values = TimeSeriesModelBase._convert_data(y=y_new, x=x_new)
+        y_values = np.asarray(y_values, dtype=np.float64).reshape(-1)
+        if x_values is not None and x_values.size == 0:
+            x_values = None
+        if x_values is not None and len(x_values) != len(y_values):
+            raise ValueError(
+                f"The length of x_new ({len(x_values)}) doesn't match the length of y_new ({len(y_values)})."
+            )
+        if len(y_values):
+            self._update_state(y_values, x_values)
+            if self.training_fingerprint is not None:
+                self.training_fingerprint = _data_fingerprint(
+                    self.training_fingerprint, y_values, x_values
+                )
+            self._advance_final_training_index(y_new, x_new)
+            self._new_fit_generation()
+        return self
+
+    def enable_forecast_cache(
+        self,
+        cache: Optional[ModelCache] = None,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = 1024**3,
+        ttl: Optional[float] = None,
+    ) -> "TimeSeriesModelBase":
+        """Caches forecasts on disk, so forecasting a series that hasn't changed serves the stored forecasts instantly.
+
+        Entries are keyed by a fingerprint of the training targets and features, the model class and parameters, the
+        horizon, the future features, and the versions of facilyst and the libraries it builds on. `forecast` and
+        `forecast_many` fingerprint the series they are given, and `predict` the data the model was fitted and updated
+        on, so only series that changed are forecast again. The cache is shared across processes and runs.
+
+        cache (ModelCache): An existing cache to store the forecasts in. Defaults to a new cache.
+        directory (str): The directory of a new cache. Defaults to `forecasts` in the directory set in the
+            `FACILYST_CACHE_DIR` environment variable, or `~/.cache/facilyst/forecasts`.
+        max_bytes (int): The maximum size of a new cache in bytes, after which the least recently used forecasts are
+            deleted. Defaults to 1 GB.
+        ttl (float): The number of seconds a new cache serves forecasts for after they're stored. Defaults to no expiry.
+        return (TimeSeriesModelBase): Returns self.
+        """
+        self.forecast_cache = (
+            cache
+            if cache is not None
+            else ModelCache(
+                directory or os.path.join(_default_cache_directory(), "forecasts"),
+                max_bytes=max_bytes,
+                ttl=ttl,
+            )
+        )
+        return self
+
+    def disable_forecast_cache(self) -> "TimeSeriesModelBase":
+        """Stops loading and storing forecasts, without deleting the forecasts already on disk.
+
+        return (TimeSeriesModelBase): Returns self.
+        """
+        self.forecast_cache = None
         return self
 
+    def _cached_forecast(
+        self,
+        data_fingerprint: Optional[str],
+        horizon: int,
+        x_test: Optional[np.ndarray],
+        compute: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """Returns the cached forecasts of the data, computing and storing them on a miss."""
+        if self.forecast_cache is None or data_fingerprint is None:
+            return compute()
+        forecast_token = {
+            "class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "parameters": _fit_cache_token(self.parameters),
+            "data": data_fingerprint,
+            "horizon": horizon,
+            "x_test": _fit_cache_token(x_test),
+            "versions": self._library_versions(),
+        }
+        key = hashlib.blake2b(repr(forecast_token).encode(), digest_size=16).hexdigest()
+        forecasts = self.forecast_cache.get(key)
+        if forecasts is None:
+            forecasts = np.asarray(compute())
+            self.forecast_cache.put(
+                key, forecasts, {"name": self.name, "horizon": horizon}
+            )
+        return forecasts
+
     def _create_predict_index(self, horizon=None):
         if self.frequency is None:
             predict_index = pd.RangeIndex(
@@ -89,7 +337,7 @@ class TimeSeriesModelBase(ModelBase):
     def _get_forecast_index(self, x_test, horizon):
         if isinstance(x_test, pd.DataFrame):
             predictions_index = x_test.index
-            x_test = x_test.to_numpy()
+            x_test = to_array(x_test)
         else:
             predictions_index = self._create_predict_index(horizon)
         return x_test, predictions_index
@@ -114,21 +362,31 @@ class TimeSeriesModelBase(ModelBase):
         self,
         horizon: Optional[int] = None,
         x_test: Optional[Union[pd.DataFrame, np.ndarray]] = None,
-    ) -> pd.Series:
+        as_array: Optional[bool] = False,
+    ) -> Union[pd.Series, np.ndarray]:
         """Predicts on the data using the time series model.
 
         horizon (int): The forecast horizon. Will be inferred from the length of the x_test if none is passed.
         x_test (pd.DataFrame or np.ndarray): The testing data for the time series model to predict on. Must be provided
             if horizon is not passed.
-        return (pd.Series): The predictions.
+        as_array (bool): Whether to return the raw array of predictions instead of a pd.Series with a forecast index.
+        return (pd.Series or np.ndarray): The predictions.
         """
         _, x_test = TimeSeriesModelBase._convert_data(y=None, x=x_test)
         x_test, horizon = TimeSeriesModelBase._check_for_errors(x_test, horizon)
         x_test, predictions_index = self._get_forecast_index(
             x_test=x_test, horizon=horizon
         )
-        forecasts_dict = self.model.predict(h=horizon, X=x_test)
-        predictions = pd.Series(forecasts_dict["mean"], index=predictions_index)
+        with self._thread_budget():
+            forecasts = self._cached_forecast(
+                self.training_fingerprint,
+                horizon,
+                x_test,
+                lambda: self.model.predict(h=horizon, X=x_test)["mean"],
+            )
+        if as_array:
+            return forecasts
+        predictions = pd.Series(forecasts, index=predictions_index)
 
         return predictions
 
@@ -138,7 +396,8 @@ class TimeSeriesModelBase(ModelBase):
         horizon: Optional[int] = None,
         x_train: Optional[Union[pd.DataFrame, np.ndarray]] = None,
         x_test: Optional[Union[pd.DataFrame, np.ndarray]] = None,
-    ) -> pd.Series:
+        as_array: Optional[bool] = False,
+    ) -> Union[pd.Series, np.ndarray]:
         """Analogous to fit_predict without storing data in memory.
 
         y_train (pd.Series or np.ndarray): The training targets for the time series model to be fitted on.
@@ -146,7 +405,8 @@ class TimeSeriesModelBase(ModelBase):
         x_train (pd.DataFrame or np.ndarray): The training data for the time series model to be fitted on. Optional.
         x_test (pd.DataFrame or np.ndarray): The testing data for the time series model to predict on. Must be provided
             if horizon is not passed.
-        return (pd.Series): The predictions.
+        as_array (bool): Whether to return the raw array of predictions instead of a pd.Series with a forecast index.
+        return (pd.Series or np.ndarray): The predictions.
         """
         self._store_final_training_index(y_train, x_train)
         y_train, x_train = TimeSeriesModelBase._convert_data(y=y_train, x=x_train)
@@ -156,12 +416,133 @@ class TimeSeriesModelBase(ModelBase):
         x_test, predictions_index = self._get_forecast_index(
             x_test=x_test, horizon=horizon
         )
-        forecasts_dict = self.model.forecast(
-            y=y_train, h=horizon, X=x_train, X_future=x_test
-        )
-        predictions = pd.Series(forecasts_dict["mean"], index=predictions_index)
+        with self._thread_budget():
+            forecasts = self._cached_forecast(
+                _data_fingerprint(y_train, x_train)
+                if self.forecast_cache is not None
+                else None,
+                horizon,
+                x_test,
+                lambda: _forecast_series(self, y_train, horizon, x_train, x_test),
+            )
+        if as_array:
+            return forecasts
+        predictions = pd.Series(forecasts, index=predictions_index)
         return predictions
 
+    def evaluate(
+        self,
+        x_test: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+        y_actual: Optional[Union[pd.Series, np.ndarray]] = None,
+        metrics: Optional[List[str]] = None,
+        horizon: Optional[int] = None,
+        y_train: Optional[Union[pd.Series, np.ndarray]] = None,
+        season_length: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Computes several metrics from a single prediction pass of the fitted time series model.
+
+        The arguments follow the same order as `ModelBase.evaluate`, so both kinds of models can be evaluated with
+        `model.evaluate(x_test, y_actual, metrics)`.
+
+        x_test (pd.DataFrame or np.ndarray): The testing data for the time series model to predict on. Optional.
+        y_actual (pd.Series or np.ndarray): The actual target values over the forecast horizon.
+        metrics (list): The names of the metrics to compute, see `metrics_dict` for all options. Defaults to `rmse` and
+            `mae`, as well as `mase` if y_train is passed.
+        horizon (int): The forecast horizon. Will be inferred from the length of y_actual if neither horizon nor x_test
+            are passed.
+        y_train (pd.Series or np.ndarray): The training targets, used by the naive seasonal baseline of `mase`.
+        season_length (int): The season length of the naive baseline of `mase`. Defaults to the season length of the
+            model, or 1 if it has none.
+        return (dict): The value of each metric.
+        """
+        if y_actual is None:
+            raise ValueError("`y_actual` is required to evaluate the model.")
+        if metrics is None:
+            metrics = ["rmse", "mae"] + (["mase"] if y_train is not None else [])
+        if horizon is None and x_test is None:
+            horizon = len(y_actual)
+        season_length = season_length or getattr(self.model, "season_length", None) or 1
+        predictions = self.predict(horizon=horizon, x_test=x_test, as_array=True)
+        return evaluate_predictions(
+            y_actual=y_actual,
+            metrics=metrics,
+            predictions=predictions,
+            y_train=y_train,
+            season_length=season_length,
+        )
+
+    def forecast_many(
+        self,
+        data: pd.DataFrame,
+        id_column: str,
+        time_column: str,
+        target_column: str,
+        horizon: int,
+        frequency: Optional[str] = None,
+        n_jobs: Optional[int] = None,
+        batch: bool = False,
+    ) -> pd.DataFrame:
+        """Forecasts every series of a long-format DataFrame with this model's parameters, sharding series across processes.
+
+        The DataFrame is sorted and split into contiguous arrays once, the frequency is inferred once, and each worker
+        process forecasts a contiguous shard of series directly from views into those arrays. Series that can't be
+        forecast, for example because they are too short, get NaN forecasts and a warning.
+
+        data (pd.DataFrame): The series, with one row per series and time.
+        id_column (str): The column that identifies each series.
+        time_column (str): The column holding the time of each row.
+        target_column (str): The column holding the target values.
+        horizon (int): The number of steps to forecast for each series.
+        frequency (str): The frequency of the time column. Inferred if not passed.
+        n_jobs (int): The number of cores to use, -1 uses all available cores. Defaults to the current core budget, or
+            every core if none is set.
+        batch (bool): Whether to forecast all series at once in this process with vectorized kernels instead of fitting
+            the model on each series, which is much faster for many short series. Only supported by the sparse models,
+            whose smoothing parameters are then optimized on a grid.
+        return (pd.DataFrame): The forecasts, with the id, the time, and the `forecast` of each step of each series.
+        """
+        panel = split_panel(data, id_column, time_column, target_column, frequency)
+        if batch:
+            forecasts = self._batch_forecast(panel.values, panel.offsets, horizon)
+        else:
+            shards = map_shards(
+                _forecast_shard,
+                len(panel),
+                lambda start, end: (
+                    self,
+                    panel.values[panel.offsets[start] : panel.offsets[end]],
+                    panel.offsets[start : end + 1] - panel.offsets[start],
+                    horizon,
+                ),
+                n_jobs=n_jobs,
+            )
+            forecasts = np.concatenate(shards) if shards else np.empty((0, horizon))
+        num_failed = int(np.isnan(forecasts).all(axis=1).sum())
+        if num_failed:
+            warnings.warn(
+                f"{num_failed} series couldn't be forecast and have NaN forecasts."
+            )
+        return pd.DataFrame(
+            {
+                id_column: np.repeat(panel.ids, horizon),
+                time_column: future_times(panel.last_times, horizon, panel.frequency),
+                "forecast": forecasts.ravel(),
+            }
+        )
+
+    async def aforecast(
+        self, *args, executor: Optional[Executor] = None, **kwargs
+    ) -> Union[pd.Series, np.ndarray]:
+        """Awaitable version of `forecast` that forecasts on an executor without blocking the event loop.
+
+        Takes the same arguments as `forecast`.
+
+        executor (concurrent.futures.Executor): The executor to forecast on. Defaults to the executor set with
+            `set_async_executor`, or the default executor of the running event loop.
+        return (pd.Series or np.ndarray): The predictions.
+        """
+        return await run_in_executor(self.forecast, *args, executor=executor, **kwargs)
+
     def get_params(self) -> dict:
         """Gets the parameters for the time series model.
 
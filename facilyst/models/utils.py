@@ -1,6 +1,8 @@
 """Utility functions for all model types."""
 from typing import Optional
 
+import joblib
+
 from facilyst.models.model_base import ModelBase
 from facilyst.utils import _get_subclasses
 from facilyst.utils.gen_utils import handle_problem_type
@@ -115,6 +117,18 @@ def get_models(
         raise no_models_found
 
 
+def load_model(path: str) -> ModelBase:
+    """Loads a model that was saved with `ModelBase.save`.
+
+    path (str): The path of the file the model was saved to.
+    return (ModelBase): The loaded model.
+    """
+    model = joblib.load(path)
+    if not isinstance(model, ModelBase):
+        raise ValueError(f"The file `{path}` doesn't contain a facilyst model.")
+    return model
+
+
 def _is_any_allowed(tag):
     if tag is None or tag.lower() in ["any", "all", ""]:
         return True
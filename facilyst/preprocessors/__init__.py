@@ -1 +1,2 @@
 from .datetime import AggregateDatetime, FTDatetime
+from .time_series import WindowFeatures
@@ -0,0 +1 @@
+from .window_features import WindowFeatures
@@ -0,0 +1,444 @@
+"""Preprocessor that adds lag, rolling window, and expanding window features of many series at once."""
+import warnings
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from facilyst.preprocessors.preprocessor_base import PreprocessorBase
+
+window_statistics: List[str] = ["mean", "std", "min", "max"]
+
+
+def _lag(values: np.ndarray, positions: np.ndarray, lag: int) -> np.ndarray:
+    """Shifts every series down by `lag` rows, leaving NaN where a series has no value that far back."""
+    if lag == 0:
+        return values.copy()
+    lagged = np.full(values.shape, np.nan)
+    lagged[lag:] = values[:-lag]
+    lagged[positions < lag] = np.nan
+    return lagged
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """The sum of every `window` consecutive rows ending at each row, from the difference of two cumulative sums."""
+    cumulative = np.zeros((len(values) + 1, values.shape[1]))
+    np.cumsum(values, axis=0, out=cumulative[1:])
+    sums = np.full(values.shape, np.nan)
+    sums[window - 1 :] = cumulative[window:] - cumulative[:-window]
+    return sums
+
+
+def _rolling(
+    values: np.ndarray,
+    positions: np.ndarray,
+    window: int,
+    statistics: List[str],
+    center: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """The statistics of the `window` rows ending at each row, NaN unless all of them belong to the series and are set.
+
+    Means and standard deviations come from cumulative sums of the centered values, and minimums and maximums from a
+    strided view of every window, so no window is ever copied.
+    """
+    finite = ~np.isnan(values)
+    if len(values) < window:
+        return {statistic: np.full(values.shape, np.nan) for statistic in statistics}
+    valid = (positions >= window - 1)[:, np.newaxis] & (
+        _window_sums((~finite).astype(np.float64), window) == 0
+    )
+    centered = np.where(finite, values - center, 0.0)
+
+    rolled = {}
+    if "mean" in statistics or "std" in statistics:
+        sums = _window_sums(centered, window)
+        rolled["mean"] = sums / window + center
+        if "std" in statistics:
+            squares = _window_sums(np.square(centered), window)
+            variances = (squares - np.square(sums) / window) / max(window - 1, 1)
+            rolled["std"] = (
+                np.sqrt(np.maximum(variances, 0))
+                if window > 1
+                else np.full(values.shape, np.nan)
+            )
+    views = sliding_window_view(values, window, axis=0)
+    for statistic in {"min", "max"}.intersection(statistics):
+        rolled[statistic] = np.full(values.shape, np.nan)
+        rolled[statistic][window - 1 :] = getattr(views, statistic)(axis=-1)
+    return {
+        statistic: np.where(valid, rolled[statistic], np.nan)
+        for statistic in statistics
+    }
+
+
+def _expanding_totals(
+    values: np.ndarray,
+    codes: np.ndarray,
+    base: Dict[str, np.ndarray],
+    center: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """The running count, sum, and sum of squares of the set centered values, and the running minimum and maximum, of
+    every series up to each row, on top of the totals of the rows before."""
+    finite = ~np.isnan(values)
+    centered = np.where(finite, values - center, 0.0)
+    frame = pd.DataFrame(
+        np.hstack(
+            [
+                finite.astype(np.float64),
+                centered,
+                np.square(centered),
+                np.where(finite, values, np.inf),
+                np.where(finite, values, -np.inf),
+            ]
+        )
+    )
+    groups = frame.groupby(codes, sort=False)
+    columns = values.shape[1]
+    sums = groups.cumsum().to_numpy()
+    return {
+        "count": sums[:, :columns] + base["count"][codes],
+        "sum": sums[:, columns : 2 * columns] + base["sum"][codes],
+        "squares": sums[:, 2 * columns : 3 * columns] + base["squares"][codes],
+        "min": np.minimum(
+            groups[list(range(3 * columns, 4 * columns))].cummin().to_numpy(),
+            base["min"][codes],
+        ),
+        "max": np.maximum(
+            groups[list(range(4 * columns, 5 * columns))].cummax().to_numpy(),
+            base["max"][codes],
+        ),
+    }
+
+
+def _expanding(
+    totals: Dict[str, np.ndarray], statistics: List[str], center: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """The statistics of every set value of the series up to each row, NaN before its first value."""
+    counts = totals["count"]
+    expanded = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "mean" in statistics:
+            expanded["mean"] = np.where(
+                counts > 0, totals["sum"] / counts + center, np.nan
+            )
+        if "std" in statistics:
+            variances = (totals["squares"] - np.square(totals["sum"]) / counts) / (
+                counts - 1
+            )
+            expanded["std"] = np.where(
+                counts > 1, np.sqrt(np.maximum(variances, 0)), np.nan
+            )
+    for statistic in {"min", "max"}.intersection(statistics):
+        expanded[statistic] = np.where(counts > 0, totals[statistic], np.nan)
+    return {statistic: expanded[statistic] for statistic in statistics}
+
+
+class WindowFeatures(PreprocessorBase):
+    """A preprocessor that adds lag, rolling window, and expanding window features of many columns of many series.
+
+    All the series of a long-format DataFrame are featurized in a single vectorized pass over arrays sorted by series:
+    lags are shifted slices, rolling means and standard deviations are differences of cumulative sums, rolling minimums
+    and maximums reduce strided views of every window, and expanding statistics are running totals per series. Rolling
+    and expanding features only use rows up to `shift` rows before each row, so that they don't leak the value they are
+    used to predict. Features that would need history a series doesn't have are NaN.
+
+    The preprocessor keeps the latest rows and the running totals of every series it's fitted on, so that `update` adds
+    the features of new rows without featurizing the whole history again.
+
+    :param columns: The columns to featurize. Defaults to every numeric column other than `id_column` and `time_column`.
+    :type columns: list[str], optional
+    :param lags: The lags to add for each column. Defaults to 1.
+    :type lags: list[int], optional
+    :param windows: The sizes of the rolling windows to add the statistics of for each column. Defaults to none.
+    :type windows: list[int], optional
+    :param statistics: The statistics of the rolling and expanding windows, any of `mean`, `std`, `min`, and `max`.
+    Defaults to all of them.
+    :type statistics: list[str], optional
+    :param expanding: Whether to add the statistics of every row of the series so far. Defaults to False.
+    :type expanding: bool, optional
+    :param shift: The number of rows between the end of the rolling and expanding windows and each row. Defaults to 1.
+    :type shift: int, optional
+    :param id_column: The column that identifies each series. Defaults to the whole DataFrame being a single series.
+    :type id_column: str, optional
+    :param time_column: The column the rows of each series are ordered by. Defaults to the order of the rows.
+    :type time_column: str, optional
+    :raises ValueError: If a statistic isn't supported, or a lag, window, or shift is out of range.
+    """
+
+    name: str = "Window Features"
+
+    primary_type: str = "x"
+    secondary_type: str = "featurize"
+    tertiary_type: str = "time series"
+
+    hyperparameters: dict = {}
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        lags: Optional[List[int]] = None,
+        windows: Optional[List[int]] = None,
+        statistics: Optional[List[str]] = None,
+        expanding: bool = False,
+        shift: int = 1,
+        id_column: Optional[str] = None,
+        time_column: Optional[str] = None,
+        **kwargs,
+    ):
+        self.columns = columns
+        self.lags = [1] if lags is None else list(lags)
+        self.windows = list(windows or [])
+        self.statistics = list(statistics or window_statistics)
+        self.expanding = expanding
+        self.shift = shift
+        self.id_column = id_column
+        self.time_column = time_column
+        self.state = None
+
+        unsupported = set(self.statistics) - set(window_statistics)
+        if unsupported:
+            raise ValueError(
+                f"The statistics {sorted(unsupported)} aren't supported, choose from {window_statistics}."
+            )
+        if any(lag < 0 for lag in self.lags) or shift < 0:
+            raise ValueError("Lags and the shift can't be negative.")
+        if any(window < 1 for window in self.windows):
+            raise ValueError("Windows must have at least one row.")
+
+        parameters = {
+            "columns": columns,
+            "lags": self.lags,
+            "windows": self.windows,
+            "statistics": self.statistics,
+            "expanding": expanding,
+            "shift": shift,
+            "id_column": id_column,
+            "time_column": time_column,
+        }
+        parameters.update(kwargs)
+
+        super().__init__(preprocessor=None, parameters=parameters)
+
+    @property
+    def lookback(self) -> int:
+        """The number of latest rows of each series kept to featurize new rows."""
+        needed = self.lags + [window + self.shift - 1 for window in self.windows]
+        if self.expanding:
+            needed.append(self.shift)
+        return max(needed, default=0)
+
+    @property
+    def feature_names(self) -> List[str]:
+        """The names of the features added for each featurized column, in order."""
+        names = [f"lag_{lag}" for lag in self.lags]
+        for window in self.windows:
+            names.extend(
+                f"rolling_{statistic}_{window}" for statistic in self.statistics
+            )
+        if self.expanding:
+            names.extend(f"expanding_{statistic}" for statistic in self.statistics)
+        return names
+
+    def _featurized_columns(self, x: pd.DataFrame) -> List[str]:
+        if self.columns is not None:
+            return list(self.columns)
+        return [
+            column
+            for column in x.select_dtypes("number").columns
+            if column not in (self.id_column, self.time_column)
+        ]
+
+    def _empty_state(self, x: pd.DataFrame) -> dict:
+        columns = self._featurized_columns(x)
+        values = x[columns].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Columns without any set value are centered on zero.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            center = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else 0.0
+        num_columns = len(columns)
+        return {
+            "columns": columns,
+            "center": np.zeros(num_columns) + center,
+            "ids": pd.Index([]),
+            "tail_values": np.empty((0, num_columns)),
+            "tail_codes": np.empty(0, dtype=np.int64),
+            "tail_times": None,
+            "base": {
+                "count": np.empty((0, num_columns)),
+                "sum": np.empty((0, num_columns)),
+                "squares": np.empty((0, num_columns)),
+                "min": np.empty((0, num_columns)),
+                "max": np.empty((0, num_columns)),
+            },
+        }
+
+    def _featurize(self, x: pd.DataFrame, state: dict) -> Tuple[np.ndarray, dict]:
+        """The features of the rows of x following the rows kept in the state, and the state after those rows."""
+        columns, center = state["columns"], state["center"]
+        num_rows, num_columns = len(x), len(columns)
+
+        ids = state["ids"]
+        row_ids = x[self.id_column].to_numpy() if self.id_column else np.zeros(num_rows)
+        ids = ids.append(pd.Index(pd.unique(row_ids)).difference(ids, sort=False))
+        row_codes = ids.get_indexer(row_ids)
+        base = {
+            total: np.vstack(
+                [
+                    values,
+                    np.full(
+                        (len(ids) - len(values), num_columns),
+                        {"min": np.inf, "max": -np.inf}.get(total, 0.0),
+                    ),
+                ]
+            )
+            for total, values in state["base"].items()
+        }
+
+        # The kept rows of the series in x come first, followed by the new rows, sorted by series and time.
+        kept = np.isin(state["tail_codes"], row_codes)
+        codes = np.concatenate([state["tail_codes"][kept], row_codes])
+        values = np.vstack(
+            [state["tail_values"][kept], x[columns].to_numpy(dtype=np.float64)]
+        )
+        is_new = np.repeat([False, True], [int(kept.sum()), num_rows])
+        if self.time_column:
+            row_times = x[self.time_column].to_numpy()
+            times = (
+                row_times
+                if state["tail_times"] is None
+                else np.concatenate([state["tail_times"][kept], row_times])
+            )
+            order = np.lexsort((times, is_new, codes))
+            times = times[order]
+        else:
+            times = None
+            order = np.lexsort((is_new, codes))
+        codes, values, is_new = codes[order], values[order], is_new[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        lengths = np.diff(np.r_[starts, len(codes)])
+        positions = np.arange(len(codes)) - np.repeat(starts, lengths)
+
+        features = [_lag(values, positions, lag) for lag in self.lags]
+        for window in self.windows:
+            rolled = _rolling(values, positions, window, self.statistics, center)
+            features.extend(
+                _lag(rolled[statistic], positions, self.shift)
+                for statistic in self.statistics
+            )
+        totals = {}
+        if self.expanding:
+            totals = _expanding_totals(values, codes, base, center)
+            expanded = _expanding(totals, self.statistics, center)
+            features.extend(
+                _lag(expanded[statistic], positions, self.shift)
+                for statistic in self.statistics
+            )
+
+        # Rows of x go back to their original order, with the features of each column next to each other.
+        new_rows = np.empty(num_rows, dtype=np.int64)
+        new_rows[order[is_new] - int(kept.sum())] = np.flatnonzero(is_new)
+        stacked = (
+            np.stack(features, axis=2)[new_rows].reshape(num_rows, -1)
+            if features
+            else np.empty((num_rows, 0))
+        )
+
+        # The latest rows of each series are kept, and the rows before them folded into the running totals.
+        tail_starts = starts + np.maximum(lengths - self.lookback, 0)
+        folded = tail_starts > starts
+        for total, running in totals.items():
+            base[total][codes[starts[folded]]] = running[tail_starts[folded] - 1]
+        tail = np.flatnonzero(positions >= np.repeat(tail_starts - starts, lengths))
+        new_state = {
+            "columns": columns,
+            "center": center,
+            "ids": ids,
+            "tail_values": np.vstack([state["tail_values"][~kept], values[tail]]),
+            "tail_codes": np.concatenate([state["tail_codes"][~kept], codes[tail]]),
+            "tail_times": None
+            if times is None
+            else np.concatenate(
+                [
+                    times[:0]
+                    if state["tail_times"] is None
+                    else state["tail_times"][~kept],
+                    times[tail],
+                ]
+            ),
+            "base": base,
+        }
+        return stacked, new_state
+
+    def _features_frame(
+        self, x: pd.DataFrame, features: np.ndarray, columns: list
+    ) -> pd.DataFrame:
+        names = [
+            f"{column}_{feature}"
+            for column in columns
+            for feature in self.feature_names
+        ]
+        return pd.concat(
+            [x, pd.DataFrame(features, columns=names, index=x.index)], axis=1
+        )
+
+    def fit(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Any = None,
+    ) -> PreprocessorBase:
+        """Fits on the data using the preprocessor, keeping the latest rows and running totals of every series.
+
+        :param x: The data for the preprocessor to fit on.
+        :type x: pd.DataFrame or np.ndarray
+        :param y: The targets for the preprocessor to fit on. Ignored.
+        :type y: pd.Series or np.array
+        """
+        x = pd.DataFrame(x)
+        _, self.state = self._featurize(x, self._empty_state(x))
+        return self
+
+    def transform(
+        self,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Any = None,
+    ) -> Tuple[pd.DataFrame, Any]:
+        """Transforms the data using the preprocessor, featurizing every series of x from its first row.
+
+        :param x: The data for the preprocessor to transform.
+        :type x: pd.DataFrame or np.ndarray
+        :param y: The targets for the preprocessor to transform. Returned unchanged.
+        :type y: pd.Series or np.array
+        :return: The data with the features of every featurized column appended, and the targets.
+        :rtype tuple:
+        """
+        x = pd.DataFrame(x)
+        state = self._empty_state(x)
+        if self.state is not None:
+            state.update(columns=self.state["columns"], center=self.state["center"])
+        features, _ = self._featurize(x, state)
+        return self._features_frame(x, features, state["columns"]), y
+
+    def update(
+        self,
+        x_new: Union[pd.DataFrame, np.ndarray],
+        y_new: Any = None,
+    ) -> Tuple[pd.DataFrame, Any]:
+        """Featurizes new rows that follow the rows the preprocessor has seen, and adds them to what it has seen.
+
+        Only the latest rows and running totals of each series are used, so streaming rows costs the same however long
+        the series are. New series start from no history.
+
+        :param x_new: The new rows of one or more series.
+        :type x_new: pd.DataFrame or np.ndarray
+        :param y_new: The targets of the new rows. Returned unchanged.
+        :type y_new: pd.Series or np.array
+        :return: The new rows with the features of every featurized column appended, and the targets.
+        :rtype tuple:
+        :raises ValueError: If the preprocessor hasn't been fitted.
+        """
+        if self.state is None:
+            raise ValueError("The preprocessor must be fitted before it's updated.")
+        x_new = pd.DataFrame(x_new)
+        features, self.state = self._featurize(x_new, self.state)
+        return self._features_frame(x_new, features, self.state["columns"]), y_new
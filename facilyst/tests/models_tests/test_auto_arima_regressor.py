@@ -1,3 +1,7 @@
+import numpy as np
+import pytest
+from statsforecast.arima import arima_like, make_arima
+
 from facilyst.models import AutoARIMARegressor
 
 
@@ -11,3 +15,41 @@ def test_auto_arima_time_series_regressor_class_variables():
         "seasonal",
         "nmodels",
     ]
+
+
+@pytest.mark.parametrize("with_features", [True, False])
+def test_auto_arima_update_filters_like_a_full_pass(with_features):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(90, 1))
+    y = np.cumsum(rng.normal(size=90)) + 10 + 2 * x[:, 0]
+    features = x if with_features else None
+
+    model = AutoARIMARegressor().fit(y[:80], None if features is None else x[:80])
+    model.update(y[80:], None if features is None else x[80:])
+
+    fitted = model.model.model_
+    coefficients = np.array(list(fitted["coef"].values()))
+    num_arma = sum(fitted["arma"][:4])
+    y_filtered = y - x @ coefficients[num_arma:] if with_features else y.copy()
+    state_space = fitted["model"]
+    expected = make_arima(
+        state_space["phi"], state_space["theta"], state_space["delta"]
+    )
+    arima_like(
+        y_filtered,
+        expected["phi"],
+        expected["theta"],
+        expected["delta"],
+        expected["a"],
+        expected["P"],
+        expected["Pn"],
+        0,
+        False,
+    )
+    np.testing.assert_allclose(state_space["a"], expected["a"])
+    np.testing.assert_allclose(state_space["P"], expected["P"])
+    np.testing.assert_array_equal(fitted["x"], y)
+
+    if with_features:
+        with pytest.raises(ValueError, match="must have the features"):
+            model.update(y[:2])
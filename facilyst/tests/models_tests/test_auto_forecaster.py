@@ -0,0 +1,164 @@
+import numpy as np
+import pytest
+
+from facilyst.models import (
+    AutoETSRegressor,
+    AutoForecasterRegressor,
+    CrostonOptimizedRegressor,
+    TSBRegressor,
+)
+from facilyst.models.regressors.time_series.auto_forecaster import (
+    _score_candidates,
+    _weighted_median,
+)
+
+
+def test_auto_forecaster_time_series_regressor_class_variables():
+    assert AutoForecasterRegressor.name == "Auto Forecaster Regressor"
+    assert AutoForecasterRegressor.primary_type == "time series"
+    assert AutoForecasterRegressor.secondary_type == "regression"
+    assert AutoForecasterRegressor.tertiary_type == "automatic"
+    assert list(AutoForecasterRegressor.hyperparameters.keys()) == [
+        "ensemble",
+        "prune_ratio",
+    ]
+
+
+def _series(length=100):
+    rng = np.random.default_rng(0)
+    return 20 + np.cumsum(rng.normal(size=length))
+
+
+def test_auto_forecaster_selects_the_best_candidate():
+    y = _series()
+    candidates = [AutoETSRegressor(), CrostonOptimizedRegressor(), TSBRegressor()]
+    model = AutoForecasterRegressor(
+        candidates=candidates, holdout=10, demand_routing=False
+    ).fit(y)
+
+    errors = _score_candidates(candidates, y, None, 0, 10)
+    assert len(model.selected_models) == 1
+    assert model.selected_models[0].name == candidates[np.argmin(errors)].name
+    expected = (
+        type(candidates[np.argmin(errors)])().fit(y).predict(horizon=5, as_array=True)
+    )
+    np.testing.assert_allclose(model.predict(horizon=5, as_array=True), expected)
+    # The templates passed as candidates aren't fitted.
+    assert all(getattr(each.model, "model_", None) is None for each in candidates)
+
+
+def test_auto_forecaster_prunes_losing_candidates():
+    y = _series()
+    candidates = [AutoETSRegressor(), CrostonOptimizedRegressor(), TSBRegressor()]
+    errors = np.array(_score_candidates(candidates, y, None, 0, 10))
+
+    model = AutoForecasterRegressor(
+        candidates=candidates,
+        holdout=10,
+        rounds=1,
+        prune_ratio=1.0,
+        ensemble=True,
+        demand_routing=False,
+    ).fit(y)
+    assert [each.name for each in model.selected_models] == [
+        candidates[np.argmin(errors)].name
+    ]
+
+    model = AutoForecasterRegressor(
+        candidates=candidates,
+        holdout=10,
+        rounds=1,
+        prune_ratio=np.inf,
+        ensemble=True,
+        demand_routing=False,
+    ).fit(y)
+    assert [each.name for each in model.selected_models] == [
+        candidates[index].name for index in np.argsort(errors, kind="stable")
+    ]
+    weights = model.model.model_["weights"]
+    np.testing.assert_allclose(weights.sum(), 1)
+    assert np.all(np.diff(weights) <= 0)
+
+
+def test_auto_forecaster_ensemble_is_a_weighted_median():
+    values = np.array([[1.0, 5.0], [2.0, 1.0], [10.0, 3.0]])
+    np.testing.assert_array_equal(
+        _weighted_median(values, np.array([1 / 3, 1 / 3, 1 / 3])), [2.0, 3.0]
+    )
+    np.testing.assert_array_equal(
+        _weighted_median(values, np.array([0.1, 0.1, 0.8])), [10.0, 3.0]
+    )
+
+    y = _series()
+    model = AutoForecasterRegressor(
+        candidates=["sparse"], holdout=10, prune_ratio=np.inf, ensemble=True
+    ).fit(y)
+    forecasts = np.stack(
+        [each.predict(horizon=3, as_array=True) for each in model.selected_models]
+    )
+    predictions = model.predict(horizon=3, as_array=True)
+    assert len(model.selected_models) == 4
+    assert np.all(
+        (predictions >= forecasts.min(axis=0)) & (predictions <= forecasts.max(axis=0))
+    )
+
+
+def test_auto_forecaster_routes_by_demand_class():
+    rng = np.random.default_rng(0)
+    intermittent = rng.poisson(4, size=100) * (rng.random(100) < 0.3)
+    candidates = [AutoETSRegressor(), CrostonOptimizedRegressor(), TSBRegressor()]
+
+    model = AutoForecasterRegressor(
+        candidates=candidates, holdout=10, prune_ratio=np.inf, ensemble=True
+    ).fit(intermittent)
+    assert model.demand_class in ["intermittent", "lumpy"]
+    assert {each.name for each in model.selected_models} == {
+        "Croston Optimized Regressor",
+        "TSB Regressor",
+    }
+
+    model = AutoForecasterRegressor(
+        candidates=candidates, holdout=10, prune_ratio=np.inf, ensemble=True
+    ).fit(_series())
+    assert model.demand_class == "smooth"
+    assert [each.name for each in model.selected_models] == ["AutoETS Regressor"]
+
+    # Without a candidate suited to the series, every candidate is scored.
+    model = AutoForecasterRegressor(candidates=["AutoETS Regressor"], holdout=10).fit(
+        intermittent
+    )
+    assert [each.name for each in model.selected_models] == ["AutoETS Regressor"]
+
+
+def test_auto_forecaster_short_series_and_failures():
+    # Too short to score, so the first candidate that can be fitted wins.
+    model = AutoForecasterRegressor(
+        candidates=["AutoETS Regressor", "Croston Optimized Regressor"],
+        demand_routing=False,
+    ).fit(np.array([1.0, 2.0, 3.0]))
+    assert model.selected_models[0].name == "Croston Optimized Regressor"
+
+    with pytest.raises(ValueError, match="None of the candidate models"):
+        AutoForecasterRegressor(candidates=["AutoETS Regressor"]).fit(np.array([1.0]))
+    with pytest.raises(ValueError, match="No candidate time series models"):
+        AutoForecasterRegressor(candidates=["Auto Forecaster"]).fit(_series())
+
+
+def test_auto_forecaster_candidates_detect_season_length():
+    rng = np.random.default_rng(0)
+    times = np.arange(60)
+    y = 20 + 3 * np.sin(2 * np.pi * times / 4) + rng.normal(0, 0.3, 60)
+
+    model = AutoForecasterRegressor(
+        candidates=["AutoETS Regressor"], holdout=10, demand_routing=False
+    ).fit(y)
+    assert model.parameters["season_length"] is None
+    assert model.selected_models[0].model.season_length == 4
+
+    model = AutoForecasterRegressor(
+        candidates=["AutoETS Regressor"],
+        season_length=1,
+        holdout=10,
+        demand_routing=False,
+    ).fit(y)
+    assert model.selected_models[0].model.season_length == 1
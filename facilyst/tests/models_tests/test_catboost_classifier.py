@@ -43,5 +43,20 @@ def test_catboost_classifier(
     assert catboost_classifier.get_params() == {
         "n_estimators": 50,
         "allow_writing_files": False,
+        "thread_count": -1,
         "random_state": 0,
     }
+
+
+def test_catboost_classifier_native_cache(numeric_features_binary_classification):
+    x, y = numeric_features_binary_classification
+
+    expected_predictions = CatBoostClassifier().fit(x, y).predict(x)
+
+    catboost_classifier = CatBoostClassifier()
+    catboost_classifier.enable_native_cache()
+    catboost_classifier.fit(x, y)
+    pd.testing.assert_series_equal(catboost_classifier.predict(x), expected_predictions)
+    assert catboost_classifier.predict_proba(x).shape == (100, 2)
+    assert len(catboost_classifier.native_cache) == 2
+    assert catboost_classifier.native_cache.hits == 1
@@ -35,5 +35,31 @@ def test_catboost_regressor(numeric_features_regression):
         "loss_function": "RMSE",
         "n_estimators": 50,
         "allow_writing_files": False,
+        "thread_count": -1,
         "random_state": 0,
     }
+
+
+def test_catboost_regressor_native_cache(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    expected_predictions = CatBoostRegressor().fit(x, y).predict(x)
+
+    catboost_regressor = CatBoostRegressor()
+    catboost_regressor.enable_native_cache()
+    catboost_regressor.fit(x, y)
+    pd.testing.assert_series_equal(catboost_regressor.predict(x), expected_predictions)
+    catboost_regressor.predict(x)
+    assert isinstance(catboost_regressor.score(x, y), float)
+    assert len(catboost_regressor.native_cache) == 3
+    assert catboost_regressor.native_cache.hits == 1
+
+
+def test_catboost_regressor_early_stopping(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    catboost_regressor = CatBoostRegressor(n_estimators=300)
+    catboost_regressor.fit(x, y, early_stopping_rounds=5)
+
+    assert catboost_regressor.best_iteration is not None
+    assert catboost_regressor.model.tree_count_ == catboost_regressor.best_iteration + 1
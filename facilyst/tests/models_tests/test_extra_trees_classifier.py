@@ -60,3 +60,14 @@ def test_extra_trees_classifier(
         "verbose": 0,
         "warm_start": False,
     }
+
+
+def test_extra_trees_classifier_prune(numeric_features_binary_classification):
+    x, y = numeric_features_binary_classification
+
+    et_classifier = ExtraTreesClassifier(n_estimators=30, n_jobs=1).fit(x, y)
+    pruned = et_classifier.prune(x, y, max_estimators=3)
+
+    assert isinstance(pruned, ExtraTreesClassifier)
+    assert pruned.pruning_summary["n_estimators"] <= 3
+    assert len(et_classifier.model.estimators_) == 30
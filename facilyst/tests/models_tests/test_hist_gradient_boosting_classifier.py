@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import HistGradientBoostingClassifier
+
+
+def test_hist_gradient_boosting_classifier_class_variables():
+    assert HistGradientBoostingClassifier.name == "Hist Gradient Boosting Classifier"
+    assert HistGradientBoostingClassifier.primary_type == "classification"
+    assert HistGradientBoostingClassifier.secondary_type == "ensemble"
+    assert HistGradientBoostingClassifier.tertiary_type == "tree"
+    assert list(HistGradientBoostingClassifier.hyperparameters.keys()) == [
+        "max_iter",
+        "learning_rate",
+        "max_leaf_nodes",
+        "min_samples_leaf",
+        "l2_regularization",
+    ]
+
+
+@pytest.mark.parametrize("classification_type", ["binary", "multiclass"])
+def test_hist_gradient_boosting_classifier(
+    classification_type,
+    numeric_features_binary_classification,
+    numeric_features_multi_classification,
+):
+    x, y = (
+        numeric_features_binary_classification
+        if classification_type == "binary"
+        else numeric_features_multi_classification
+    )
+
+    hgb_classifier = HistGradientBoostingClassifier()
+    hgb_classifier.fit(x, y)
+    hgb_predictions = hgb_classifier.predict(x)
+
+    assert isinstance(hgb_predictions, pd.Series)
+    assert len(hgb_predictions) == 100
+
+    score = hgb_classifier.score(x, y)
+    assert isinstance(score, float)
+
+    assert hgb_classifier.get_params() == {
+        "categorical_features": None,
+        "class_weight": None,
+        "early_stopping": "auto",
+        "interaction_cst": None,
+        "l2_regularization": 0.0,
+        "learning_rate": 0.1,
+        "loss": "log_loss",
+        "max_bins": 255,
+        "max_depth": None,
+        "max_iter": 100,
+        "max_leaf_nodes": 31,
+        "min_samples_leaf": 20,
+        "monotonic_cst": None,
+        "n_iter_no_change": 10,
+        "random_state": 0,
+        "scoring": "loss",
+        "tol": 1e-07,
+        "validation_fraction": 0.1,
+        "verbose": 0,
+        "warm_start": False,
+    }
+
+
+def test_hist_gradient_boosting_classifier_categorical_features():
+    rng = np.random.default_rng(0)
+    x = pd.DataFrame(
+        {
+            "numeric": rng.normal(size=300),
+            "color": rng.choice(["red", "green", "blue"], size=300),
+        }
+    )
+    y = (x["color"] == "red").astype(int)
+
+    hgb_classifier = HistGradientBoostingClassifier(min_samples_leaf=5)
+    hgb_classifier.fit(x, y)
+
+    assert hgb_classifier.model.categorical_features == [False, True]
+    assert hgb_classifier.score(x, y) == 1.0
+    probabilities = hgb_classifier.predict_proba(x)
+    assert probabilities.shape == (300, 2)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from facilyst.models import HistGradientBoostingRegressor
+
+
+def test_hist_gradient_boosting_regressor_class_variables():
+    assert HistGradientBoostingRegressor.name == "Hist Gradient Boosting Regressor"
+    assert HistGradientBoostingRegressor.primary_type == "regression"
+    assert HistGradientBoostingRegressor.secondary_type == "ensemble"
+    assert HistGradientBoostingRegressor.tertiary_type == "tree"
+    assert list(HistGradientBoostingRegressor.hyperparameters.keys()) == [
+        "max_iter",
+        "learning_rate",
+        "max_leaf_nodes",
+        "min_samples_leaf",
+        "l2_regularization",
+    ]
+
+
+def test_hist_gradient_boosting_regressor(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    hgb_regressor = HistGradientBoostingRegressor()
+    hgb_regressor.fit(x, y)
+    hgb_predictions = hgb_regressor.predict(x)
+
+    assert isinstance(hgb_predictions, pd.Series)
+    assert len(hgb_predictions) == 100
+
+    score = hgb_regressor.score(x, y)
+    assert isinstance(score, float)
+
+    assert hgb_regressor.get_params() == {
+        "categorical_features": None,
+        "early_stopping": "auto",
+        "interaction_cst": None,
+        "l2_regularization": 0.0,
+        "learning_rate": 0.1,
+        "loss": "squared_error",
+        "max_bins": 255,
+        "max_depth": None,
+        "max_iter": 100,
+        "max_leaf_nodes": 31,
+        "min_samples_leaf": 20,
+        "monotonic_cst": None,
+        "n_iter_no_change": 10,
+        "quantile": None,
+        "random_state": 0,
+        "scoring": "loss",
+        "tol": 1e-07,
+        "validation_fraction": 0.1,
+        "verbose": 0,
+        "warm_start": False,
+    }
+
+
+def test_hist_gradient_boosting_regressor_categorical_features():
+    rng = np.random.default_rng(0)
+    colors = rng.choice(["red", "green", "blue"], size=300)
+    x = pd.DataFrame(
+        {
+            "numeric": rng.normal(size=300),
+            "color": pd.Categorical(colors),
+            "size": rng.choice(["small", "large"], size=300),
+        }
+    )
+    y = np.select([colors == "red", colors == "green"], [10.0, -10.0], 0.0)
+
+    hgb_regressor = HistGradientBoostingRegressor(min_samples_leaf=5)
+    hgb_regressor.fit(x, y)
+
+    assert hgb_regressor.model.categorical_features == [False, True, True]
+    assert list(hgb_regressor.categories) == ["color", "size"]
+    assert hgb_regressor.score(x, y) > 0.95
+
+    x_unseen = x.head(3).assign(color=["purple", "red", "green"])
+    predictions = hgb_regressor.predict(x_unseen)
+    assert len(predictions) == 3
+    assert predictions.iloc[1] > 5 and predictions.iloc[2] < -5
+
+    hgb_regressor.fit(x[["numeric"]], y)
+    assert hgb_regressor.model.categorical_features is None
+    assert hgb_regressor.categories == {}
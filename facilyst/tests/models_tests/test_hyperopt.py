@@ -1,6 +1,10 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
+from facilyst.models import EnsembleModelBase, VotingRegressor
 from facilyst.models.optimizers.hyperopt import HyperoptOptimizer
 from facilyst.models.utils import get_models
 
@@ -40,3 +44,99 @@ def test_hyperopt(numeric_features_regression):
     expected_model = next(iter(get_models("Random Forest Regressor")))
     assert isinstance(best_model, expected_model)
     assert isinstance(best_score, float)
+
+
+def test_hyperopt_invalid_metric():
+    with pytest.raises(ValueError, match="The metric `not_a_metric` isn't recognized!"):
+        HyperoptOptimizer(regressor="Random Forest Regressor", metric="not_a_metric")
+
+
+@pytest.mark.parametrize("metric", ["rmse", "r2"])
+def test_hyperopt_metric(metric):
+    x = pd.DataFrame({"Col_1": [i for i in range(100)]})
+    y = pd.Series([i for i in range(100)])
+
+    opt = HyperoptOptimizer(
+        regressor="Random Forest Regressor",
+        iterations_per_model={"Random Forest Regressor": 3},
+        metric=metric,
+    )
+    _, best_score = opt.optimize(x, y)
+
+    if metric == "rmse":
+        assert best_score >= 0
+    else:
+        assert best_score <= 0
+
+
+@pytest.mark.needs_extra_dependency
+def test_hyperopt_early_stopping():
+    x = pd.DataFrame({"Col_1": [i for i in range(200)]})
+    y = pd.Series([i % 10 for i in range(200)], dtype=float)
+
+    opt = HyperoptOptimizer(
+        regressor="XGBoost Regressor",
+        iterations_per_model={"XGBoost Regressor": 3},
+        early_stopping_rounds=2,
+    )
+    best_model, _ = opt.optimize(x, y)
+
+    best_hyperparameters = opt.results["XGBoost Regressor"]["best_hyperparameters"]
+    assert best_model.parameters["n_estimators"] == best_hyperparameters["n_estimators"]
+    assert best_hyperparameters["n_estimators"] <= 300
+
+
+def test_hyperopt_ensembles():
+    opt = HyperoptOptimizer(regressor="ensemble")
+    assert opt.collected_models
+    assert not any(
+        issubclass(each_model, EnsembleModelBase) for each_model in opt.collected_models
+    )
+
+    x = pd.DataFrame({"Col_1": [i for i in range(100)]})
+    y = pd.Series([i for i in range(100)])
+    opt = HyperoptOptimizer(regressor="Voting Regressor")
+    assert opt.collected_models == {VotingRegressor}
+    opt.optimize(x, y)
+    assert opt.results["Voting Regressor"]["best_hyperparameters"] == {}
+
+
+def test_hyperopt_aoptimize_streams_trials():
+    x = pd.DataFrame({"Col_1": [i for i in range(100)]})
+    y = pd.Series([i for i in range(100)])
+
+    opt = HyperoptOptimizer(
+        regressor="Random Forest Regressor",
+        iterations_per_model={"Random Forest Regressor": 3},
+    )
+
+    async def run():
+        return [trial async for trial in opt.aoptimize(x, y)]
+
+    trials = asyncio.run(run())
+    assert [trial["trial"] for trial in trials] == [1, 2, 3]
+    assert all(trial["model"] == "Random Forest Regressor" for trial in trials)
+    assert opt.best_score == round(min(trial["loss"] for trial in trials), 3)
+    assert isinstance(opt.best_model, next(iter(get_models("Random Forest Regressor"))))
+
+
+def test_hyperopt_aoptimize_stops_when_closed():
+    x = pd.DataFrame({"Col_1": [i for i in range(100)]})
+    y = pd.Series([i for i in range(100)])
+
+    opt = HyperoptOptimizer(
+        regressor="Random Forest Regressor",
+        iterations_per_model={"Random Forest Regressor": 50},
+    )
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def run():
+        trials = opt.aoptimize(x, y, executor=executor)
+        first_trial = await trials.__anext__()
+        await trials.aclose()
+        return first_trial
+
+    assert asyncio.run(run())["trial"] == 1
+    executor.shutdown(wait=True)
+    assert opt.results["Random Forest Regressor"]["best_score"] is not None
+    assert opt.best_model is not None
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from facilyst.models import KNearestNeighborsClassifier
+
+
+def test_k_nearest_neighbors_classifier_class_variables():
+    assert KNearestNeighborsClassifier.name == "K Nearest Neighbors Classifier"
+    assert KNearestNeighborsClassifier.primary_type == "classification"
+    assert KNearestNeighborsClassifier.secondary_type == "neighbors"
+    assert KNearestNeighborsClassifier.tertiary_type == "instance"
+    assert list(KNearestNeighborsClassifier.hyperparameters.keys()) == [
+        "n_neighbors",
+        "weights",
+        "metric",
+    ]
+
+
+@pytest.mark.parametrize("classification_type", ["binary", "multiclass"])
+def test_k_nearest_neighbors_classifier(
+    classification_type,
+    numeric_features_binary_classification,
+    numeric_features_multi_classification,
+):
+    x, y = (
+        numeric_features_binary_classification
+        if classification_type == "binary"
+        else numeric_features_multi_classification
+    )
+
+    knn_classifier = KNearestNeighborsClassifier()
+    knn_classifier.fit(x, y)
+    knn_predictions = knn_classifier.predict(x)
+
+    assert isinstance(knn_predictions, pd.Series)
+    assert len(knn_predictions) == 100
+
+    score = knn_classifier.score(x, y)
+    assert isinstance(score, float)
+
+    probabilities = knn_classifier.predict_proba(x)
+    assert probabilities.shape == (100, len(set(y)))
+
+    assert knn_classifier.get_params() == {
+        "algorithm": "brute",
+        "leaf_size": 30,
+        "metric": "euclidean",
+        "metric_params": None,
+        "n_jobs": -1,
+        "n_neighbors": 5,
+        "p": 2,
+        "weights": "uniform",
+    }
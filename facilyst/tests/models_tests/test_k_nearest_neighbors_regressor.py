@@ -0,0 +1,102 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import KNearestNeighborsRegressor
+
+
+def test_k_nearest_neighbors_regressor_class_variables():
+    assert KNearestNeighborsRegressor.name == "K Nearest Neighbors Regressor"
+    assert KNearestNeighborsRegressor.primary_type == "regression"
+    assert KNearestNeighborsRegressor.secondary_type == "neighbors"
+    assert KNearestNeighborsRegressor.tertiary_type == "instance"
+    assert list(KNearestNeighborsRegressor.hyperparameters.keys()) == [
+        "n_neighbors",
+        "weights",
+        "metric",
+    ]
+
+
+def test_k_nearest_neighbors_regressor(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    knn_regressor = KNearestNeighborsRegressor()
+    knn_regressor.fit(x, y)
+    knn_predictions = knn_regressor.predict(x)
+
+    assert isinstance(knn_predictions, pd.Series)
+    assert len(knn_predictions) == 100
+    assert knn_regressor.index_type == "brute"
+
+    score = knn_regressor.score(x, y)
+    assert isinstance(score, float)
+
+    assert knn_regressor.get_params() == {
+        "algorithm": "brute",
+        "leaf_size": 30,
+        "metric": "euclidean",
+        "metric_params": None,
+        "n_jobs": -1,
+        "n_neighbors": 5,
+        "p": 2,
+        "weights": "uniform",
+    }
+
+
+@pytest.mark.parametrize(
+    "num_features, metric, expected_index",
+    [
+        (5, "euclidean", "kd_tree"),
+        (30, "euclidean", "ball_tree"),
+        (5, "haversine", "ball_tree"),
+        (80, "euclidean", "brute"),
+    ],
+)
+def test_k_nearest_neighbors_regressor_index(num_features, metric, expected_index):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2000, num_features))
+    if metric == "haversine":
+        x = x[:, :2]
+    y = x[:, 0]
+
+    knn_regressor = KNearestNeighborsRegressor(metric=metric)
+    knn_regressor.fit(x, y)
+
+    assert knn_regressor.index_type == expected_index
+    assert knn_regressor.model._fit_method == expected_index
+
+    restored_regressor = pickle.loads(pickle.dumps(knn_regressor))
+    assert restored_regressor.model._fit_method == expected_index
+    if expected_index != "brute":
+        assert restored_regressor.model._tree is not None
+    np.testing.assert_array_equal(
+        restored_regressor.predict(x[:50], as_array=True),
+        knn_regressor.predict(x[:50], as_array=True),
+    )
+
+
+def test_k_nearest_neighbors_regressor_explicit_algorithm():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2000, 5))
+
+    knn_regressor = KNearestNeighborsRegressor(algorithm="brute")
+    knn_regressor.fit(x, x[:, 0])
+    assert knn_regressor.index_type == "brute"
+
+
+@pytest.mark.needs_extra_dependency
+def test_k_nearest_neighbors_regressor_approximate():
+    pytest.importorskip("pynndescent")
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2000, 60))
+    y = x[:, 0]
+
+    knn_regressor = KNearestNeighborsRegressor(approximate=True, n_jobs=1)
+    knn_regressor.fit(x, y)
+
+    assert knn_regressor.index_type == "approximate"
+    predictions = knn_regressor.predict(x[:20], as_array=True)
+    assert predictions.shape == (20,)
+    assert isinstance(knn_regressor.score(x[:20], y[:20]), float)
@@ -1,9 +1,19 @@
+import asyncio
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from facilyst.models import CatBoostClassifier
-from facilyst.models.utils import get_models
+from facilyst.models import (
+    CatBoostClassifier,
+    RandomForestClassifier,
+    RandomForestRegressor,
+    VotingRegressor,
+)
+from facilyst.models.utils import get_models, load_model
+from facilyst.utils import execution_context
+from facilyst.utils.cache_utils import ModelCache
 
 
 def test_models_equivalency(mock_regression_model_class, mock_time_series_model_class):
@@ -93,3 +103,220 @@ def test_estimators_classifiers_sk_equivalent(
 
     score = classifier.score(x, y)
     assert isinstance(score, float)
+
+
+def test_models_thread_budget(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    rf_regressor = RandomForestRegressor(n_estimators=10, n_jobs=8)
+    with execution_context(n_jobs=2):
+        assert rf_regressor._thread_budget_parameters(2) == {"n_jobs": 2}
+        with rf_regressor._thread_budget():
+            assert rf_regressor.model.n_jobs == 2
+        rf_regressor.fit(x, y)
+    assert rf_regressor.model.n_jobs == 8
+
+    rf_regressor = RandomForestRegressor(n_estimators=10, n_jobs=1)
+    assert rf_regressor._thread_budget_parameters(4) == {"n_jobs": 1}
+
+    voting_regressor = VotingRegressor(
+        members=["Decision Tree", RandomForestRegressor(n_estimators=10, n_jobs=8)]
+    )
+    assert voting_regressor._thread_budget_parameters(4) == {
+        "n_jobs": 2,
+        "random_forest_regressor__n_jobs": 2,
+    }
+    with execution_context(n_jobs=4):
+        voting_regressor.fit(x, y)
+        predictions = voting_regressor.predict(x)
+    assert len(predictions) == 100
+    assert voting_regressor.model.n_jobs == -1
+    assert voting_regressor.model.get_params()["random_forest_regressor__n_jobs"] == 8
+
+    fitted_forest = voting_regressor.model.estimators_[1]
+    fitted_forest.set_params(n_jobs=8)
+    with execution_context(n_jobs=4):
+        with voting_regressor._thread_budget():
+            assert fitted_forest.n_jobs == 2
+    assert fitted_forest.n_jobs == 8
+
+
+def test_models_predict_after_in_place_edit(numeric_features_regression):
+    x, y = numeric_features_regression
+    x = pd.DataFrame(x).copy()
+
+    rf_regressor = RandomForestRegressor(n_estimators=10).fit(x, y)
+    x_test = x.iloc[:5].copy()
+    rf_regressor.predict(x_test)
+    x_test.iloc[:, :] = x.iloc[5:10].to_numpy()
+    np.testing.assert_array_equal(
+        rf_regressor.predict(x_test).to_numpy(),
+        rf_regressor.predict(x.iloc[5:10]).to_numpy(),
+    )
+
+
+@pytest.mark.parametrize(
+    "model_class, data",
+    [
+        (RandomForestRegressor, "numeric_features_regression"),
+        (RandomForestClassifier, "numeric_features_multi_classification"),
+    ],
+)
+def test_models_prediction_cache(model_class, data, request):
+    x, y = request.getfixturevalue(data)
+
+    model = model_class(n_estimators=10)
+    model.fit(x, y)
+    expected_predictions = model.predict(x)
+    expected_score = model.score(x, y)
+    assert model.cache is None
+
+    model.enable_cache()
+    predictions = model.predict(x)
+    pd.testing.assert_series_equal(predictions, expected_predictions)
+    assert model.cache.misses == 1
+
+    predictions[0] = -100
+    pd.testing.assert_series_equal(model.predict(x.copy()), expected_predictions)
+    assert model.cache.hits == 1
+
+    assert model.score(x, y) == pytest.approx(expected_score)
+    assert model.score(x, y) == pytest.approx(expected_score)
+    assert model.cache.hits == 3
+
+    if model.primary_type == "classification":
+        probabilities = model.predict_proba(x)
+        assert list(probabilities.columns) == list(model.model.classes_)
+        pd.testing.assert_frame_equal(model.predict_proba(x), probabilities)
+
+    generation = model.fit_generation
+    model.fit(x[:50], y[:50])
+    assert model.fit_generation == generation + 1
+    assert len(model.cache) == 0
+    pd.testing.assert_series_equal(model.predict(x), pd.Series(model.model.predict(x)))
+
+    model.disable_cache()
+    assert model.cache is None
+
+
+@pytest.mark.parametrize("chunk_size", [None, 7])
+@pytest.mark.parametrize(
+    "model_class, data, metrics",
+    [
+        (RandomForestRegressor, "numeric_features_regression", None),
+        (
+            RandomForestClassifier,
+            "numeric_features_multi_classification",
+            ["accuracy", "log_loss", "auc"],
+        ),
+    ],
+)
+def test_models_evaluate(model_class, data, metrics, chunk_size, request):
+    x, y = request.getfixturevalue(data)
+
+    model = model_class(n_estimators=10)
+    model.fit(x, y)
+    results = model.evaluate(x, y, metrics=metrics, chunk_size=chunk_size)
+
+    if metrics is None:
+        assert list(results) == ["r2", "rmse", "mae"]
+    else:
+        assert list(results) == metrics
+    assert all(isinstance(value, float) for value in results.values())
+    first_metric = "r2" if metrics is None else "accuracy"
+    assert results[first_metric] == pytest.approx(model.score(x, y))
+
+
+def test_models_predict_as_array(numeric_features_multi_classification):
+    x, y = numeric_features_multi_classification
+
+    model = RandomForestClassifier(n_estimators=10)
+    model.fit(x, y)
+
+    predictions = model.predict(x, as_array=True)
+    assert isinstance(predictions, np.ndarray)
+    np.testing.assert_array_equal(predictions, model.predict(x).to_numpy())
+
+    probabilities = model.predict_proba(x, as_array=True)
+    assert isinstance(probabilities, np.ndarray)
+    np.testing.assert_array_equal(probabilities, model.predict_proba(x).to_numpy())
+
+
+def test_models_save_and_load(numeric_features_regression, tmp_path):
+    x, y = numeric_features_regression
+
+    rf_regressor = RandomForestRegressor(n_estimators=10).enable_cache().fit(x, y)
+    rf_regressor.predict(x)
+    rf_regressor.save(tmp_path / "model.pkl")
+
+    loaded_regressor = load_model(tmp_path / "model.pkl")
+    assert loaded_regressor == rf_regressor
+    assert len(loaded_regressor.cache) == 0
+    pd.testing.assert_series_equal(loaded_regressor.predict(x), rf_regressor.predict(x))
+
+    with open(tmp_path / "other.pkl", "wb") as file:
+        pickle.dump({"not": "a model"}, file)
+    with pytest.raises(ValueError, match="doesn't contain a facilyst model"):
+        load_model(tmp_path / "other.pkl")
+
+
+def test_models_afit_and_apredict(numeric_features_binary_classification):
+    x, y = numeric_features_binary_classification
+
+    async def run():
+        rf_classifier = RandomForestClassifier(n_estimators=10, random_state=0)
+        assert await rf_classifier.afit(x, y) is rf_classifier
+        return (
+            rf_classifier,
+            await rf_classifier.apredict(x, as_array=True),
+            await rf_classifier.apredict_proba(x),
+        )
+
+    rf_classifier, predictions, probabilities = asyncio.run(run())
+    np.testing.assert_array_equal(predictions, rf_classifier.predict(x, as_array=True))
+    pd.testing.assert_frame_equal(probabilities, rf_classifier.predict_proba(x))
+
+
+def test_models_fit_cache(numeric_features_regression, tmp_path, monkeypatch):
+    x, y = numeric_features_regression
+    cache = ModelCache(directory=str(tmp_path))
+
+    rf_regressor = RandomForestRegressor(n_estimators=10).enable_fit_cache(cache)
+    rf_regressor.enable_cache().fit(x, y)
+    assert cache.misses == 1 and len(cache) == 1
+    assert cache.entries()["name"][0] == "Random Forest Regressor"
+
+    cached_regressor = RandomForestRegressor(n_estimators=10).enable_fit_cache(cache)
+    monkeypatch.setattr(
+        cached_regressor.model, "fit", lambda *args: pytest.fail("Model was trained.")
+    )
+    assert cached_regressor.fit(x, y) is cached_regressor
+    assert cache.hits == 1
+    assert cached_regressor.fit_cache is cache
+    assert cached_regressor.cache is None
+    pd.testing.assert_series_equal(cached_regressor.predict(x), rf_regressor.predict(x))
+
+    RandomForestRegressor(n_estimators=5).enable_fit_cache(cache).fit(x, y)
+    RandomForestRegressor(n_estimators=10).enable_fit_cache(cache).fit(x, y + 1)
+    assert cache.misses == 3 and len(cache) == 3
+
+
+def test_time_series_models_fit_cache(time_series_data, tmp_path):
+    x_train, x_test, y_train, _ = time_series_data(num_rows=100)
+    cache = ModelCache(directory=str(tmp_path))
+    ts_model = next(iter(get_models("Croston Optimized")))
+
+    predictions = (
+        ts_model()
+        .enable_fit_cache(cache)
+        .fit(y_train=y_train, x_train=x_train)
+        .predict(horizon=len(x_test), x_test=x_test)
+    )
+    cached_predictions = (
+        ts_model()
+        .enable_fit_cache(cache)
+        .fit(y_train, x_train)
+        .predict(horizon=len(x_test), x_test=x_test)
+    )
+    assert cache.hits == 1
+    pd.testing.assert_series_equal(predictions, cached_predictions)
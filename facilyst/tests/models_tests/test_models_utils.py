@@ -1,3 +1,4 @@
+import gc
 from typing import Any, List
 
 import pytest
@@ -8,6 +9,7 @@ from facilyst.models import (
     ADIDARegressor,
     AutoARIMARegressor,
     AutoETSRegressor,
+    AutoForecasterRegressor,
     AutoThetaRegressor,
     BaggingClassifier,
     BaggingRegressor,
@@ -18,18 +20,24 @@ from facilyst.models import (
     DecisionTreeRegressor,
     ExtraTreesClassifier,
     ExtraTreesRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
     IMAPARegressor,
+    KNearestNeighborsClassifier,
+    KNearestNeighborsRegressor,
     MultiLayerPerceptronClassifier,
     MultiLayerPerceptronRegressor,
     RandomForestClassifier,
     RandomForestRegressor,
+    StackingClassifier,
+    StackingRegressor,
     TSBRegressor,
+    VotingClassifier,
+    VotingRegressor,
     XGBoostClassifier,
     XGBoostRegressor,
 )
-from facilyst.models.neural_networks.bert_classifier import (
-    BERTBinaryClassifier,
-)
+from facilyst.models.neural_networks.bert_classifier import BERTBinaryClassifier
 from facilyst.models.neural_networks.bert_qa import BERTQuestionAnswering
 from facilyst.models.utils import get_models
 
@@ -37,6 +45,7 @@ all_time_series_regressors: List[Any] = [
     ADIDARegressor,
     AutoARIMARegressor,
     AutoETSRegressor,
+    AutoForecasterRegressor,
     AutoThetaRegressor,
     CrostonOptimizedRegressor,
     IMAPARegressor,
@@ -50,8 +59,12 @@ non_time_series_regressors: List[Any] = [
     CatBoostRegressor,
     DecisionTreeRegressor,
     ExtraTreesRegressor,
+    HistGradientBoostingRegressor,
+    KNearestNeighborsRegressor,
     MultiLayerPerceptronRegressor,
     RandomForestRegressor,
+    StackingRegressor,
+    VotingRegressor,
     XGBoostRegressor,
 ]
 
@@ -64,8 +77,12 @@ all_classifiers: List[Any] = [
     CatBoostClassifier,
     DecisionTreeClassifier,
     ExtraTreesClassifier,
+    HistGradientBoostingClassifier,
+    KNearestNeighborsClassifier,
     MultiLayerPerceptronClassifier,
     RandomForestClassifier,
+    StackingClassifier,
+    VotingClassifier,
     XGBoostClassifier,
 ]
 
@@ -75,6 +92,7 @@ tree_regressors: List[Any] = [
     CatBoostRegressor,
     DecisionTreeRegressor,
     ExtraTreesRegressor,
+    HistGradientBoostingRegressor,
     RandomForestRegressor,
     XGBoostRegressor,
 ]
@@ -85,6 +103,7 @@ tree_classifiers: List[Any] = [
     CatBoostClassifier,
     DecisionTreeClassifier,
     ExtraTreesClassifier,
+    HistGradientBoostingClassifier,
     RandomForestClassifier,
     XGBoostClassifier,
 ]
@@ -147,9 +166,19 @@ def test_no_models_found_error():
         ("nlp", None, None, nlp_models),
         ("time series", None, None, all_time_series_regressors),
         ("ets", "time series", None, [AutoETSRegressor]),
+        ("voting", None, None, [VotingClassifier, VotingRegressor]),
+        ("stacking", "regression", None, [StackingRegressor]),
+        (
+            "neighbors",
+            None,
+            None,
+            [KNearestNeighborsClassifier, KNearestNeighborsRegressor],
+        ),
     ],
 )
 def test_get_models(model, problem_type, exclude, expected):
+    # The mock models of earlier tests stay subclasses of ModelBase until they are garbage collected.
+    gc.collect()
     actual_models = get_models(model, problem_type, exclude)
 
     assert actual_models == set(expected)
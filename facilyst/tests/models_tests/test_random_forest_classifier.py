@@ -61,3 +61,20 @@ def test_random_forest_classifier(
         "verbose": 0,
         "warm_start": False,
     }
+
+
+def test_random_forest_classifier_prune(numeric_features_multi_classification):
+    x, y = numeric_features_multi_classification
+
+    rf_classifier = RandomForestClassifier(n_estimators=50, n_jobs=1)
+    rf_classifier.fit(x[:70], y[:70])
+    pruned = rf_classifier.prune(x[70:], y[70:], max_estimators=5)
+
+    assert len(pruned.model.estimators_) <= 5
+    assert pruned.predict_proba(x).shape == (100, 3)
+    summary = pruned.pruning_summary
+    assert summary["score"] == pytest.approx(pruned.score(x[70:], y[70:]))
+    assert summary["score"] >= summary["original_score"] - 0.1
+
+    with pytest.raises(ValueError, match="y_val contains labels"):
+        rf_classifier.prune(x[70:], y[70:] + 10, max_estimators=5)
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from facilyst.models import RandomForestRegressor
 
@@ -50,3 +52,50 @@ def test_random_forest_regressor(numeric_features_regression):
         "verbose": 0,
         "warm_start": False,
     }
+
+
+def test_random_forest_regressor_prune():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(600, 5))
+    y = x[:, 0] * 3 + x[:, 1] + rng.normal(scale=0.1, size=600)
+
+    rf_regressor = RandomForestRegressor(n_estimators=60, n_jobs=1)
+    rf_regressor.fit(x[:400], y[:400])
+    pruned = rf_regressor.prune(x[400:], y[400:], max_estimators=10)
+
+    assert pruned is not rf_regressor
+    assert len(rf_regressor.model.estimators_) == 60
+    assert len(pruned.model.estimators_) <= 10
+    assert pruned.model.n_estimators == len(pruned.model.estimators_)
+    assert set(map(id, pruned.model.estimators_)) <= set(
+        map(id, rf_regressor.model.estimators_)
+    )
+
+    summary = pruned.pruning_summary
+    assert summary["original_n_estimators"] == 60
+    assert summary["n_estimators"] == len(pruned.model.estimators_)
+    assert summary["score"] == pytest.approx(pruned.score(x[400:], y[400:]))
+    assert summary["score_loss"] == pytest.approx(
+        summary["original_score"] - summary["score"]
+    )
+    assert summary["score_loss"] < 0.02
+
+    expected = np.mean(
+        [tree.predict(x[400:]) for tree in pruned.model.estimators_], axis=0
+    )
+    np.testing.assert_allclose(pruned.predict(x[400:], as_array=True), expected)
+
+
+def test_random_forest_regressor_prune_latency():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(300, 5))
+    y = x[:, 0]
+
+    rf_regressor = RandomForestRegressor(n_estimators=20, n_jobs=1).fit(x, y)
+    pruned = rf_regressor.prune(x, y, max_latency=1.0)
+    assert 1 <= pruned.pruning_summary["n_estimators"] <= 20
+
+    with pytest.raises(ValueError, match="No tree can predict"):
+        rf_regressor.prune(x, y, max_latency=0.0)
+    with pytest.raises(ValueError, match="Please pass `max_estimators`"):
+        rf_regressor.prune(x, y)
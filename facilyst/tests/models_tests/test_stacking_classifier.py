@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import StackingClassifier
+
+
+def test_stacking_classifier_class_variables():
+    assert StackingClassifier.name == "Stacking Classifier"
+    assert StackingClassifier.primary_type == "classification"
+    assert StackingClassifier.secondary_type == "ensemble"
+    assert StackingClassifier.tertiary_type == "stacking"
+    assert list(StackingClassifier.hyperparameters.keys()) == []
+
+
+@pytest.mark.parametrize("classification_type", ["binary", "multiclass"])
+def test_stacking_classifier(
+    classification_type,
+    numeric_features_binary_classification,
+    numeric_features_multi_classification,
+):
+    x, y = (
+        numeric_features_binary_classification
+        if classification_type == "binary"
+        else numeric_features_multi_classification
+    )
+    y = np.array(["first", "second", "third"])[y]
+
+    stacking_classifier = StackingClassifier(final_estimator="Decision Tree")
+    stacking_classifier.fit(x, y)
+    stacking_predictions = stacking_classifier.predict(x)
+
+    assert isinstance(stacking_predictions, pd.Series)
+    assert len(stacking_predictions) == 100
+    np.testing.assert_array_equal(
+        stacking_predictions.values, stacking_classifier.model.predict(x)
+    )
+
+    score = stacking_classifier.score(x, y)
+    assert isinstance(score, float)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import DecisionTreeRegressor, StackingRegressor
+
+
+def test_stacking_regressor_class_variables():
+    assert StackingRegressor.name == "Stacking Regressor"
+    assert StackingRegressor.primary_type == "regression"
+    assert StackingRegressor.secondary_type == "ensemble"
+    assert StackingRegressor.tertiary_type == "stacking"
+    assert list(StackingRegressor.hyperparameters.keys()) == []
+
+
+def test_stacking_regressor(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    stacking_regressor = StackingRegressor()
+    stacking_regressor.fit(x, y)
+    stacking_predictions = stacking_regressor.predict(x)
+
+    assert isinstance(stacking_predictions, pd.Series)
+    assert len(stacking_predictions) == 100
+
+    score = stacking_regressor.score(x, y)
+    assert isinstance(score, float)
+
+
+@pytest.mark.parametrize("passthrough", [True, False])
+def test_stacking_regressor_final_estimator(passthrough, numeric_features_regression):
+    x, y = numeric_features_regression
+
+    stacking_regressor = StackingRegressor(
+        members=["Decision Tree", "Extra Trees"],
+        final_estimator="Decision Tree",
+        cv=3,
+        passthrough=passthrough,
+    )
+    assert isinstance(stacking_regressor.final_estimator, DecisionTreeRegressor)
+    stacking_regressor.fit(x, y)
+
+    np.testing.assert_array_almost_equal(
+        stacking_regressor.predict(x).values, stacking_regressor.model.predict(x)
+    )
+
+
+def test_stacking_regressor_final_estimator_error():
+    with pytest.raises(ValueError, match="it must match exactly one"):
+        StackingRegressor(final_estimator="tree")
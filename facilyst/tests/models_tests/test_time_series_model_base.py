@@ -1,8 +1,13 @@
+import asyncio
+
+import numpy as np
 import pandas as pd
 import pytest
+from hyperopt import space_eval
 
 from facilyst.models import TimeSeriesModelBase
 from facilyst.models.utils import get_models
+from facilyst.utils.cache_utils import ModelCache
 
 
 def test_time_series_models_equivalency(mock_time_series_model_class):
@@ -110,3 +115,378 @@ def test_time_series_models_predict_and_forecast_are_equal(
     assert len(ts_predictions) == 20
     if make_index_datetime_x or make_index_datetime_y:
         assert isinstance(ts_predictions.index, pd.DatetimeIndex)
+
+
+def test_time_series_models_evaluate(time_series_data):
+    x_train, x_test, y_train, y_test = time_series_data()
+
+    ts_model = next(iter(get_models("ADIDA Regressor")))()
+    ts_model.fit(y_train=y_train, x_train=x_train)
+    predictions = ts_model.predict(horizon=len(y_test))
+
+    results = ts_model.evaluate(y_actual=y_test, y_train=y_train, season_length=1)
+    assert list(results) == ["rmse", "mae", "mase"]
+    expected_mae = np.mean(np.abs(y_test.to_numpy() - predictions.to_numpy()))
+    assert results["mae"] == pytest.approx(expected_mae)
+    assert results["mase"] == pytest.approx(
+        expected_mae / np.mean(np.abs(np.diff(y_train.to_numpy())))
+    )
+    assert ts_model.evaluate(None, y_test, ["mae"]) == {"mae": results["mae"]}
+    with pytest.raises(ValueError, match="`y_actual` is required"):
+        ts_model.evaluate(horizon=len(y_test))
+
+
+def test_time_series_models_predict_as_array(time_series_data):
+    x_train, x_test, y_train, y_test = time_series_data()
+
+    ts_model = next(iter(get_models("ADIDA Regressor")))()
+    ts_model.fit(y_train=y_train, x_train=x_train)
+
+    predictions = ts_model.predict(horizon=len(y_test), as_array=True)
+    assert isinstance(predictions, np.ndarray)
+    np.testing.assert_array_equal(
+        predictions, ts_model.predict(horizon=len(y_test)).to_numpy()
+    )
+    forecasts = ts_model.forecast(y_train=y_train, horizon=len(y_test), as_array=True)
+    np.testing.assert_array_equal(forecasts, predictions)
+
+
+def test_time_series_models_aforecast(time_series_data):
+    x_train, x_test, y_train, _ = time_series_data(num_rows=100)
+    ts_regressor = next(iter(get_models("Croston Optimized")))()
+
+    async def run():
+        await ts_regressor.afit(y_train=y_train, x_train=x_train)
+        return (
+            await ts_regressor.apredict(horizon=len(x_test), x_test=x_test),
+            await ts_regressor.aforecast(
+                y_train=y_train, horizon=len(x_test), x_train=x_train, x_test=x_test
+            ),
+        )
+
+    predictions, forecasts = asyncio.run(run())
+    pd.testing.assert_series_equal(predictions, forecasts)
+
+
+def _panel_data(num_series=6, num_rows=40, shuffle=True):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "series_id": np.repeat(
+                [f"series_{i}" for i in range(num_series)], num_rows
+            ),
+            "date": np.tile(
+                pd.date_range("2020-01-01", periods=num_rows, freq="D"), num_series
+            ),
+            "target": rng.poisson(3, num_series * num_rows).astype(float),
+        }
+    )
+    return data.sample(frac=1, random_state=0) if shuffle else data
+
+
+@pytest.mark.parametrize(
+    "ts_model", sorted(get_models("time series"), key=lambda x: x.name)
+)
+def test_time_series_models_forecast_many(ts_model):
+    data = _panel_data(num_series=3)
+    ts_regressor = ts_model()
+
+    forecasts = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=5, n_jobs=1
+    )
+
+    assert list(forecasts.columns) == ["series_id", "date", "forecast"]
+    assert len(forecasts) == 3 * 5
+    for series_id, series in data.groupby("series_id"):
+        series = series.sort_values("date")
+        series_forecasts = forecasts[forecasts["series_id"] == series_id]
+        pd.testing.assert_index_equal(
+            pd.DatetimeIndex(series_forecasts["date"]),
+            pd.date_range("2020-02-10", periods=5, freq="D"),
+            exact=False,
+            check_names=False,
+        )
+        np.testing.assert_allclose(
+            series_forecasts["forecast"],
+            ts_regressor.forecast(
+                y_train=series["target"].to_numpy(), horizon=5, as_array=True
+            ),
+        )
+
+
+def test_time_series_models_forecast_many_processes():
+    data = _panel_data(num_series=10)
+    ts_regressor = next(iter(get_models("Croston Optimized")))()
+
+    sequential = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=3, n_jobs=1
+    )
+    parallel = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=3, n_jobs=2
+    )
+    pd.testing.assert_frame_equal(sequential, parallel)
+
+
+@pytest.mark.parametrize("ts_model", sorted(get_models("sparse"), key=lambda x: x.name))
+def test_time_series_models_forecast_many_batch(ts_model):
+    data = _panel_data(num_series=8)
+    data["target"] *= np.random.default_rng(1).random(len(data)) < 0.3
+    ts_regressor = ts_model()
+
+    batch = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=3, batch=True
+    )
+    sequential = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=3, n_jobs=1
+    )
+    pd.testing.assert_frame_equal(
+        batch.drop(columns="forecast"), sequential.drop(columns="forecast")
+    )
+    np.testing.assert_allclose(
+        batch["forecast"], sequential["forecast"], rtol=0.05, atol=1e-12
+    )
+
+
+def test_time_series_models_forecast_many_batch_unsupported():
+    ts_regressor = next(iter(get_models("AutoETS")))()
+
+    with pytest.raises(NotImplementedError, match="can't forecast series in a batch"):
+        ts_regressor.forecast_many(
+            _panel_data(num_series=2), "series_id", "date", "target", 2, batch=True
+        )
+
+
+def test_time_series_models_forecast_many_unforecastable_series():
+    data = pd.concat(
+        [
+            _panel_data(num_series=2, shuffle=False),
+            pd.DataFrame(
+                {
+                    "series_id": ["short"],
+                    "date": [pd.Timestamp("2020-01-01")],
+                    "target": [1.0],
+                }
+            ),
+        ]
+    )
+    ts_regressor = next(iter(get_models("AutoARIMA")))()
+
+    with pytest.warns(UserWarning, match="1 series couldn't be forecast"):
+        forecasts = ts_regressor.forecast_many(
+            data, "series_id", "date", "target", horizon=2, n_jobs=1
+        )
+    assert forecasts[forecasts["series_id"] == "short"]["forecast"].isna().all()
+    assert forecasts[forecasts["series_id"] != "short"]["forecast"].notna().all()
+
+
+@pytest.mark.parametrize(
+    "ts_model", sorted(get_models("time series"), key=lambda x: x.name)
+)
+def test_time_series_models_update(ts_model):
+    rng = np.random.default_rng(0)
+    y = pd.Series(
+        rng.poisson(3, 70).astype(float) * (rng.random(70) < 0.7),
+        index=pd.date_range("2021-01-01", periods=70, freq="D"),
+    )
+    model = ts_model().fit(y.iloc[:60])
+    generation = model.fit_generation
+
+    assert model.update(y.iloc[60:65]) is model
+    assert model.final_training_index == y.index[64]
+    assert model.fit_generation > generation
+    model.update(y.iloc[65:].to_numpy())
+    assert model.final_training_index == y.index[69]
+
+    predictions = model.predict(horizon=3)
+    assert predictions.index[0] == y.index[69] + pd.Timedelta(days=1)
+    assert np.isfinite(predictions).all()
+    with pytest.raises(ValueError, match="must be fitted before it's updated"):
+        ts_model().update(y)
+
+
+@pytest.mark.parametrize(
+    "ts_model",
+    [
+        "AutoETS Regressor",
+        "AutoTheta Regressor",
+        "AutoARIMA Regressor",
+    ],
+)
+@pytest.mark.parametrize("season_length", [1, 4])
+def test_time_series_models_update_with_forecasts_continues_them(
+    ts_model, season_length
+):
+    rng = np.random.default_rng(1)
+    y = np.cumsum(rng.normal(size=80)) + 20 + 3 * np.sin(np.arange(80) * np.pi / 2)
+    model = next(iter(get_models(ts_model)))(season_length=season_length).fit(y)
+    forecasts = model.predict(horizon=10, as_array=True)
+
+    model.update(forecasts[:4])
+    assert model.final_training_index == 83
+    np.testing.assert_allclose(
+        model.predict(horizon=6, as_array=True), forecasts[4:], atol=1e-8
+    )
+
+
+def _seasonal_series(season_length=12, length=96):
+    rng = np.random.default_rng(0)
+    times = np.arange(length)
+    return (
+        20 + 3 * np.sin(2 * np.pi * times / season_length) + rng.normal(0, 0.5, length)
+    )
+
+
+@pytest.mark.parametrize(
+    "ts_model",
+    [
+        "AutoETS Regressor",
+        "AutoTheta Regressor",
+        "AutoARIMA Regressor",
+    ],
+)
+def test_time_series_models_detect_season_length(ts_model):
+    ts_class = next(iter(get_models(ts_model)))
+    y = _seasonal_series(season_length=4, length=48)
+
+    model = ts_class().fit(y)
+    assert model.parameters["season_length"] is None
+    assert model.model.season_length == 4
+    expected = ts_class(season_length=4).fit(y).predict(horizon=6, as_array=True)
+    np.testing.assert_allclose(model.predict(horizon=6, as_array=True), expected)
+    np.testing.assert_allclose(
+        ts_class().forecast(y, horizon=6, as_array=True), expected
+    )
+
+    # An explicit season length is never overridden.
+    assert ts_class(season_length=1).fit(y).model.season_length == 1
+
+
+def test_time_series_models_forecast_many_detects_season_length_per_series():
+    data = pd.DataFrame(
+        {
+            "series_id": np.repeat(["weekly", "monthly"], 96),
+            "date": np.tile(pd.date_range("2020-01-01", periods=96, freq="D"), 2),
+            "target": np.concatenate([_seasonal_series(7), _seasonal_series(12)]),
+        }
+    )
+    ts_class = next(iter(get_models("AutoETS")))
+
+    forecasts = ts_class().forecast_many(
+        data, "series_id", "date", "target", horizon=4, n_jobs=1
+    )
+    for series_id, season_length in [("weekly", 7), ("monthly", 12)]:
+        y = data[data["series_id"] == series_id]["target"].to_numpy()
+        np.testing.assert_allclose(
+            forecasts[forecasts["series_id"] == series_id]["forecast"],
+            ts_class(season_length=season_length).forecast(y, horizon=4, as_array=True),
+        )
+
+
+@pytest.mark.parametrize("ts_model", ["AutoETS Regressor", "AutoTheta Regressor"])
+def test_time_series_models_hyperparameters_for_narrows_season_lengths(ts_model):
+    ts_class = next(iter(get_models(ts_model)))
+
+    space = ts_class.hyperparameters_for(None, _seasonal_series())
+    assert space.keys() == ts_class.hyperparameters.keys()
+    season_lengths = {
+        space_eval(space, {**{name: 0 for name in space}, "season_length": index})[
+            "season_length"
+        ]
+        for index in range(4)
+    }
+    assert season_lengths == {1, 12, 24, 36}
+
+    space = ts_class.hyperparameters_for(None, np.random.default_rng(0).normal(size=60))
+    assert space_eval(space, {name: 0 for name in space})["season_length"] == 1
+    assert ts_class.hyperparameters_for(None, None) == ts_class.hyperparameters
+
+
+def test_time_series_models_fit_cache_with_empty_features(tmp_path):
+    y = pd.Series(
+        20 + np.cumsum(np.random.default_rng(0).normal(size=40)),
+        index=pd.date_range("2021-01-01", periods=40, freq="D"),
+    )
+    ts_class = next(iter(get_models("AutoETS")))
+
+    model = ts_class(season_length=1).enable_fit_cache(directory=str(tmp_path))
+    model.fit(y, x_train=pd.DataFrame(index=y.index))
+    cached = ts_class(season_length=1).enable_fit_cache(directory=str(tmp_path))
+    cached.fit(y, x_train=pd.DataFrame(index=y.index))
+
+    assert cached.fit_cache.hits == 1
+    np.testing.assert_allclose(
+        cached.predict(horizon=3, as_array=True),
+        model.predict(horizon=3, as_array=True),
+    )
+
+
+def test_time_series_models_forecast_cache(tmp_path):
+    rng = np.random.default_rng(0)
+    y = pd.Series(
+        20 + np.cumsum(rng.normal(size=60)),
+        index=pd.date_range("2021-01-01", periods=60, freq="D"),
+    )
+    cache = ModelCache(directory=str(tmp_path))
+    ts_model = next(iter(get_models("AutoETS")))
+    model = ts_model().enable_forecast_cache(cache)
+
+    forecasts = model.forecast(y, horizon=5)
+    assert (cache.hits, cache.misses) == (0, 1)
+    pd.testing.assert_series_equal(model.forecast(y, horizon=5), forecasts)
+    assert (cache.hits, cache.misses) == (1, 1)
+    pd.testing.assert_series_equal(
+        forecasts, ts_model().forecast(y, horizon=5), check_exact=False
+    )
+
+    # A changed series, horizon, or parameters are forecast again.
+    model.forecast(y + 1, horizon=5)
+    model.forecast(y, horizon=6)
+    ts_model(season_length=2).enable_forecast_cache(cache).forecast(y, horizon=5)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    # Fitting on the same series serves the same forecasts, and updating it keys them by the new observations.
+    model.fit(y)
+    pd.testing.assert_series_equal(model.predict(horizon=5), forecasts)
+    assert cache.hits == 2
+    model.update(y.iloc[-3:] + 1)
+    updated = model.predict(horizon=5, as_array=True)
+    assert cache.misses == 5
+    np.testing.assert_allclose(
+        ts_model().fit(y).update(y.iloc[-3:] + 1).predict(horizon=5, as_array=True),
+        updated,
+    )
+
+    model.disable_forecast_cache().forecast(y, horizon=5)
+    assert (cache.hits, cache.misses) == (2, 5)
+    assert model.fit(y).training_fingerprint is None
+
+
+def test_time_series_models_forecast_many_cache(tmp_path):
+    data = _panel_data(num_series=4)
+    cache = ModelCache(directory=str(tmp_path))
+    ts_regressor = next(iter(get_models("Croston Optimized")))()
+    ts_regressor.enable_forecast_cache(cache)
+
+    forecasts = ts_regressor.forecast_many(
+        data, "series_id", "date", "target", horizon=3, n_jobs=1
+    )
+    assert (cache.hits, cache.misses, len(cache)) == (0, 4, 4)
+
+    changed = data.copy()
+    changed.loc[changed["series_id"] == changed["series_id"].iloc[0], "target"] += 1
+    changed_forecasts = ts_regressor.forecast_many(
+        changed, "series_id", "date", "target", horizon=3, n_jobs=1
+    )
+    assert (cache.hits, cache.misses) == (3, 5)
+    pd.testing.assert_frame_equal(
+        changed_forecasts,
+        ts_regressor.disable_forecast_cache().forecast_many(
+            changed, "series_id", "date", "target", horizon=3, n_jobs=1
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        forecasts,
+        ts_regressor.forecast_many(
+            data, "series_id", "date", "target", horizon=3, n_jobs=1
+        ),
+    )
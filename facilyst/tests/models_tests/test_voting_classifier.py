@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import VotingClassifier
+
+
+def test_voting_classifier_class_variables():
+    assert VotingClassifier.name == "Voting Classifier"
+    assert VotingClassifier.primary_type == "classification"
+    assert VotingClassifier.secondary_type == "ensemble"
+    assert VotingClassifier.tertiary_type == "voting"
+    assert list(VotingClassifier.hyperparameters.keys()) == ["voting"]
+
+
+@pytest.mark.parametrize("voting", ["hard", "soft"])
+@pytest.mark.parametrize("classification_type", ["binary", "multiclass"])
+def test_voting_classifier(
+    classification_type,
+    voting,
+    numeric_features_binary_classification,
+    numeric_features_multi_classification,
+):
+    x, y = (
+        numeric_features_binary_classification
+        if classification_type == "binary"
+        else numeric_features_multi_classification
+    )
+    y = np.array(["first", "second", "third"])[y]
+
+    voting_classifier = VotingClassifier(voting=voting, weights=[1, 2, 3])
+    voting_classifier.fit(x, y)
+    voting_predictions = voting_classifier.predict(x)
+
+    assert isinstance(voting_predictions, pd.Series)
+    assert len(voting_predictions) == 100
+    np.testing.assert_array_equal(
+        voting_predictions.values, voting_classifier.model.predict(x)
+    )
+
+    score = voting_classifier.score(x, y)
+    assert isinstance(score, float)
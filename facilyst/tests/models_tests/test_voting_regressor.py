@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import (
+    DecisionTreeRegressor,
+    RandomForestRegressor,
+    VotingRegressor,
+)
+
+
+def test_voting_regressor_class_variables():
+    assert VotingRegressor.name == "Voting Regressor"
+    assert VotingRegressor.primary_type == "regression"
+    assert VotingRegressor.secondary_type == "ensemble"
+    assert VotingRegressor.tertiary_type == "voting"
+    assert list(VotingRegressor.hyperparameters.keys()) == []
+
+
+def test_voting_regressor(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    voting_regressor = VotingRegressor()
+    voting_regressor.fit(x, y)
+    voting_predictions = voting_regressor.predict(x)
+
+    assert isinstance(voting_predictions, pd.Series)
+    assert len(voting_predictions) == 100
+
+    score = voting_regressor.score(x, y)
+    assert isinstance(score, float)
+
+    assert [member_name for member_name, _ in voting_regressor.members] == [
+        "decision_tree_regressor",
+        "extra_trees_regressor",
+        "random_forest_regressor",
+    ]
+
+
+def test_voting_regressor_members_by_name_tag_and_model(numeric_features_regression):
+    x, y = numeric_features_regression
+
+    voting_regressor = VotingRegressor(
+        members=["Decision Tree", DecisionTreeRegressor(max_depth=2)],
+        weights=[1, 3],
+        n_jobs=1,
+    )
+    assert [member_name for member_name, _ in voting_regressor.members] == [
+        "decision_tree_regressor",
+        "decision_tree_regressor_1",
+    ]
+    voting_regressor.fit(x, y)
+
+    member_predictions = np.column_stack(
+        [estimator.predict(x) for estimator in voting_regressor.model.estimators_]
+    )
+    expected = np.average(member_predictions, axis=1, weights=[1, 3])
+    np.testing.assert_array_almost_equal(voting_regressor.predict(x).values, expected)
+
+    tagged_voting_regressor = VotingRegressor(members=["tree"])
+    assert RandomForestRegressor() in [
+        member for _, member in tagged_voting_regressor.members
+    ]
+    assert not any(
+        isinstance(member, VotingRegressor)
+        for _, member in tagged_voting_regressor.members
+    )
+
+
+def test_voting_regressor_no_members_error():
+    with pytest.raises(ValueError, match="No models were found"):
+        VotingRegressor(members=["something"])
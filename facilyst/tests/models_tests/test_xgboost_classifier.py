@@ -85,3 +85,34 @@ def test_xgboost_classifier(
         "validate_parameters": 1,
         "verbosity": None,
     }
+
+
+def test_xgboost_classifier_shared_native_cache(numeric_features_multi_classification):
+    x, y = numeric_features_multi_classification
+
+    first_classifier = XGBoostClassifier(n_estimators=10)
+    first_classifier.enable_native_cache()
+    first_classifier.fit(x, y)
+
+    second_classifier = XGBoostClassifier(n_estimators=20, max_depth=3)
+    second_classifier.enable_native_cache(cache=first_classifier.native_cache)
+    second_classifier.fit(x, y)
+
+    assert len(first_classifier.native_cache) == 1
+    assert first_classifier.native_cache.hits == 1
+    np.testing.assert_array_equal(
+        second_classifier.predict(x, as_array=True),
+        XGBoostClassifier(n_estimators=20, max_depth=3).fit(x, y).predict(x).to_numpy(),
+    )
+
+
+def test_xgboost_classifier_early_stopping(numeric_features_multi_classification):
+    x, y = numeric_features_multi_classification
+
+    xgboost_classifier = XGBoostClassifier(n_estimators=300, random_state=0)
+    xgboost_classifier.enable_native_cache()
+    xgboost_classifier.fit(x, y, early_stopping_rounds=3, validation_fraction=0.2)
+
+    assert xgboost_classifier.best_iteration < 299
+    assert len(xgboost_classifier.native_cache) == 2
+    assert xgboost_classifier.predict_proba(x).shape == (100, 3)
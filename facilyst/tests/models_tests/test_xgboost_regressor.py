@@ -73,3 +73,100 @@ def test_xgboost_regressor(numeric_features_regression):
         "validate_parameters": 1,
         "verbosity": None,
     }
+
+
+@pytest.mark.parametrize("tree_method", ["exact", "hist"])
+def test_xgboost_regressor_native_cache(tree_method, numeric_features_regression):
+    x, y = numeric_features_regression
+
+    expected_predictions = (
+        XGBoostRegressor(tree_method=tree_method).fit(x, y).predict(x)
+    )
+
+    xgboost_regressor = XGBoostRegressor(tree_method=tree_method)
+    xgboost_regressor.enable_native_cache()
+    xgboost_regressor.fit(x, y)
+    pd.testing.assert_series_equal(xgboost_regressor.predict(x), expected_predictions)
+    assert len(xgboost_regressor.native_cache) == 1
+    assert "_create_dmatrix" not in xgboost_regressor.model.__dict__
+    assert xgboost_regressor.model.n_features_in_ == x.shape[1]
+
+    xgboost_regressor.fit(x.copy(), y.copy())
+    assert xgboost_regressor.native_cache.hits == 1
+    pd.testing.assert_series_equal(xgboost_regressor.predict(x), expected_predictions)
+
+    xgboost_regressor.fit(x, y + 1)
+    assert len(xgboost_regressor.native_cache) == 2
+
+    xgboost = pytest.importorskip("xgboost")
+    expected_type = (
+        xgboost.QuantileDMatrix if tree_method == "hist" else xgboost.DMatrix
+    )
+    for container, _ in xgboost_regressor.native_cache._entries.values():
+        assert type(container) is expected_type
+
+    xgboost_regressor.disable_native_cache()
+    assert xgboost_regressor.native_cache is None
+
+
+@pytest.mark.parametrize("use_eval_set", [True, False])
+def test_xgboost_regressor_early_stopping(use_eval_set):
+    import xgboost
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(300, 5))
+    y = x[:, 0] + rng.normal(scale=2.0, size=300)
+
+    xgboost_regressor = XGBoostRegressor(n_estimators=300, learning_rate=0.3)
+    eval_set = (x[250:], y[250:]) if use_eval_set else None
+    xgboost_regressor.fit(x[:250], y[:250], eval_set=eval_set, early_stopping_rounds=5)
+
+    best_iteration = xgboost_regressor.best_iteration
+    assert best_iteration is not None and best_iteration < 299
+    assert xgboost_regressor.model.get_params()["early_stopping_rounds"] is None
+    np.testing.assert_allclose(
+        xgboost_regressor.predict(x, as_array=True),
+        xgboost_regressor.model.get_booster().predict(
+            xgboost.DMatrix(x), iteration_range=(0, best_iteration + 1)
+        ),
+        rtol=1e-6,
+    )
+
+    xgboost_regressor.fit(x, y)
+    assert xgboost_regressor.best_iteration is None
+
+    with pytest.raises(ValueError, match="The `eval_set` is only used for early"):
+        xgboost_regressor.fit(x, y, eval_set=(x, y))
+
+
+@pytest.mark.parametrize("tree_method", ["exact", "hist"])
+def test_xgboost_regressor_native_cache_early_stopping(tree_method):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(300, 5))
+    y = x[:, 0] + rng.normal(scale=2.0, size=300)
+    eval_set = (x[250:], y[250:])
+
+    expected_regressor = XGBoostRegressor(n_estimators=300, tree_method=tree_method)
+    expected_regressor.fit(x[:250], y[:250], eval_set=eval_set, early_stopping_rounds=5)
+
+    xgboost_regressor = XGBoostRegressor(n_estimators=300, tree_method=tree_method)
+    xgboost_regressor.enable_native_cache()
+    xgboost_regressor.fit(x[:250], y[:250], eval_set=eval_set, early_stopping_rounds=5)
+    assert xgboost_regressor.best_iteration == expected_regressor.best_iteration
+    np.testing.assert_allclose(
+        xgboost_regressor.predict(x, as_array=True),
+        expected_regressor.predict(x, as_array=True),
+        rtol=1e-6,
+    )
+
+    xgboost_regressor.fit(
+        x[:250].copy(),
+        y[:250].copy(),
+        eval_set=(x[250:].copy(), y[250:].copy()),
+        early_stopping_rounds=5,
+    )
+    assert len(xgboost_regressor.native_cache) == 2
+    assert xgboost_regressor.native_cache.hits == 2
+
+    xgboost_regressor.fit(x[:200], y[:200], eval_set=eval_set, early_stopping_rounds=5)
+    assert len(xgboost_regressor.native_cache) == 4
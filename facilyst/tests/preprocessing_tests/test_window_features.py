@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.preprocessors import WindowFeatures
+
+
+def test_window_features_class_variables():
+    assert WindowFeatures.name == "Window Features"
+    assert WindowFeatures.primary_type == "x"
+    assert WindowFeatures.secondary_type == "featurize"
+    assert WindowFeatures.tertiary_type == "time series"
+    assert WindowFeatures.hyperparameters == {}
+
+
+def _panel(num_rows=200):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "id": rng.choice(["a", "b", "c"], num_rows),
+            "time": rng.permutation(num_rows),
+            "first": rng.normal(size=num_rows) * 10 + 100,
+            "second": rng.normal(size=num_rows),
+        }
+    )
+    data.loc[rng.choice(num_rows, 10), "first"] = np.nan
+    return data
+
+
+def test_window_features_match_pandas():
+    data = _panel()
+    window_features = WindowFeatures(
+        lags=[1, 3],
+        windows=[1, 4],
+        expanding=True,
+        id_column="id",
+        time_column="time",
+    )
+    features, y = window_features.transform(data, "target")
+
+    assert y == "target"
+    assert list(features.columns[:4]) == ["id", "time", "first", "second"]
+    assert len(features.columns) == 4 + 2 * 14
+    pd.testing.assert_frame_equal(features[data.columns], data)
+
+    groups = data.sort_values(["id", "time"]).groupby("id")
+    for column in ["first", "second"]:
+        expected = {f"lag_{lag}": groups[column].shift(lag) for lag in [1, 3]}
+        for statistic in ["mean", "std", "min", "max"]:
+            for window in [1, 4]:
+                expected[f"rolling_{statistic}_{window}"] = groups[column].transform(
+                    lambda x: getattr(x.rolling(window), statistic)().shift(1)
+                )
+            expected[f"expanding_{statistic}"] = groups[column].transform(
+                lambda x: getattr(x.expanding(), statistic)().shift(1)
+            )
+        for feature, values in expected.items():
+            np.testing.assert_allclose(
+                features.loc[values.index, f"{column}_{feature}"],
+                values,
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=feature,
+            )
+
+
+def test_window_features_update_streams_new_rows():
+    data = _panel()
+    parameters = dict(
+        lags=[1, 3],
+        windows=[2, 5],
+        expanding=True,
+        shift=2,
+        id_column="id",
+        time_column="time",
+    )
+    features, _ = WindowFeatures(**parameters).transform(data)
+
+    ordered = data.sort_values("time")
+    window_features = WindowFeatures(**parameters).fit(ordered.iloc[:100])
+    streamed = pd.concat(
+        [
+            window_features.update(ordered.iloc[start : start + 7])[0]
+            for start in range(100, 200, 7)
+        ]
+    )
+    pd.testing.assert_frame_equal(streamed, features.loc[streamed.index], rtol=1e-7)
+    assert len(window_features.state["tail_values"]) <= 3 * window_features.lookback
+
+    # A series the preprocessor hasn't seen starts without history.
+    new_series, _ = window_features.update(
+        pd.DataFrame({"id": ["d"], "time": [200], "first": [1.0], "second": [2.0]})
+    )
+    assert new_series.iloc[0, 4:].isna().all()
+
+
+def test_window_features_single_series_and_defaults():
+    data = pd.DataFrame({"a": np.arange(10.0), "b": np.arange(10.0) ** 2})
+    window_features = WindowFeatures(windows=[3], statistics=["mean", "max"])
+    features, _ = window_features.transform(data)
+
+    assert list(features.columns) == [
+        "a",
+        "b",
+        "a_lag_1",
+        "a_rolling_mean_3",
+        "a_rolling_max_3",
+        "b_lag_1",
+        "b_rolling_mean_3",
+        "b_rolling_max_3",
+    ]
+    np.testing.assert_allclose(features["a_rolling_mean_3"][4:], np.arange(2.0, 8.0))
+    assert features["a_rolling_max_3"][:3].isna().all()
+
+    window_features.fit(data.iloc[:4])
+    pd.testing.assert_frame_equal(
+        window_features.update(data.iloc[4:])[0], features.iloc[4:]
+    )
+    long_windows, _ = WindowFeatures(windows=[20]).transform(data)
+    assert long_windows.filter(like="rolling").isna().all().all()
+
+
+def test_window_features_errors():
+    with pytest.raises(
+        ValueError, match="The statistics \\['median'\\] aren't supported"
+    ):
+        WindowFeatures(statistics=["median"])
+    with pytest.raises(ValueError, match="can't be negative"):
+        WindowFeatures(lags=[-1])
+    with pytest.raises(ValueError, match="at least one row"):
+        WindowFeatures(windows=[0])
+    with pytest.raises(ValueError, match="must be fitted before it's updated"):
+        WindowFeatures().update(pd.DataFrame({"a": [1.0]}))
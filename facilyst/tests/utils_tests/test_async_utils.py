@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from facilyst.utils import (
+    execution_context,
+    get_async_executor,
+    get_thread_budget,
+    run_in_executor,
+    set_async_executor,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_async_executor():
+    set_async_executor(None)
+    yield
+    set_async_executor(None)
+
+
+def test_run_in_executor_uses_configured_executor():
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="configured")
+    set_async_executor(executor)
+    assert get_async_executor() is executor
+
+    thread_name = asyncio.run(run_in_executor(lambda: threading.current_thread().name))
+    assert thread_name.startswith("configured")
+
+    other = ThreadPoolExecutor(max_workers=1, thread_name_prefix="passed")
+    thread_name = asyncio.run(
+        run_in_executor(lambda: threading.current_thread().name, executor=other)
+    )
+    assert thread_name.startswith("passed")
+    executor.shutdown()
+    other.shutdown()
+
+
+def test_run_in_executor_passes_arguments_and_context():
+    async def run():
+        with execution_context(n_jobs=2):
+            budget = await run_in_executor(get_thread_budget)
+        total = await run_in_executor(sum, [1, 2], start=3)
+        return budget, total
+
+    assert asyncio.run(run()) == (2, 6)
+
+
+def test_run_in_executor_cancelled_before_start_never_runs():
+    executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    calls = []
+
+    async def run():
+        blocker = asyncio.ensure_future(
+            run_in_executor(release.wait, executor=executor)
+        )
+        queued = asyncio.ensure_future(
+            run_in_executor(calls.append, 1, executor=executor)
+        )
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await blocker
+
+    asyncio.run(run())
+    executor.shutdown()
+    assert calls == []
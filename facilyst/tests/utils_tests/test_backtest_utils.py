@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import AutoARIMARegressor, CrostonOptimizedRegressor
+from facilyst.utils import backtest
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    return pd.Series(
+        rng.poisson(3, 60).astype(float),
+        index=pd.date_range("2020-01-01", periods=60, freq="D"),
+    )
+
+
+def test_backtest_single_series(series):
+    model = CrostonOptimizedRegressor()
+    forecasts, metrics = backtest(model, series, horizon=5, n_windows=3, step=4)
+
+    assert list(forecasts.columns) == ["window", "cutoff", "time", "actual", "forecast"]
+    assert list(metrics.columns) == ["window", "cutoff", "rmse", "mae", "mase"]
+    assert len(forecasts) == 15 and len(metrics) == 3
+    for window, cutoff in enumerate([47, 51, 55]):
+        window_forecasts = forecasts[forecasts["window"] == window]
+        assert window_forecasts["cutoff"].iloc[0] == series.index[cutoff - 1]
+        np.testing.assert_array_equal(
+            window_forecasts["time"], series.index[cutoff : cutoff + 5]
+        )
+        np.testing.assert_array_equal(
+            window_forecasts["actual"], series.iloc[cutoff : cutoff + 5]
+        )
+        np.testing.assert_allclose(
+            window_forecasts["forecast"],
+            model.forecast(y_train=series.iloc[:cutoff], horizon=5, as_array=True),
+        )
+    assert metrics["rmse"].notna().all()
+
+
+def test_backtest_refit_every(series):
+    model = CrostonOptimizedRegressor()
+    forecasts, _ = backtest(
+        model, series, horizon=3, n_windows=4, refit_every=2, n_jobs=1
+    )
+
+    updated = CrostonOptimizedRegressor().fit(series.iloc[:48]).update(series[48:51])
+    np.testing.assert_allclose(
+        forecasts[forecasts["window"] == 1]["forecast"],
+        updated.predict(horizon=3, as_array=True),
+    )
+    refitted = CrostonOptimizedRegressor().fit(series.iloc[:54])
+    np.testing.assert_allclose(
+        forecasts[forecasts["window"] == 2]["forecast"],
+        refitted.predict(horizon=3, as_array=True),
+    )
+
+    parallel, _ = backtest(
+        model, series, horizon=3, n_windows=4, refit_every=2, n_jobs=2
+    )
+    pd.testing.assert_frame_equal(forecasts, parallel)
+
+
+def test_backtest_with_features(series):
+    x = np.arange(len(series), dtype=float).reshape(-1, 1)
+    forecasts, metrics = backtest(
+        AutoARIMARegressor(), series, x=x, horizon=2, n_windows=2
+    )
+    assert len(forecasts) == 4
+    assert forecasts["forecast"].notna().all()
+
+
+def test_backtest_panel():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "series_id": np.repeat(["a", "b", "short"], [30, 40, 6]),
+            "date": np.concatenate(
+                [
+                    pd.date_range("2020-01-01", periods=length, freq="D")
+                    for length in [30, 40, 6]
+                ]
+            ),
+            "target": rng.poisson(3, 76).astype(float),
+        }
+    ).sample(frac=1, random_state=0)
+
+    forecasts, metrics = backtest(
+        CrostonOptimizedRegressor(),
+        data,
+        horizon=3,
+        n_windows=3,
+        id_column="series_id",
+        time_column="date",
+        target_column="target",
+        n_jobs=1,
+    )
+
+    assert list(forecasts.columns[:2]) == ["series_id", "window"]
+    assert "date" in forecasts.columns
+    assert metrics.groupby("series_id").size().to_dict() == {"a": 3, "b": 3, "short": 1}
+
+    b = data[data["series_id"] == "b"].sort_values("date")["target"].to_numpy()
+    b_forecasts = forecasts[
+        (forecasts["series_id"] == "b") & (forecasts["window"] == 2)
+    ]
+    np.testing.assert_allclose(
+        b_forecasts["forecast"],
+        CrostonOptimizedRegressor().forecast(y_train=b[:37], horizon=3, as_array=True),
+    )
+
+
+def test_backtest_too_short(series):
+    with pytest.raises(ValueError, match="too short to backtest"):
+        backtest(CrostonOptimizedRegressor(), series.iloc[:3], horizon=5)
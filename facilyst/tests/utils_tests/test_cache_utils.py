@@ -0,0 +1,115 @@
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.utils.cache_utils import LRUCache, ModelCache
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(max_bytes=2 * 80)
+    first, second, third = np.zeros(10), np.ones(10), np.full(10, 2.0)
+
+    cache.put("first", first)
+    cache.put("second", second)
+    assert cache.get("first") is first
+    cache.put("third", third)
+
+    assert "first" in cache
+    assert "second" not in cache
+    assert "third" in cache
+    assert cache.current_bytes == 160
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    cache.put("too large", np.zeros(100))
+    assert "too large" not in cache
+    assert cache.get("too large") is None
+    assert cache.misses == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
+
+
+def test_lru_cache_pickle():
+    cache = LRUCache(max_bytes=1024)
+    cache.put("first", np.zeros(10))
+
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert unpickled.max_bytes == 1024
+    assert len(unpickled) == 0
+    unpickled.put("second", np.zeros(10))
+    assert "second" in unpickled
+
+
+def test_model_cache_put_get_and_inspect(tmp_path):
+    cache = ModelCache(directory=str(tmp_path))
+    assert cache.get("missing", default="default") == "default"
+    assert cache.misses == 1
+
+    cache.put("first", np.arange(10), metadata={"name": "first value"})
+    assert "first" in cache
+    np.testing.assert_array_equal(cache.get("first"), np.arange(10))
+    assert cache.hits == 1
+
+    entries = cache.entries()
+    assert list(entries["key"]) == ["first"]
+    assert entries["name"][0] == "first value"
+    assert cache.current_bytes == entries["bytes"][0] > 0
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.entries().empty
+
+
+def test_model_cache_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(directory=str(tmp_path))
+    cache.put("probe", np.zeros(1000))
+    entry_bytes = cache.current_bytes
+    cache.clear()
+
+    cache = ModelCache(directory=str(tmp_path), max_bytes=int(2.5 * entry_bytes))
+    cache.put("a", np.zeros(1000))
+    time.sleep(0.01)
+    cache.put("b", np.ones(1000))
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", np.full(1000, 2.0))
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+    cache.put("too_big", np.zeros(10_000))
+    assert "too_big" not in cache
+
+
+def test_model_cache_expires_entries(tmp_path):
+    cache = ModelCache(directory=str(tmp_path), ttl=60)
+    cache.put("old", np.zeros(10))
+    cache.put("new", np.ones(10))
+    past = time.time() - 120
+    os.utime(tmp_path / "old.json", (past, past))
+
+    assert cache.get("old") is None
+    assert "old" not in cache
+    np.testing.assert_array_equal(cache.get("new"), np.ones(10))
+
+    os.utime(tmp_path / "new.json", (past, past))
+    cache._evict()
+    assert len(cache) == 0
+
+
+def test_model_cache_drops_unreadable_entries(tmp_path):
+    cache = ModelCache(directory=str(tmp_path))
+    cache.put("entry", [1, 2, 3])
+    with open(tmp_path / "entry.joblib", "wb") as entry_file:
+        entry_file.write(b"not a joblib file")
+    assert cache.get("entry") is None
+    assert "entry" not in cache
+
+
+def test_model_cache_default_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("FACILYST_CACHE_DIR", str(tmp_path))
+    assert ModelCache().directory == os.path.join(str(tmp_path), "models")
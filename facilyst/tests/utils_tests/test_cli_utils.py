@@ -1,9 +1,46 @@
+import pandas as pd
 from click.testing import CliRunner
 
 from facilyst.__main__ import cli
+from facilyst.models import RandomForestRegressor
 
 
 def test_print_cli_cmd():
     runner = CliRunner()
     result = runner.invoke(cli)
     assert result.exit_code == 0
+
+
+def test_serve_cli_cmd(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["serve", "--help"])
+    assert result.exit_code == 0
+    assert "--max-batch-size" in result.output
+
+    result = runner.invoke(cli, ["serve", str(tmp_path / "missing.pkl")])
+    assert result.exit_code != 0
+
+
+def test_predict_cli_cmd(numeric_features_regression, tmp_path):
+    x, y = numeric_features_regression
+    RandomForestRegressor(n_estimators=10).fit(x, y).save(tmp_path / "model.pkl")
+    pd.DataFrame(x).to_csv(tmp_path / "input.csv", index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "predict",
+            "--model",
+            str(tmp_path / "model.pkl"),
+            "--input",
+            str(tmp_path / "input.csv"),
+            "--output",
+            str(tmp_path / "output.csv"),
+            "--chunk-size",
+            "40",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "rows/sec" in result.output
+    assert len(pd.read_csv(tmp_path / "output.csv")) == len(x)
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.utils.conversion_utils import (
+    _conversion_cache,
+    clear_conversion_cache,
+    is_numeric,
+    to_array,
+    to_model_input,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_conversion_cache()
+    yield
+    clear_conversion_cache()
+
+
+def test_to_array_no_copy():
+    array = np.arange(12.0).reshape(3, 4)
+    assert to_array(array) is array
+    assert to_array(array, dtype="float64") is array
+
+    strided = array[:, ::2]
+    converted = to_array(strided)
+    assert converted.flags.c_contiguous
+    np.testing.assert_array_equal(converted, strided)
+
+    df = pd.DataFrame({"a": np.arange(5.0), "b": np.arange(5.0) * 2})
+    assert np.shares_memory(to_array(df), df["a"].to_numpy())
+
+    series = pd.Series(np.arange(5))
+    assert np.shares_memory(to_array(series), series.to_numpy())
+
+
+def test_to_array_types():
+    df = pd.DataFrame(
+        {
+            "ints": [1, 2, 3],
+            "floats": np.array([1.5, 2.5, 3.5], dtype=np.float32),
+            "nullable_ints": pd.array([1, None, 3], dtype="Int64"),
+            "nullable_bools": pd.array([True, False, None], dtype="boolean"),
+        }
+    )
+    converted = to_array(df)
+    assert converted.dtype == np.float64
+    np.testing.assert_array_equal(
+        converted,
+        np.array([[1, 1.5, 1, 1], [2, 2.5, np.nan, 0], [3, 3.5, 3, np.nan]]),
+    )
+
+    assert to_array(df[["ints", "floats"]]).dtype == np.float64
+    assert to_array(pd.Series([1, 2], dtype="int32")).dtype == np.int32
+    assert to_array(pd.Series(["a", "b"])).dtype == object
+    assert to_array(df, dtype="float32").dtype == np.float32
+    assert to_array(None) is None
+
+
+def test_to_array_cached_per_object():
+    df = pd.DataFrame({"a": pd.array([1, None, 3], dtype="Int64"), "b": [1.0, 2, 3]})
+    converted = to_array(df, cache=True)
+    assert to_array(df, cache=True) is converted
+    assert to_array(df.copy(), cache=True) is not converted
+    assert to_array(df) is not converted
+
+    df["c"] = [4.0, 5, 6]
+    assert to_array(df, cache=True).shape == (3, 3)
+
+    key = id(df)
+    assert key in _conversion_cache
+    del df
+    assert key not in _conversion_cache
+
+
+def test_to_array_sees_in_place_edits_by_default():
+    df = pd.DataFrame({"a": [1.0, 2, 3]})
+    to_array(df)
+    df.loc[0, "a"] = 10.0
+    assert to_array(df)[0, 0] == 10.0
+    assert to_model_input(df)[0, 0] == 10.0
+    assert id(df) not in _conversion_cache
+
+
+def test_to_model_input():
+    numeric = pd.DataFrame({"a": [1, 2], "b": pd.array([1, None], dtype="Int64")})
+    assert is_numeric(numeric)
+    assert isinstance(to_model_input(numeric), np.ndarray)
+
+    mixed = pd.DataFrame({"a": [1, 2], "b": pd.Categorical(["x", "y"])})
+    assert not is_numeric(mixed)
+    assert to_model_input(mixed) is mixed
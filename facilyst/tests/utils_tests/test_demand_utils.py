@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import AutoETSRegressor, CrostonOptimizedRegressor
+from facilyst.utils.demand_utils import (
+    classify_demand,
+    demand_classes,
+    demand_statistics,
+    forecast_by_demand,
+)
+
+
+def test_demand_statistics_matches_each_series():
+    rng = np.random.default_rng(0)
+    series = [
+        rng.poisson(3, size=30) * (rng.random(30) < 0.4),
+        np.array([5.0]),
+        np.array([]),
+        np.zeros(4),
+        20 + rng.normal(size=25),
+    ]
+    values = np.concatenate(series)
+    offsets = np.cumsum([0] + [len(each) for each in series])
+
+    adi, cv2 = demand_statistics(values, offsets)
+    for index, each in enumerate(series):
+        demands = each[each != 0]
+        if not len(demands):
+            assert np.isinf(adi[index]) and np.isnan(cv2[index])
+            continue
+        assert adi[index] == pytest.approx(len(each) / len(demands))
+        assert cv2[index] == pytest.approx(
+            np.var(demands) / np.mean(demands) ** 2, abs=1e-12
+        )
+
+
+def test_classify_demand():
+    classes = classify_demand(
+        np.array([1.0, 1.0, 2.0, 2.0, np.inf]),
+        np.array([0.1, 0.6, 0.1, 0.6, np.nan]),
+    )
+    assert list(classes) == [
+        "smooth",
+        "erratic",
+        "intermittent",
+        "lumpy",
+        "intermittent",
+    ]
+    assert list(
+        classify_demand(np.array([1.2]), np.array([0.3]), adi_threshold=1.1)
+    ) == ["intermittent"]
+
+
+def _panel():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.repeat(["smooth", "sparse", "lumpy"], 40),
+            "time": np.tile(pd.date_range("2021-01-01", periods=40, freq="D"), 3),
+            "target": np.concatenate(
+                [
+                    20 + rng.normal(size=40),
+                    np.where(np.arange(40) % 4 == 0, 5.0, 0.0),
+                    np.where(
+                        np.arange(40) % 5 == 0, np.resize([1.0, 30.0, 50.0], 40), 0.0
+                    ),
+                ]
+            ),
+        }
+    )
+
+
+def test_demand_classes():
+    data = _panel()
+    classes = demand_classes(data, "id", "time", "target")
+    assert list(classes.columns) == ["id", "adi", "cv2", "demand_class", "family"]
+    assert list(classes["demand_class"]) == ["smooth", "intermittent", "lumpy"]
+    assert list(classes["family"]) == ["automatic", "sparse", "sparse"]
+    np.testing.assert_allclose(classes["adi"][1:], [4.0, 5.0])
+
+    single = demand_classes(data["target"][data["id"] == "sparse"])
+    assert list(single.columns) == ["adi", "cv2", "demand_class", "family"]
+    assert single["demand_class"][0] == "intermittent"
+
+
+def test_forecast_by_demand():
+    data = _panel()
+    routes = {"lumpy": CrostonOptimizedRegressor()}
+    forecasts = forecast_by_demand(data, "id", "time", "target", 3, routes=routes)
+
+    assert list(forecasts.columns) == ["id", "time", "forecast", "demand_class"]
+    assert list(forecasts["id"]) == list(np.repeat(["smooth", "sparse", "lumpy"], 3))
+    assert list(forecasts["demand_class"].unique()) == [
+        "smooth",
+        "intermittent",
+        "lumpy",
+    ]
+    assert forecasts["time"].iloc[0] == pd.Timestamp("2021-02-10")
+
+    for series_id, model in [
+        ("smooth", AutoETSRegressor()),
+        ("sparse", CrostonOptimizedRegressor()),
+        ("lumpy", CrostonOptimizedRegressor()),
+    ]:
+        y = data["target"][data["id"] == series_id].to_numpy()
+        np.testing.assert_allclose(
+            forecasts["forecast"][forecasts["id"] == series_id],
+            model.fit(y).predict(horizon=3, as_array=True),
+            rtol=1e-6,
+        )
@@ -0,0 +1,77 @@
+import os
+import threading
+
+import pytest
+from threadpoolctl import threadpool_info
+
+from facilyst.utils import (
+    execution_context,
+    get_execution_config,
+    get_thread_budget,
+    set_execution_config,
+    split_thread_budget,
+)
+from facilyst.utils.execution_utils import limit_native_threads
+
+
+@pytest.fixture(autouse=True)
+def reset_execution_config():
+    set_execution_config(n_jobs=None)
+    yield
+    set_execution_config(n_jobs=None)
+
+
+def test_execution_context_overrides_and_restores():
+    assert get_thread_budget() is None
+
+    set_execution_config(n_jobs=4)
+    assert get_execution_config() == {"n_jobs": 4}
+
+    with execution_context(n_jobs=2) as config:
+        assert config == {"n_jobs": 2}
+        assert get_thread_budget() == 2
+        with execution_context(n_jobs=1):
+            assert get_thread_budget() == 1
+        assert get_thread_budget() == 2
+    assert get_thread_budget() == 4
+
+
+def test_execution_context_negative_n_jobs():
+    with execution_context(n_jobs=-1):
+        assert get_thread_budget() == (os.cpu_count() or 1)
+
+    with pytest.raises(ValueError, match="cannot be 0"):
+        set_execution_config(n_jobs=0)
+
+
+def test_global_config_is_visible_from_other_threads():
+    set_execution_config(n_jobs=3)
+    budgets = []
+    with execution_context(n_jobs=1):
+        thread = threading.Thread(target=lambda: budgets.append(get_thread_budget()))
+        thread.start()
+        thread.join()
+    assert budgets == [3]
+
+
+@pytest.mark.parametrize(
+    "num_tasks, budget, expected",
+    [(3, 8, (3, 2)), (10, 4, (4, 1)), (1, 6, (1, 6)), (0, 2, (1, 2))],
+)
+def test_split_thread_budget(num_tasks, budget, expected):
+    assert split_thread_budget(num_tasks, budget) == expected
+
+
+def test_limit_native_threads():
+    with execution_context(n_jobs=1):
+        with limit_native_threads():
+            assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+
+
+def test_execution_context_limits_native_threads_once():
+    original_threads = [pool["num_threads"] for pool in threadpool_info()]
+    with execution_context(n_jobs=1):
+        assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+        with execution_context(n_jobs=2):
+            assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+    assert [pool["num_threads"] for pool in threadpool_info()] == original_threads
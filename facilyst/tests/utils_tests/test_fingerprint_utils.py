@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.utils import fingerprint
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pd.DataFrame({"ints": [1, 2, 3], "strs": ["a", "b", "c"]}),
+        pd.Series([1.0, 2.0, 3.0]),
+        np.arange(12).reshape(3, 4),
+        np.array(["a", "b", "c"], dtype=object),
+        pd.Series([1, None, 3], dtype="Int64"),
+        pd.Series(["a", "b", "a"], dtype="category"),
+        pd.Series(pd.date_range("2020-01-01", periods=3, tz="UTC")),
+        pd.Series(["a", None, "c"], dtype="string"),
+    ],
+)
+def test_fingerprint_content_based(data):
+    assert fingerprint(data) == fingerprint(data.copy())
+
+    changed = data.copy()
+    if isinstance(changed, pd.DataFrame):
+        changed.iloc[0] = changed.iloc[1]
+    else:
+        changed[0] = changed[1]
+    assert fingerprint(data) != fingerprint(changed)
+
+
+def test_fingerprint_ignores_index():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    reindexed = df.set_axis([10, 11, 12])
+    assert fingerprint(df) == fingerprint(reindexed)
+    assert fingerprint(df, include_index=True) != fingerprint(
+        reindexed, include_index=True
+    )
+    assert fingerprint(df) != fingerprint(df.rename(columns={"a": "b"}))
+
+
+def test_fingerprint_includes_dtype_and_shape():
+    values = np.arange(12, dtype=np.int64)
+    assert fingerprint(values) != fingerprint(values.view(np.float64))
+    assert fingerprint(values) != fingerprint(values.reshape(3, 4))
+    assert fingerprint(pd.Series([1, 2], dtype="int64")) != fingerprint(
+        pd.Series([1, 2], dtype="Int64")
+    )
+    assert fingerprint(pd.Series(["a", "b"])) != fingerprint(
+        pd.Series(["a", "b"], dtype="category")
+    )
+
+
+def test_fingerprint_ignores_values_under_nullable_mask():
+    first = pd.array([1, 2, 3], dtype="Int64")
+    second = pd.array([1, 5, 3], dtype="Int64")
+    first[1], second[1] = pd.NA, pd.NA
+    assert fingerprint(pd.Series(first)) == fingerprint(pd.Series(second))
+
+
+def test_fingerprint_detects_changes_across_blocks():
+    values = np.random.default_rng(0).random(200_000)
+    original = fingerprint(values)
+
+    for position in (0, 40_000, 199_999):
+        changed = values.copy()
+        changed[position] = -changed[position]
+        assert fingerprint(changed) != original
+
+    swapped = values.copy()
+    swapped[[10, 100_000]] = swapped[[100_000, 10]]
+    assert fingerprint(swapped) != original
+
+    signs = values.copy()
+    signs[[5, 7]] *= -1
+    assert fingerprint(signs) != original
+
+
+def test_fingerprint_sampled():
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) * 0.5})
+    assert fingerprint(df, sample_rows=10) == fingerprint(df.copy(), sample_rows=10)
+    assert fingerprint(df, sample_rows=10) != fingerprint(df)
+    assert fingerprint(df, sample_rows=10) != fingerprint(df.iloc[:999], sample_rows=10)
+
+    last_changed = df.copy()
+    last_changed.iloc[-1, 0] = -1
+    assert fingerprint(df, sample_rows=10) != fingerprint(last_changed, sample_rows=10)
+
+    unsampled_changed = df.copy()
+    unsampled_changed.iloc[1, 0] = -1
+    assert fingerprint(df, sample_rows=10) == fingerprint(
+        unsampled_changed, sample_rows=10
+    )
+
+
+def test_fingerprint_arrow_strings():
+    pa = pytest.importorskip("pyarrow")
+    values = pd.Series(["a", None, "ccc", "dd"], dtype="string[pyarrow]")
+    assert fingerprint(values) == fingerprint(values.copy())
+    assert fingerprint(values) != fingerprint(values.astype(object))
+
+    rechunked = pd.Series(
+        pd.arrays.ArrowStringArray(
+            pa.chunked_array([pa.array(["a", None]), pa.array(["ccc", "dd"])])
+        )
+    )
+    assert fingerprint(values) == fingerprint(rechunked)
+
+    changed = values.copy()
+    changed[2] = "ccd"
+    assert fingerprint(values) != fingerprint(changed)
+
+
+def test_fingerprint_independent_of_memory_layout():
+    values = np.random.default_rng(0).random((70_000, 7))
+    row_major = pd.DataFrame(values)
+    column_major = pd.DataFrame(np.asfortranarray(values))
+    mixed_blocks = pd.concat(
+        [row_major.iloc[:, :3], column_major.iloc[:, 3:].copy()], axis=1
+    )
+    assert fingerprint(row_major) == fingerprint(column_major)
+    assert fingerprint(row_major) == fingerprint(mixed_blocks)
+
+    changed = row_major.copy()
+    changed.iloc[50_000, 6] += 1
+    assert fingerprint(changed) != fingerprint(row_major)
+
+
+@pytest.mark.parametrize(
+    "data", [pd.DataFrame(), pd.DataFrame(index=range(3))], ids=["empty", "no_columns"]
+)
+def test_fingerprint_without_columns(data):
+    assert fingerprint(data) == fingerprint(data.copy())
+    assert fingerprint(pd.DataFrame()) != fingerprint(pd.DataFrame(index=range(3)))
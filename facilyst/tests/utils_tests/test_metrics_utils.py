@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score,
+    log_loss,
+    mean_absolute_error,
+    mean_squared_error,
+    precision_score,
+    r2_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from facilyst.utils.metrics_utils import (
+    evaluate_predictions,
+    metric_to_loss,
+    needs_probabilities,
+)
+
+
+def test_evaluate_predictions_regression():
+    rng = np.random.default_rng(0)
+    y_actual = pd.Series(rng.normal(size=200))
+    predictions = y_actual + rng.normal(scale=0.3, size=200)
+
+    results = evaluate_predictions(
+        y_actual, ["mse", "rmse", "mae", "r2"], predictions=predictions
+    )
+    assert list(results) == ["mse", "rmse", "mae", "r2"]
+    assert results["mse"] == pytest.approx(mean_squared_error(y_actual, predictions))
+    assert results["rmse"] == pytest.approx(
+        np.sqrt(mean_squared_error(y_actual, predictions))
+    )
+    assert results["mae"] == pytest.approx(mean_absolute_error(y_actual, predictions))
+    assert results["r2"] == pytest.approx(r2_score(y_actual, predictions))
+
+
+def test_evaluate_predictions_mase():
+    y_train = np.array([1.0, 3.0, 2.0, 4.0, 3.0, 5.0])
+    y_actual = np.array([4.0, 6.0])
+    predictions = np.array([5.0, 5.0])
+
+    results = evaluate_predictions(
+        y_actual, ["mase"], predictions=predictions, y_train=y_train, season_length=2
+    )
+    assert results["mase"] == pytest.approx(1.0 / 1.0)
+
+    with pytest.raises(ValueError, match="MASE requires `y_train`"):
+        evaluate_predictions(y_actual, ["mase"], predictions=predictions)
+
+
+@pytest.mark.parametrize("num_classes", [2, 3])
+def test_evaluate_predictions_classification(num_classes):
+    rng = np.random.default_rng(1)
+    classes = np.array(["a", "b", "c"][:num_classes])
+    y_actual = classes[rng.integers(0, num_classes, size=300)]
+    probabilities = rng.dirichlet(np.ones(num_classes), size=300)
+    predictions = classes[np.argmax(probabilities, axis=1)]
+
+    metrics = ["accuracy", "precision", "recall", "f1", "log_loss", "auc"]
+    results = evaluate_predictions(
+        y_actual,
+        metrics,
+        predictions=predictions,
+        probabilities=probabilities,
+        classes=classes,
+    )
+    assert results["accuracy"] == pytest.approx(accuracy_score(y_actual, predictions))
+    assert results["precision"] == pytest.approx(
+        precision_score(y_actual, predictions, average="macro", zero_division=0)
+    )
+    assert results["recall"] == pytest.approx(
+        recall_score(y_actual, predictions, average="macro", zero_division=0)
+    )
+    assert results["f1"] == pytest.approx(
+        f1_score(y_actual, predictions, average="macro", zero_division=0)
+    )
+    assert results["log_loss"] == pytest.approx(
+        log_loss(y_actual, probabilities, labels=classes)
+    )
+    if num_classes == 2:
+        expected_auc = roc_auc_score(y_actual == classes[1], probabilities[:, 1])
+    else:
+        expected_auc = roc_auc_score(
+            y_actual, probabilities, multi_class="ovr", labels=classes
+        )
+    assert results["auc"] == pytest.approx(expected_auc)
+
+
+def test_evaluate_predictions_errors():
+    with pytest.raises(ValueError, match="The metric `not_a_metric` isn't recognized!"):
+        evaluate_predictions([1, 2], ["not_a_metric"], predictions=[1, 2])
+
+    with pytest.raises(ValueError, match="y_actual contains labels"):
+        evaluate_predictions(
+            ["a", "d"], ["accuracy"], predictions=["a", "b"], classes=["a", "b"]
+        )
+
+
+def test_needs_probabilities_and_metric_to_loss():
+    assert not needs_probabilities(["r2", "accuracy"])
+    assert needs_probabilities(["accuracy", "AUC"])
+    assert metric_to_loss("r2", 0.75) == -0.75
+    assert metric_to_loss("rmse", 0.75) == 0.75
+
+    with pytest.raises(ValueError, match="The predictions contain labels"):
+        evaluate_predictions(
+            ["a", "b"], ["f1"], predictions=["a", "d"], classes=["a", "b"]
+        )
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.utils.panel_utils import future_times, map_shards, split_panel
+
+
+def test_split_panel_sorts_and_views():
+    data = pd.DataFrame(
+        {
+            "id": ["b", "a", "b", "a", "b"],
+            "time": [2, 1, 1, 2, 3],
+            "target": [20.0, 1.0, 10.0, 2.0, 30.0],
+        }
+    )
+    panel = split_panel(data, "id", "time", "target")
+
+    assert list(panel.ids) == ["b", "a"]
+    np.testing.assert_array_equal(panel.offsets, [0, 3, 5])
+    np.testing.assert_array_equal(panel.series(0), [10.0, 20.0, 30.0])
+    np.testing.assert_array_equal(panel.series(1), [1.0, 2.0])
+    assert np.shares_memory(panel.series(1), panel.values)
+    np.testing.assert_array_equal(panel.last_times, [3, 2])
+    assert panel.frequency is None
+
+
+def test_split_panel_infers_frequency_once():
+    data = pd.DataFrame(
+        {
+            "id": ["short", "long", "long", "long"],
+            "time": pd.to_datetime(
+                ["2020-01-31", "2020-01-31", "2020-02-29", "2020-03-31"]
+            ),
+            "target": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    panel = split_panel(data, "id", "time", "target")
+    assert panel.frequency == "M"
+    np.testing.assert_array_equal(
+        future_times(panel.last_times, 2, panel.frequency),
+        pd.to_datetime(["2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31"]),
+    )
+
+
+def test_future_times():
+    np.testing.assert_array_equal(
+        future_times(np.array([5, 9]), 2, None), [6, 7, 10, 11]
+    )
+    with pytest.raises(ValueError, match="couldn't be inferred"):
+        future_times(pd.to_datetime(["2020-01-01"]).to_numpy(), 2, None)
+
+
+def _sum_shard(values):
+    return values.sum()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_map_shards(n_jobs):
+    values = np.arange(100)
+    totals = map_shards(
+        _sum_shard, len(values), lambda start, end: (values[start:end],), n_jobs=n_jobs
+    )
+    assert len(totals) == min(4 * n_jobs, 100)
+    assert sum(totals) == values.sum()
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import CrostonOptimizedRegressor, RandomForestRegressor
+from facilyst.utils.scoring_utils import ChunkWriter, read_chunks, score_file
+
+
+@pytest.fixture
+def saved_regressor(numeric_features_regression, tmp_path):
+    x, y = numeric_features_regression
+    x = pd.DataFrame(x, columns=[f"Col_{i}" for i in range(x.shape[1])])
+    model = RandomForestRegressor(n_estimators=10).fit(x, y)
+    model.save(tmp_path / "model.pkl")
+    return model, x
+
+
+def test_read_chunks_and_chunk_writer_round_trip(tmp_path):
+    data = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) * 0.5})
+    with ChunkWriter(tmp_path / "data.csv") as writer:
+        for start in range(0, 10, 4):
+            writer.write(data.iloc[start : start + 4])
+
+    chunks = list(read_chunks(tmp_path / "data.csv", chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_score_file_predicts_in_chunks(saved_regressor, tmp_path, workers):
+    model, x = saved_regressor
+    x.insert(0, "row_id", np.arange(len(x)) + 100)
+    x.to_csv(tmp_path / "input.csv", index=False)
+
+    progress = []
+    results = score_file(
+        tmp_path / "model.pkl",
+        tmp_path / "input.csv",
+        tmp_path / "output.csv",
+        chunk_size=30,
+        workers=workers,
+        id_column="row_id",
+        progress=lambda num_rows, _: progress.append(num_rows),
+    )
+
+    assert results["rows"] == len(x)
+    assert results["rows_per_second"] > 0
+    assert progress == [30, 60, 90, 100]
+    output = pd.read_csv(tmp_path / "output.csv")
+    assert list(output.columns) == ["row_id", "prediction"]
+    np.testing.assert_array_equal(output["row_id"], x["row_id"])
+    np.testing.assert_allclose(
+        output["prediction"], model.predict(x.drop(columns=["row_id"]), as_array=True)
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1000])
+def test_score_file_forecasts_every_series(tmp_path, chunk_size):
+    rng = np.random.default_rng(0)
+    series = {
+        series_id: rng.poisson(2, size=30 + series_id).astype(float)
+        for series_id in range(3)
+    }
+    pd.DataFrame(
+        {
+            "series_id": np.repeat(
+                list(series.keys()), [len(values) for values in series.values()]
+            ),
+            "target": np.concatenate(list(series.values())),
+        }
+    ).to_csv(tmp_path / "input.csv", index=False)
+    model = CrostonOptimizedRegressor()
+    model.save(tmp_path / "model.pkl")
+
+    results = score_file(
+        tmp_path / "model.pkl",
+        tmp_path / "input.csv",
+        tmp_path / "output.csv",
+        chunk_size=chunk_size,
+        id_column="series_id",
+        target_column="target",
+        horizon=4,
+    )
+
+    assert results["rows"] == sum(len(values) for values in series.values())
+    output = pd.read_csv(tmp_path / "output.csv")
+    assert list(output.columns) == ["series_id", "step", "forecast"]
+    for series_id, values in series.items():
+        forecasts = output[output["series_id"] == series_id]
+        np.testing.assert_array_equal(forecasts["step"], [1, 2, 3, 4])
+        np.testing.assert_allclose(
+            forecasts["forecast"],
+            model.forecast(y_train=values, horizon=4, as_array=True),
+        )
+
+
+def test_score_file_time_series_needs_target_and_horizon(tmp_path):
+    pd.DataFrame({"target": [1.0, 2.0, 3.0]}).to_csv(tmp_path / "input.csv")
+    CrostonOptimizedRegressor().save(tmp_path / "model.pkl")
+    with pytest.raises(ValueError, match="need a `target_column` and a `horizon`"):
+        score_file(tmp_path / "model.pkl", tmp_path / "input.csv", tmp_path / "out.csv")
+
+
+@pytest.mark.needs_extra_dependency
+def test_score_file_parquet(saved_regressor, tmp_path):
+    pytest.importorskip("pyarrow")
+    model, x = saved_regressor
+    x.to_parquet(tmp_path / "input.parquet")
+
+    score_file(
+        tmp_path / "model.pkl",
+        tmp_path / "input.parquet",
+        tmp_path / "output.parquet",
+        chunk_size=40,
+    )
+
+    output = pd.read_parquet(tmp_path / "output.parquet")
+    np.testing.assert_allclose(output["prediction"], model.predict(x, as_array=True))
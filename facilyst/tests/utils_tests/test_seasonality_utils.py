@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.utils.seasonality_utils import (
+    detect_season_length,
+    season_length_candidates,
+)
+
+
+def _seasonal_series(season_length, length=120, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.arange(length)
+    return (
+        20
+        + 0.1 * times
+        + 3 * np.sin(2 * np.pi * times / season_length)
+        + rng.normal(0, 0.5, length)
+    )
+
+
+@pytest.mark.parametrize("season_length", [4, 7, 12, 24])
+def test_detect_season_length(season_length):
+    y = _seasonal_series(season_length)
+
+    assert detect_season_length(y) == season_length
+    assert detect_season_length(pd.Series(y)) == season_length
+
+
+def test_detect_season_length_without_seasonality():
+    rng = np.random.default_rng(0)
+
+    assert detect_season_length(rng.normal(size=100)) == 1
+    assert detect_season_length(np.arange(50.0)) == 1
+    assert detect_season_length(np.ones(30)) == 1
+    assert detect_season_length(np.array([1.0, 2.0])) == 1
+    assert detect_season_length(np.array([])) == 1
+
+
+def test_detect_season_length_max_season_length():
+    y = _seasonal_series(24)
+
+    assert detect_season_length(y, max_season_length=12) != 24
+    # A season only counts if the series holds two of them.
+    assert detect_season_length(y[:40]) != 24
+
+
+def test_season_length_candidates_matches_each_series():
+    series = [
+        _seasonal_series(7, length=90, seed=1),
+        np.zeros(0),
+        _seasonal_series(12, length=150, seed=2),
+        np.random.default_rng(3).normal(size=60),
+        _seasonal_series(4, length=30, seed=4),
+    ]
+    values = np.concatenate(series)
+    offsets = np.cumsum([0] + [len(each) for each in series])
+
+    candidates = season_length_candidates(values, offsets, num_candidates=2)
+    assert candidates.shape == (5, 2)
+    np.testing.assert_array_equal(candidates[:, 0], [7, 0, 12, 0, 4])
+    assert candidates[0, 1] == 14 and candidates[2, 1] == 24
+    # Chunking the series doesn't change the candidates.
+    np.testing.assert_array_equal(
+        season_length_candidates(values, offsets, num_candidates=2, chunk_size=1),
+        candidates,
+    )
+    for index, each in enumerate(series):
+        assert detect_season_length(each) == max(candidates[index, 0], 1)
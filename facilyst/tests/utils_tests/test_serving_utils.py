@@ -0,0 +1,151 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import RandomForestRegressor
+from facilyst.utils.serving_utils import Histogram, MicroBatcher, start_server
+
+
+def test_histogram():
+    histogram = Histogram((1, 10))
+    histogram.observe(0.5)
+    histogram.observe(10)
+    histogram.observe(50, count=2)
+
+    assert histogram.to_dict() == {
+        "count": 4,
+        "mean": pytest.approx(27.625),
+        "buckets": {"<=1": 1, "<=10": 1, ">10": 2},
+    }
+
+
+def test_micro_batcher_coalesces_requests():
+    batch_sizes = []
+    lock = threading.Lock()
+
+    def _predict(rows):
+        with lock:
+            batch_sizes.append(len(rows))
+        return rows["a"].to_numpy() * 2
+
+    async def _run():
+        batcher = MicroBatcher(_predict, max_batch_size=8, max_wait_ms=50)
+        await batcher.start()
+        results = await asyncio.gather(
+            *(batcher.submit(pd.DataFrame({"a": [index]})) for index in range(20))
+        )
+        await batcher.stop()
+        return results, batcher.metrics.to_dict()
+
+    results, metrics = asyncio.run(_run())
+
+    assert [result.tolist() for result in results] == [
+        [index * 2] for index in range(20)
+    ]
+    assert sum(batch_sizes) == 20
+    assert max(batch_sizes) <= 8
+    assert len(batch_sizes) < 20
+    assert metrics["requests"] == 20
+    assert metrics["batches"] == len(batch_sizes)
+    assert metrics["latency_ms"]["count"] == 20
+
+
+def test_micro_batcher_errors():
+    def _predict(rows):
+        raise RuntimeError("broken model")
+
+    async def _run():
+        batcher = MicroBatcher(_predict, max_wait_ms=0)
+        await batcher.start()
+        with pytest.raises(RuntimeError, match="broken model"):
+            await batcher.submit(pd.DataFrame({"a": [1]}))
+        await batcher.stop()
+        return batcher.metrics.errors
+
+    assert asyncio.run(_run()) == 1
+
+    with pytest.raises(ValueError, match="`max_batch_size` must be at least 1"):
+        MicroBatcher(_predict, max_batch_size=0)
+
+
+async def _request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(response_body)
+
+
+def test_server(numeric_features_regression):
+    x, y = numeric_features_regression
+    model = RandomForestRegressor(n_estimators=10, n_jobs=1).fit(x, y)
+
+    async def _run():
+        server, batcher = await start_server(model, port=0, max_wait_ms=20)
+        port = server.sockets[0].getsockname()[1]
+        responses = await asyncio.gather(
+            *(
+                _request(port, "POST", "/predict", {"instances": [x[index].tolist()]})
+                for index in range(10)
+            )
+        )
+        errors = [
+            await _request(port, "POST", "/predict", {"rows": []}),
+            await _request(port, "GET", "/predict"),
+            await _request(port, "GET", "/missing"),
+        ]
+        health = await _request(port, "GET", "/health")
+        metrics = await _request(port, "GET", "/metrics")
+        server.close()
+        await server.wait_closed()
+        await batcher.stop()
+        return responses, errors, health, metrics
+
+    responses, errors, health, metrics = asyncio.run(_run())
+
+    expected = model.predict(x[:10], as_array=True)
+    for index, (status, payload) in enumerate(responses):
+        assert status == 200
+        np.testing.assert_allclose(payload["predictions"], expected[index : index + 1])
+    assert [status for status, _ in errors] == [400, 405, 404]
+    assert health == (200, {"status": "ok"})
+    status, metrics = metrics
+    assert status == 200
+    assert metrics["requests"] == 10
+    assert metrics["batches"] < 10
+    assert set(metrics["latency_ms"]) == {"count", "mean", "buckets"}
+
+
+@pytest.mark.parametrize("content_length", ["ten", "-5"])
+def test_server_malformed_content_length(content_length, numeric_features_regression):
+    x, y = numeric_features_regression
+    model = RandomForestRegressor(n_estimators=2, n_jobs=1).fit(x, y)
+
+    async def _run():
+        server, batcher = await start_server(model, port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"POST /predict HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n".encode()
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        await batcher.stop()
+        return response
+
+    head, _, body = asyncio.run(_run()).partition(b"\r\n\r\n")
+    assert int(head.split()[1]) == 400
+    assert json.loads(body) == {"error": "Malformed Content-Length header."}
@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+from statsforecast.models import ADIDA, IMAPA, TSB, CrostonOptimized, _ses_fcst_mse
+
+from facilyst.utils.smoothing_utils import (
+    aggregate_state,
+    aggregation_level,
+    batch_adida_forecasts,
+    batch_croston_forecasts,
+    batch_imapa_forecasts,
+    batch_optimized_ses,
+    batch_ses,
+    batch_tsb_forecasts,
+    croston_state,
+    imapa_states,
+    optimized_ses_alpha,
+    ses_level,
+    tsb_state,
+    update_aggregate_state,
+    update_croston_state,
+    update_imapa_states,
+    update_tsb_state,
+)
+
+
+def _sparse_series(length=90, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.poisson(3, length).astype(float) * (rng.random(length) < 0.4)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_states_reproduce_statsforecast_forecasts(seed):
+    y = _sparse_series(seed=seed)
+    empty = np.array([])
+
+    for state, update, estimator in [
+        (croston_state(y), update_croston_state, CrostonOptimized()),
+        (tsb_state(y, 0.2, 0.1), update_tsb_state, TSB(alpha_d=0.2, alpha_p=0.1)),
+        (aggregate_state(y, aggregation_level(y)), update_aggregate_state, ADIDA()),
+        (imapa_states(y), update_imapa_states, IMAPA()),
+    ]:
+        expected = estimator.fit(y).predict(h=1)["mean"][0]
+        assert update(state, empty) == pytest.approx(expected, rel=1e-6)
+
+
+def test_states_without_demand():
+    y = np.zeros(10)
+    assert update_croston_state(croston_state(y), np.array([])) == 0.0
+    assert update_tsb_state(tsb_state(y, 0.2, 0.2), np.array([])) == 0.0
+    state = aggregate_state(y, aggregation_level(y))
+    assert update_aggregate_state(state, np.array([])) == 0.0
+
+    state = croston_state(y)
+    assert update_croston_state(state, np.array([0.0, 4.0])) == pytest.approx(4 / 12)
+
+
+def test_updates_match_the_recursions_over_the_full_series():
+    y = _sparse_series()
+    state = croston_state(y[:60])
+    update_croston_state(state, y[60:])
+    demands = y[y > 0]
+    assert state["demand"] == pytest.approx(ses_level(demands, state["demand_alpha"]))
+
+    state = tsb_state(y[:60], 0.2, 0.1)
+    update_tsb_state(state, y[60:])
+    assert state == pytest.approx(tsb_state(y, 0.2, 0.1))
+
+    # Whole buckets line up with the buckets of the full series.
+    state = aggregate_state(y[:60], 3)
+    update_aggregate_state(state, y[60:88])
+    expected = ses_level(y[:90].reshape(-1, 3).sum(axis=1)[:-1], state["alpha"])
+    assert state["level"] == pytest.approx(expected)
+    assert state["bucket"] == y[87] and state["count"] == 1
+
+
+def _packed(series):
+    return np.concatenate(series), np.cumsum([0] + [len(each) for each in series])
+
+
+def test_batch_ses_matches_statsforecast():
+    rng = np.random.default_rng(0)
+    series = [rng.normal(10, 2, size=length) for length in [7, 1, 0, 30, 12]]
+    values, offsets = _packed(series)
+    alphas = np.array([0.1, 0.25, 0.6])
+
+    forecasts, mse = batch_ses(values, offsets, alphas)
+    assert forecasts.shape == mse.shape == (5, 3)
+    assert np.isnan(forecasts[2]).all() and np.isnan(mse[2]).all()
+    for index, each in enumerate(series):
+        if not len(each):
+            continue
+        for column, alpha in enumerate(alphas):
+            expected_forecast, expected_mse, _ = _ses_fcst_mse(each, alpha)
+            assert forecasts[index, column] == pytest.approx(expected_forecast)
+            assert mse[index, column] == pytest.approx(expected_mse)
+
+
+def test_batch_optimized_ses_is_at_least_as_good_as_the_optimizer():
+    rng = np.random.default_rng(1)
+    series = [rng.poisson(5, size=rng.integers(2, 40)) + 1.0 for _ in range(50)]
+    series.append(np.array([4.0]))
+    values, offsets = _packed(series)
+
+    forecasts, alphas = batch_optimized_ses(values, offsets)
+    assert ((alphas >= 0.1) & (alphas <= 0.3)).all()
+    assert alphas[-1] == 0.1 and forecasts[-1] == 4.0
+    for index, each in enumerate(series[:-1]):
+        _, grid_mse, _ = _ses_fcst_mse(each, alphas[index])
+        _, optimizer_mse, _ = _ses_fcst_mse(each, optimized_ses_alpha(each))
+        assert grid_mse <= optimizer_mse + 1e-4
+        assert forecasts[index] == pytest.approx(_ses_fcst_mse(each, alphas[index])[0])
+
+
+def test_batch_forecasts_match_statsforecast():
+    series = [_sparse_series(length=30 + 10 * seed, seed=seed) for seed in range(20)]
+    series += [np.zeros(6), np.array([2.0]), np.array([0.0, 0.0, 5.0])]
+    values, offsets = _packed(series)
+
+    for batch_forecasts, estimator in [
+        (batch_croston_forecasts, CrostonOptimized()),
+        (lambda *data: batch_tsb_forecasts(*data, 0.2, 0.1), TSB(0.2, 0.1)),
+        (batch_adida_forecasts, ADIDA()),
+        (batch_imapa_forecasts, IMAPA()),
+    ]:
+        expected = np.array(
+            [estimator.forecast(y=each, h=1)["mean"][0] for each in series]
+        )
+        # The grid search may find a slightly different, never worse, optimum than statsforecast's optimizer.
+        np.testing.assert_allclose(
+            batch_forecasts(values, offsets), expected, rtol=0.05, atol=1e-12
+        )
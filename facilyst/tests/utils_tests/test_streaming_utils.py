@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from facilyst.models import (
+    ADIDARegressor,
+    AutoETSRegressor,
+    CrostonOptimizedRegressor,
+    IMAPARegressor,
+    TSBRegressor,
+)
+from facilyst.utils.smoothing_utils import (
+    update_aggregate_state,
+    update_croston_state,
+    update_imapa_states,
+    update_tsb_state,
+)
+from facilyst.utils.streaming_utils import StreamingSparseForecaster
+
+update_functions = {
+    CrostonOptimizedRegressor: update_croston_state,
+    TSBRegressor: update_tsb_state,
+    ADIDARegressor: update_aggregate_state,
+    IMAPARegressor: update_imapa_states,
+}
+
+
+@pytest.fixture
+def sparse_panel():
+    rng = np.random.default_rng(0)
+    frames = []
+    for index, length in enumerate([30, 24, 18, 12]):
+        values = rng.poisson(4, size=length) * (rng.random(length) < 0.3 + 0.2 * index)
+        frames.append(
+            pd.DataFrame({"id": f"s{index}", "time": np.arange(length), "y": values})
+        )
+    frames.append(pd.DataFrame({"id": "zeros", "time": np.arange(10), "y": 0}))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [CrostonOptimizedRegressor, TSBRegressor, ADIDARegressor, IMAPARegressor],
+)
+def test_streaming_sparse_forecaster_matches_update(model_class, sparse_panel):
+    rng = np.random.default_rng(1)
+    ids = np.array(["s0", "s1", "s2", "s3", "zeros", "new"])
+    events = pd.DataFrame(
+        {
+            "id": rng.choice(ids, size=60),
+            "y": rng.poisson(3, size=60) * (rng.random(60) < 0.5),
+        }
+    )
+
+    streaming = StreamingSparseForecaster(model_class()).fit(
+        sparse_panel, "id", "time", "y"
+    )
+    np.testing.assert_array_equal(streaming.ids, ["s0", "s1", "s2", "s3", "zeros"])
+    # Half of the events one at a time, the rest in one batch with repeated series.
+    for id_, value in events.iloc[:30].itertuples(index=False):
+        streaming.update([id_], [value])
+    streaming.update(events["id"].iloc[30:], events["y"].iloc[30:])
+    assert len(streaming) == 6
+
+    for id_ in ids:
+        history = sparse_panel.loc[sparse_panel["id"] == id_, "y"].to_numpy()
+        new = events.loc[events["id"] == id_, "y"].to_numpy()
+        if len(history):
+            model = model_class().fit(pd.Series(history, dtype=float))
+            model.update(pd.Series(new, dtype=float))
+            expected = model.predict(horizon=1).iloc[0]
+        else:
+            # Series first seen while streaming start without history.
+            expected = update_functions[model_class](streaming._empty_state(), new)
+        np.testing.assert_allclose(
+            streaming.forecast([id_]), [expected], rtol=1e-6, atol=1e-12
+        )
+
+
+def test_streaming_sparse_forecaster_forecast_order(sparse_panel):
+    streaming = StreamingSparseForecaster(TSBRegressor()).fit(
+        sparse_panel, "id", "time", "y"
+    )
+    forecasts = streaming.forecast()
+    np.testing.assert_array_equal(
+        streaming.forecast(["zeros", "s1"]), forecasts[[4, 1]]
+    )
+    assert forecasts[4] == 0
+
+    with pytest.raises(ValueError, match="aren't tracked"):
+        streaming.forecast(["missing"])
+
+
+def test_streaming_sparse_forecaster_errors():
+    with pytest.raises(ValueError, match="can be streamed"):
+        StreamingSparseForecaster(AutoETSRegressor())
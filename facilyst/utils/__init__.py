@@ -1,3 +1,6 @@
+from .async_utils import get_async_executor, run_in_executor, set_async_executor
+from .backtest_utils import backtest
+from .conversion_utils import clear_conversion_cache, to_array
 from .dataset_utils import (
     binary_dataset_names,
     get_dataset,
@@ -10,5 +13,22 @@ from .dataset_utils import (
     multiclass_datasets,
     ts_regression_datasets,
 )
+from .demand_utils import (
+    classify_demand,
+    demand_classes,
+    demand_statistics,
+    forecast_by_demand,
+)
+from .execution_utils import (
+    execution_context,
+    get_execution_config,
+    get_thread_budget,
+    set_execution_config,
+    split_thread_budget,
+)
+from .fingerprint_utils import fingerprint
 from .gen_utils import _get_subclasses, import_errors_dict, import_or_raise
 from .main_utils import create_data, make_dates, make_features, make_wave
+from .metrics_utils import evaluate_predictions, metrics_dict
+from .seasonality_utils import detect_season_length, season_length_candidates
+from .streaming_utils import StreamingSparseForecaster
@@ -0,0 +1,50 @@
+"""Utility functions that run blocking facilyst calls from asyncio code without blocking the event loop."""
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional
+
+_async_config = {"executor": None}
+
+
+def set_async_executor(executor: Optional[Executor] = None) -> None:
+    """Sets the executor that the awaitable model methods, such as `afit` and `apredict`, run their calls on.
+
+    :param executor: The executor to run calls on. None uses the default executor of the running event loop.
+    :type executor: concurrent.futures.Executor, optional
+    """
+    _async_config["executor"] = executor
+
+
+def get_async_executor() -> Optional[Executor]:
+    """Returns the executor that the awaitable model methods run their calls on, or None for the loop's default.
+
+    :return: The executor.
+    :rtype concurrent.futures.Executor:
+    """
+    return _async_config["executor"]
+
+
+async def run_in_executor(
+    func: Callable, *args, executor: Optional[Executor] = None, **kwargs
+) -> Any:
+    """Runs a blocking call on an executor and waits for its result without blocking the event loop.
+
+    The call runs with a copy of the current context, so an `execution_context` core budget set in the calling task
+    also applies to the call. If the awaiting task is cancelled before the call has started running, the call never
+    runs. A call that is already running can't be interrupted, so it finishes in the background and its result is
+    discarded.
+
+    :param func: The blocking function to call.
+    :type func: callable
+    :param executor: The executor to run the call on. Defaults to the executor set with `set_async_executor`, or the
+    default executor of the running event loop.
+    :type executor: concurrent.futures.Executor, optional
+    :return: The result of the call.
+    :rtype object:
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor or get_async_executor(), call)
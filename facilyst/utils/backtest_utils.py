@@ -0,0 +1,249 @@
+"""Utility functions that backtest time series models over rolling forecast origins."""
+import copy
+import warnings
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.metrics_utils import evaluate_predictions
+from facilyst.utils.panel_utils import map_shards, split_panel
+from facilyst.utils.seasonality_utils import detect_season_length
+
+
+def _cutoffs(length: int, horizon: int, n_windows: int, step: int) -> np.ndarray:
+    """The number of training observations of each window, where the last window ends with the series."""
+    cutoffs = length - horizon - step * np.arange(n_windows - 1, -1, -1)
+    return cutoffs[cutoffs >= 1]
+
+
+def _backtest_tasks(
+    model: Any, tasks: List[tuple], horizon: int, refit_every: int
+) -> List[np.ndarray]:
+    """Forecasts every window of every task, where a task is a series, its features, and its cutoffs.
+
+    The series and features of a task are views, and each window trains on a slice of them. The model is refitted on
+    the first window and every `refit_every` windows after it. In between, the fitted model is updated with the
+    observations since the previous window, which advances its state without selecting new parameters. Windows that
+    fail are left as NaN.
+    """
+    results = []
+    for y, x, cutoffs in tasks:
+        forecasts = np.full((len(cutoffs), horizon), np.nan)
+        estimator = copy.deepcopy(model)
+        fitted_cutoff = None
+        for window, cutoff in enumerate(cutoffs):
+            x_train = None if x is None else x[:cutoff]
+            x_future = None if x is None else x[cutoff : cutoff + horizon]
+            try:
+                if refit_every == 1:
+                    estimator._set_season_length(y[:cutoff])
+                    forecasts[window] = estimator.model.forecast(
+                        y=y[:cutoff], h=horizon, X=x_train, X_future=x_future
+                    )["mean"]
+                    continue
+                if window % refit_every == 0:
+                    estimator.fit(y[:cutoff], x_train)
+                elif fitted_cutoff is not None:
+                    estimator.update(
+                        y[fitted_cutoff:cutoff],
+                        None if x is None else x[fitted_cutoff:cutoff],
+                    )
+                else:
+                    continue
+                fitted_cutoff = cutoff
+                forecasts[window] = estimator.predict(
+                    horizon=horizon, x_test=x_future, as_array=True
+                )
+            except Exception:
+                fitted_cutoff = None
+                continue
+        results.append(forecasts)
+    return results
+
+
+def _window_frames(
+    forecasts: np.ndarray,
+    actuals: np.ndarray,
+    times: np.ndarray,
+    cutoffs: np.ndarray,
+    metrics: List[str],
+    season_length: int,
+) -> Tuple[dict, List[dict]]:
+    """The long-format forecast columns and the metric rows of the windows of one series."""
+    horizon = forecasts.shape[1]
+    positions = cutoffs[:, np.newaxis] + np.arange(horizon)
+    columns = {
+        "window": np.repeat(np.arange(len(cutoffs)), horizon),
+        "cutoff": np.repeat(times[cutoffs - 1], horizon),
+        "time": times[positions].ravel(),
+        "actual": actuals[positions].ravel(),
+        "forecast": forecasts.ravel(),
+    }
+    rows = []
+    for window, cutoff in enumerate(cutoffs):
+        row = {"window": window, "cutoff": times[cutoff - 1]}
+        if np.isnan(forecasts[window]).any():
+            row.update({metric: np.nan for metric in metrics})
+        else:
+            row.update(
+                evaluate_predictions(
+                    y_actual=actuals[cutoff : cutoff + horizon],
+                    metrics=metrics,
+                    predictions=forecasts[window],
+                    y_train=actuals[:cutoff],
+                    season_length=season_length,
+                )
+            )
+        rows.append(row)
+    return columns, rows
+
+
+def backtest(
+    model: Any,
+    y: Union[pd.Series, np.ndarray, pd.DataFrame],
+    x: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    horizon: int = 1,
+    n_windows: int = 3,
+    step: Optional[int] = None,
+    refit_every: int = 1,
+    metrics: Optional[List[str]] = None,
+    id_column: Optional[str] = None,
+    time_column: Optional[str] = None,
+    target_column: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Backtests a time series model over rolling forecast origins, on a single series or on a panel of series.
+
+    The last window ends with the series and every earlier window ends `step` observations before the next. Each window
+    trains on a slice of the history up to its origin, without copying it. With `refit_every` greater than 1, the model
+    is only refitted every that many windows, and updated with the new observations for the windows in between.
+    Independent windows, or series for a panel, run in parallel worker processes. Windows that can't be forecast get
+    NaN forecasts and metrics, and a warning.
+
+    :param model: The time series model to backtest. It isn't modified.
+    :type model: TimeSeriesModelBase
+    :param y: The target of a single series, or a long-format DataFrame of many series along with `id_column`,
+    `time_column`, and `target_column`.
+    :type y: pd.Series, np.ndarray, or pd.DataFrame
+    :param x: The features of a single series. Not supported for panels.
+    :type x: pd.DataFrame or np.ndarray, optional
+    :param horizon: The number of steps forecast in each window.
+    :type horizon: int
+    :param n_windows: The number of windows per series. Windows that would leave no training data are skipped.
+    :type n_windows: int
+    :param step: The number of observations between the origins of consecutive windows. Defaults to the horizon.
+    :type step: int, optional
+    :param refit_every: Refit the model every this many windows.
+    :type refit_every: int
+    :param metrics: The metrics computed for each window, see `metrics_dict` for all options. Defaults to `rmse`,
+    `mae`, and `mase`. The naive baseline of `mase` uses the season length of the model, detected on each series when the
+    model detects its own.
+    :type metrics: list, optional
+    :param id_column: The column that identifies each series of a panel.
+    :type id_column: str, optional
+    :param time_column: The column holding the time of each row of a panel.
+    :type time_column: str, optional
+    :param target_column: The column holding the target values of a panel.
+    :type target_column: str, optional
+    :param n_jobs: The number of cores to use, -1 uses all available cores. Defaults to the current core budget, or
+    every core if none is set.
+    :type n_jobs: int, optional
+    :return: The forecasts, with the window, its cutoff, the time, the actual value, and the forecast of every step,
+    and the metrics of every window.
+    :rtype tuple: pd.DataFrame, pd.DataFrame
+    :raises ValueError: If a single series is too short for any window.
+    """
+    step = step or horizon
+    metrics = metrics or ["rmse", "mae", "mase"]
+    season_length = (model.parameters or {}).get("season_length", 1)
+
+    if isinstance(y, pd.DataFrame):
+        panel = split_panel(y, id_column, time_column, target_column)
+        series = [
+            (panel.series(index), None, panel.times[start:end])
+            for index, (start, end) in enumerate(
+                zip(panel.offsets[:-1], panel.offsets[1:])
+            )
+        ]
+        ids = panel.ids
+        cutoffs = [
+            _cutoffs(len(values), horizon, n_windows, step) for values, _, _ in series
+        ]
+        shards = map_shards(
+            _backtest_tasks,
+            len(series),
+            lambda start, end: (
+                model,
+                [series[index][:2] + (cutoffs[index],) for index in range(start, end)],
+                horizon,
+                refit_every,
+            ),
+            n_jobs=n_jobs,
+        )
+        forecasts = [each for shard in shards for each in shard]
+    else:
+        times = y.index.to_numpy() if isinstance(y, pd.Series) else np.arange(len(y))
+        values = np.asarray(y, dtype=np.float64)
+        features = None if x is None else np.asarray(x, dtype=np.float64)
+        window_cutoffs = _cutoffs(len(values), horizon, n_windows, step)
+        if not len(window_cutoffs):
+            raise ValueError(
+                f"The series of length {len(values)} is too short to backtest a horizon of {horizon}."
+            )
+        group_starts = np.arange(0, len(window_cutoffs), refit_every)
+
+        def group_task(group: int) -> tuple:
+            group_cutoffs = window_cutoffs[group_starts[group] :][:refit_every]
+            end = group_cutoffs[-1] + horizon
+            return (
+                values[:end],
+                None if features is None else features[:end],
+                group_cutoffs,
+            )
+
+        shards = map_shards(
+            _backtest_tasks,
+            len(group_starts),
+            lambda start, end: (
+                model,
+                [group_task(group) for group in range(start, end)],
+                horizon,
+                refit_every,
+            ),
+            n_jobs=n_jobs,
+        )
+        forecasts = [np.concatenate([each for shard in shards for each in shard])]
+        series, cutoffs, ids = [(values, features, times)], [window_cutoffs], None
+
+    forecast_columns, metric_rows = [], []
+    for index, ((values, _, times), window_cutoffs) in enumerate(zip(series, cutoffs)):
+        columns, rows = _window_frames(
+            forecasts[index],
+            values,
+            times,
+            window_cutoffs,
+            metrics,
+            season_length or detect_season_length(values),
+        )
+        if ids is not None:
+            columns = {
+                id_column: np.repeat(ids[index], len(columns["window"])),
+                **columns,
+            }
+            rows = [{id_column: ids[index], **row} for row in rows]
+        forecast_columns.append(pd.DataFrame(columns))
+        metric_rows.extend(rows)
+
+    forecasts_frame = pd.concat(forecast_columns, ignore_index=True)
+    if time_column is not None:
+        forecasts_frame = forecasts_frame.rename(columns={"time": time_column})
+    metrics_frame = pd.DataFrame(metric_rows)
+    num_failed = (
+        int(metrics_frame[metrics].isna().all(axis=1).sum()) if metric_rows else 0
+    )
+    if num_failed:
+        warnings.warn(
+            f"{num_failed} windows couldn't be forecast and have NaN forecasts."
+        )
+    return forecasts_frame, metrics_frame
@@ -0,0 +1,311 @@
+"""Utility functions and classes for caching intermediate results in memory and fitted models on disk."""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+
+def _sizeof(value: Any) -> int:
+    """Approximates the memory used by a cached value in bytes."""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if callable(getattr(value, "num_row", None)) and callable(
+        getattr(value, "num_col", None)
+    ):
+        # An XGBoost DMatrix, which stores its values as float32.
+        return value.num_row() * value.num_col() * 4
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple) and all(isinstance(dim, int) for dim in shape):
+        # Containers such as a CatBoost Pool, assuming 4 bytes per value.
+        return int(np.prod(shape)) * 4
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """A thread-safe, least recently used cache bounded by the total size of its values.
+
+    :param max_bytes: The maximum total size of all cached values in bytes. Once exceeded, the least recently used
+    values are evicted. Defaults to 64 MB.
+    :type max_bytes: int, optional
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 64 * 1024**2) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["current_bytes"] = 0
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Returns the value stored for the key and marks it as the most recently used.
+
+        :param key: The key to look up.
+        :type key: Hashable
+        :param default: The value to return if the key is not cached.
+        :type default: Any, optional
+        :return: The cached value, or the default.
+        :rtype Any:
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores the value for the key, evicting the least recently used values if the cache is full.
+
+        Values larger than the whole cache are not stored.
+
+        :param key: The key to store the value under.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        """
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Removes every value from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+def _default_cache_directory() -> str:
+    """The directory set in the `FACILYST_CACHE_DIR` environment variable, or `~/.cache/facilyst`."""
+    return os.environ.get(
+        "FACILYST_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "facilyst"),
+    )
+
+
+class ModelCache:
+    """A content-addressed cache of fitted models on disk, shared across processes and runs.
+
+    Every entry is a file named after its key, written atomically so that concurrent writers never leave a partial
+    entry behind, along with a small metadata file describing it. Reading an entry marks it as the most recently used,
+    and once the entries exceed `max_bytes` the least recently used ones are deleted. Entries older than `ttl` are
+    treated as missing and deleted.
+
+    :param directory: The directory to store the entries in. Defaults to `models` in the directory set in the
+    `FACILYST_CACHE_DIR` environment variable, or `~/.cache/facilyst/models`.
+    :type directory: str, optional
+    :param max_bytes: The maximum total size of all entries in bytes. Defaults to 10 GB.
+    :type max_bytes: int, optional
+    :param ttl: The number of seconds an entry is served for after it's stored. Defaults to no expiry.
+    :type ttl: float, optional
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = 10 * 1024**3,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.directory = directory or os.path.join(_default_cache_directory(), "models")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._unchecked_bytes = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str, extension: str = ".joblib") -> str:
+        return os.path.join(self.directory, key + extension)
+
+    def _keys(self) -> list:
+        return [
+            file_name[: -len(".joblib")]
+            for file_name in os.listdir(self.directory)
+            if file_name.endswith(".joblib")
+        ]
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    @property
+    def current_bytes(self) -> int:
+        """The total size of all entries in bytes."""
+        return int(self.entries()["bytes"].sum())
+
+    def _expired(self, key: str, now: Optional[float] = None) -> bool:
+        """Whether the entry was stored more than `ttl` seconds ago, going by its metadata file that's never modified."""
+        if self.ttl is None:
+            return False
+        try:
+            created = os.path.getmtime(self._path(key, ".json"))
+        except FileNotFoundError:
+            return False
+        return (now or time.time()) - created > self.ttl
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Loads the value stored for the key and marks it as the most recently used.
+
+        Entries that can't be read, for example because they were written by an incompatible version of a library, and
+        expired entries are deleted and treated as missing.
+
+        :param key: The key to look up.
+        :type key: str
+        :param default: The value to return if the key is not cached.
+        :type default: Any, optional
+        :return: The cached value, or the default.
+        :rtype Any:
+        """
+        path = self._path(key)
+        if self._expired(key):
+            self._remove(key)
+            self.misses += 1
+            return default
+        try:
+            value = joblib.load(path)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except Exception:
+            self._remove(key)
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, metadata: Optional[dict] = None) -> None:
+        """Stores the value for the key, evicting the least recently used entries if the cache is full.
+
+        Values larger than the whole cache are not stored. The entries are only scanned for eviction once the values
+        stored since the last scan add up to a sixty-fourth of `max_bytes`, so storing many small values stays cheap.
+
+        :param key: The key to store the value under.
+        :type key: str
+        :param value: The value to store.
+        :type value: Any
+        :param metadata: JSON serializable details about the value, returned by `entries`.
+        :type metadata: dict, optional
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        os.close(file_descriptor)
+        try:
+            joblib.dump(value, temporary_path)
+            size = os.path.getsize(temporary_path)
+            if size > self.max_bytes:
+                return
+            with open(self._path(key, ".json"), "w") as metadata_file:
+                json.dump({"created": time.time(), **(metadata or {})}, metadata_file)
+            os.replace(temporary_path, self._path(key))
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        self._unchecked_bytes += size
+        if self._unchecked_bytes * 64 >= self.max_bytes:
+            self._evict()
+
+    def entries(self) -> pd.DataFrame:
+        """Describes every entry, from the most to the least recently used.
+
+        :return: The key, size in bytes, and last time each entry was used, along with its metadata.
+        :rtype pd.DataFrame:
+        """
+        rows = []
+        for key in self._keys():
+            try:
+                stat = os.stat(self._path(key))
+            except FileNotFoundError:
+                continue
+            try:
+                with open(self._path(key, ".json")) as metadata_file:
+                    metadata = json.load(metadata_file)
+            except (OSError, ValueError):
+                metadata = {}
+            rows.append(
+                {
+                    "key": key,
+                    "bytes": stat.st_size,
+                    "last_used": pd.Timestamp(stat.st_mtime, unit="s"),
+                    **metadata,
+                }
+            )
+        columns = ["key", "bytes", "last_used"]
+        entries = pd.DataFrame(rows, columns=None if rows else columns)
+        return entries.sort_values("last_used", ascending=False, ignore_index=True)
+
+    def _remove(self, key: str) -> None:
+        for extension in (".joblib", ".json"):
+            try:
+                os.remove(self._path(key, extension))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        """Deletes the expired entries, then the least recently used ones until the rest fit in `max_bytes`."""
+        self._unchecked_bytes = 0
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as directory_entries:
+            for entry in directory_entries:
+                if not entry.name.endswith(".joblib"):
+                    continue
+                key = entry.name[: -len(".joblib")]
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if self._expired(key, now):
+                    self._remove(key)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, key))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            total_bytes -= size
+
+    def clear(self) -> None:
+        """Deletes every entry from the cache."""
+        for key in self._keys():
+            self._remove(key)
@@ -0,0 +1,155 @@
+"""Utility functions that convert data into arrays once, without copying data that is already suitable."""
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+_MAX_CACHED_CONVERSIONS = 16
+
+_conversion_cache = OrderedDict()
+_conversion_lock = threading.Lock()
+
+
+def _numeric_dtype(dtypes: Iterable) -> Optional[np.dtype]:
+    """The common numpy dtype of all columns, or None if any of the columns isn't numeric.
+
+    Nullable extension dtypes, such as those set by Woodwork, are mapped to float64 so their missing values become NaN
+    instead of forcing the conversion through object.
+    """
+    numpy_dtypes = []
+    for dtype in dtypes:
+        if isinstance(dtype, np.dtype):
+            if dtype.kind not in "biuf":
+                return None
+            numpy_dtypes.append(dtype)
+        elif pd.api.types.is_numeric_dtype(dtype) and not isinstance(
+            dtype, pd.SparseDtype
+        ):
+            numpy_dtypes.append(np.dtype(np.float64))
+        else:
+            return None
+    if not numpy_dtypes:
+        return None
+    return np.result_type(*numpy_dtypes)
+
+
+def _contiguous(array: np.ndarray, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """Returns the array itself if it is already contiguous and of the right dtype, otherwise a contiguous copy."""
+    if dtype is not None and array.dtype != dtype:
+        array = array.astype(dtype)
+    if not (array.flags.c_contiguous or array.flags.f_contiguous):
+        array = np.ascontiguousarray(array)
+    return array
+
+
+def _signature(data: Union[pd.DataFrame, pd.Series], dtype: Optional[np.dtype]):
+    """A cheap description of the data, used to detect objects whose shape or dtypes changed since being converted."""
+    if isinstance(data, pd.DataFrame):
+        return data.shape, tuple(data.columns), tuple(data.dtypes), dtype
+    return data.shape, data.dtype, dtype
+
+
+def _forget(key: int) -> None:
+    with _conversion_lock:
+        _conversion_cache.pop(key, None)
+
+
+def clear_conversion_cache() -> None:
+    """Removes every array cached by `to_array`."""
+    with _conversion_lock:
+        _conversion_cache.clear()
+
+
+def is_numeric(data: Any) -> bool:
+    """Checks whether every column of the data is numeric or boolean, including nullable extension dtypes.
+
+    :param data: The data to check.
+    :type data: pd.DataFrame, pd.Series, or np.ndarray
+    :return: True if the data can be converted into a numeric array.
+    :rtype bool:
+    """
+    if isinstance(data, pd.DataFrame):
+        return _numeric_dtype(data.dtypes) is not None
+    if isinstance(data, pd.Series):
+        return _numeric_dtype([data.dtype]) is not None
+    return _numeric_dtype([np.asarray(data).dtype]) is not None
+
+
+def to_array(
+    data: Any, dtype: Optional[Union[str, np.dtype]] = None, cache: bool = False
+) -> Any:
+    """Converts the data into a contiguous array, without copying if the data is already suitable.
+
+    Numeric DataFrames are converted into their common numeric dtype in a single pass, and nullable dtypes become
+    float64 with NaN for missing values. Any other DataFrame is converted the same way as `to_numpy`. If `cache` is set,
+    the resulting array is kept for as long as the pandas object is alive, so repeatedly converting the same object is
+    free. Modifying the values of a pandas object in place after it has been converted is not detected, so only opt in
+    for data that isn't modified, or call `clear_conversion_cache` if it is.
+
+    :param data: The data to convert. None is returned as is.
+    :type data: pd.DataFrame, pd.Series, np.ndarray, or list
+    :param dtype: The dtype of the array. Defaults to the common dtype of the data.
+    :type dtype: str or np.dtype, optional
+    :param cache: Whether to cache the converted array. Defaults to False.
+    :type cache: bool, optional
+    :return: The converted array.
+    :rtype np.ndarray:
+    """
+    if data is None:
+        return None
+    dtype = None if dtype is None else np.dtype(dtype)
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        return _contiguous(np.asarray(data), dtype)
+
+    key = id(data)
+    signature = _signature(data, dtype)
+    if cache:
+        with _conversion_lock:
+            cached = _conversion_cache.get(key)
+            if cached is not None and cached[0]() is data and cached[1] == signature:
+                _conversion_cache.move_to_end(key)
+                return cached[2]
+
+    dtypes = list(data.dtypes) if isinstance(data, pd.DataFrame) else [data.dtype]
+    target_dtype = dtype or _numeric_dtype(dtypes)
+    if target_dtype is None:
+        array = data.to_numpy()
+    elif target_dtype.kind == "f" and any(
+        not isinstance(each_dtype, np.dtype) for each_dtype in dtypes
+    ):
+        array = data.to_numpy(dtype=target_dtype, na_value=np.nan)
+    else:
+        array = data.to_numpy(dtype=target_dtype)
+    array = _contiguous(array)
+
+    if cache:
+        with _conversion_lock:
+            _conversion_cache[key] = (
+                weakref.ref(data, lambda _, key=key: _forget(key)),
+                signature,
+                array,
+            )
+            while len(_conversion_cache) > _MAX_CACHED_CONVERSIONS:
+                _conversion_cache.popitem(last=False)
+    return array
+
+
+def to_model_input(data: Any, cache: bool = False) -> Any:
+    """Converts numeric data into an array through `to_array`, leaving data with non-numeric columns untouched.
+
+    DataFrames with categorical, string, or datetime columns are passed through as is, so that models with native
+    support for them can still use the column types.
+
+    :param data: The data to convert.
+    :type data: pd.DataFrame, pd.Series, np.ndarray, or list
+    :param cache: Whether to cache the converted array, see `to_array`. Defaults to False.
+    :type cache: bool, optional
+    :return: The converted array, or the data itself.
+    :rtype np.ndarray or pd.DataFrame:
+    """
+    if isinstance(data, pd.DataFrame) and not is_numeric(data):
+        return data
+    return to_array(data, cache=cache)
@@ -0,0 +1,211 @@
+"""Utility functions that classify the demand pattern of many time series at once and route them to suitable models."""
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.panel_utils import split_panel
+
+demand_families: Dict[str, str] = {
+    "smooth": "automatic",
+    "erratic": "automatic",
+    "intermittent": "sparse",
+    "lumpy": "sparse",
+}
+
+
+def _segment_sums(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The sum of every segment `values[offsets[i]:offsets[i + 1]]`, with empty segments summing to zero."""
+    sums = np.add.reduceat(np.append(values, 0), offsets[:-1])
+    return np.where(np.diff(offsets) > 0, sums, 0)
+
+
+def demand_statistics(
+    values: np.ndarray, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the average demand interval (ADI) and squared coefficient of variation (CV²) of many series at once.
+
+    The series are stored one after the other, like the targets of a `Panel`, and every statistic is computed with one
+    vectorized pass over all of them. ADI is the number of periods per non-zero demand, and CV² is the squared ratio of
+    the standard deviation to the mean of the non-zero demand sizes.
+
+    :param values: The targets of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :return: The ADI and CV² of every series. Series without demand have an infinite ADI and a NaN CV².
+    :rtype tuple: np.ndarray, np.ndarray
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    nonzero = values != 0
+    counts = _segment_sums(nonzero.astype(np.float64), offsets)
+    totals = _segment_sums(values, offsets)
+    squares = _segment_sums(np.square(values), offsets)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adi = np.where(counts > 0, np.diff(offsets) / counts, np.inf)
+        means = totals / counts
+        variances = np.maximum(squares / counts - np.square(means), 0)
+        cv2 = np.where(counts > 0, variances / np.square(means), np.nan)
+    return adi, cv2
+
+
+def classify_demand(
+    adi: np.ndarray,
+    cv2: np.ndarray,
+    adi_threshold: float = 1.32,
+    cv2_threshold: float = 0.49,
+) -> np.ndarray:
+    """Classifies demand patterns with the Syntetos-Boylan scheme.
+
+    Demand is smooth when it's both frequent and regular in size, erratic when it's frequent but irregular, intermittent
+    when it's infrequent but regular, and lumpy when it's both. Series without any demand are intermittent.
+
+    :param adi: The average demand interval of each series.
+    :type adi: np.ndarray
+    :param cv2: The squared coefficient of variation of the demand sizes of each series.
+    :type cv2: np.ndarray
+    :param adi_threshold: The ADI from which demand is infrequent.
+    :type adi_threshold: float
+    :param cv2_threshold: The CV² from which demand sizes are irregular.
+    :type cv2_threshold: float
+    :return: The class of each series, `smooth`, `erratic`, `intermittent`, or `lumpy`.
+    :rtype np.ndarray:
+    """
+    frequent = np.asarray(adi) < adi_threshold
+    irregular = np.nan_to_num(cv2, nan=0.0) >= cv2_threshold
+    return np.select(
+        [frequent & ~irregular, frequent & irregular, ~irregular],
+        ["smooth", "erratic", "intermittent"],
+        "lumpy",
+    )
+
+
+def demand_classes(
+    data: Union[pd.DataFrame, pd.Series, np.ndarray],
+    id_column: Optional[str] = None,
+    time_column: Optional[str] = None,
+    target_column: Optional[str] = None,
+    adi_threshold: float = 1.32,
+    cv2_threshold: float = 0.49,
+) -> pd.DataFrame:
+    """Computes the ADI, CV², and demand class of a single series or of every series of a panel.
+
+    :param data: The target of a single series, or a long-format DataFrame of many series along with `id_column`,
+    `time_column`, and `target_column`.
+    :type data: pd.DataFrame, pd.Series, or np.ndarray
+    :param id_column: The column that identifies each series of a panel.
+    :type id_column: str, optional
+    :param time_column: The column holding the time of each row of a panel.
+    :type time_column: str, optional
+    :param target_column: The column holding the target values of a panel.
+    :type target_column: str, optional
+    :param adi_threshold: The ADI from which demand is infrequent.
+    :type adi_threshold: float
+    :param cv2_threshold: The CV² from which demand sizes are irregular.
+    :type cv2_threshold: float
+    :return: The `adi`, `cv2`, `demand_class`, and model `family` of each series, along with its id for a panel.
+    :rtype pd.DataFrame:
+    """
+    if isinstance(data, pd.DataFrame):
+        panel = split_panel(data, id_column, time_column, target_column)
+        values, offsets = panel.values, panel.offsets
+        ids = {id_column: panel.ids}
+    else:
+        values = np.asarray(data, dtype=np.float64)
+        offsets, ids = np.array([0, len(values)]), {}
+    adi, cv2 = demand_statistics(values, offsets)
+    classes = classify_demand(adi, cv2, adi_threshold, cv2_threshold)
+    return pd.DataFrame(
+        {
+            **ids,
+            "adi": adi,
+            "cv2": cv2,
+            "demand_class": classes,
+            "family": [demand_families[each] for each in classes],
+        }
+    )
+
+
+def _default_routes() -> Dict[str, Any]:
+    from facilyst.models import (
+        AutoETSRegressor,
+        CrostonOptimizedRegressor,
+        TSBRegressor,
+    )
+
+    return {
+        "smooth": AutoETSRegressor(),
+        "erratic": AutoETSRegressor(),
+        "intermittent": CrostonOptimizedRegressor(),
+        "lumpy": TSBRegressor(),
+    }
+
+
+def forecast_by_demand(
+    data: pd.DataFrame,
+    id_column: str,
+    time_column: str,
+    target_column: str,
+    horizon: int,
+    routes: Optional[Dict[str, Any]] = None,
+    frequency: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Forecasts every series of a panel with the model suited to its demand pattern.
+
+    All series are classified in one vectorized pass, and then every demand class is forecast with `forecast_many` of
+    its own model, so that intermittent series never go through expensive models that can't help them.
+
+    :param data: The series, with one row per series and time.
+    :type data: pd.DataFrame
+    :param id_column: The column that identifies each series.
+    :type id_column: str
+    :param time_column: The column holding the time of each row.
+    :type time_column: str
+    :param target_column: The column holding the target values.
+    :type target_column: str
+    :param horizon: The number of steps to forecast for each series.
+    :type horizon: int
+    :param routes: The time series model used for each demand class. Classes that aren't passed keep their default:
+    AutoETS for smooth and erratic demand, Croston Optimized for intermittent demand, and TSB for lumpy demand.
+    :type routes: dict, optional
+    :param frequency: The frequency of the time column. Inferred if not passed.
+    :type frequency: str, optional
+    :param n_jobs: The number of cores to use, -1 uses all available cores. Optional.
+    :type n_jobs: int, optional
+    :return: The forecasts, with the id, the time, the `forecast` of each step, and the `demand_class` of each series.
+    :rtype pd.DataFrame:
+    """
+    routes = {**_default_routes(), **(routes or {})}
+    panel = split_panel(data, id_column, time_column, target_column, frequency)
+    adi, cv2 = demand_statistics(panel.values, panel.offsets)
+    classes = pd.DataFrame(
+        {id_column: panel.ids, "demand_class": classify_demand(adi, cv2)}
+    )
+
+    forecasts = []
+    for demand_class, class_ids in classes.groupby("demand_class")[id_column]:
+        class_data = data[data[id_column].isin(class_ids)]
+        class_forecasts = routes[demand_class].forecast_many(
+            class_data,
+            id_column,
+            time_column,
+            target_column,
+            horizon,
+            frequency=panel.frequency,
+            n_jobs=n_jobs,
+        )
+        forecasts.append(class_forecasts.assign(demand_class=demand_class))
+    if not forecasts:
+        return pd.DataFrame(
+            columns=[id_column, time_column, "forecast", "demand_class"]
+        )
+
+    order = pd.Series(np.arange(len(classes)), index=classes[id_column])
+    result = pd.concat(forecasts, ignore_index=True)
+    position = order[result[id_column]].to_numpy() * horizon + np.tile(
+        np.arange(horizon), len(result) // horizon
+    )
+    return result.iloc[np.argsort(position, kind="stable")].reset_index(drop=True)
@@ -0,0 +1,139 @@
+"""Utility functions that control how many cores facilyst is allowed to use."""
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+from threadpoolctl import threadpool_limits
+
+_global_execution_config = {"n_jobs": None}
+_execution_config: ContextVar = ContextVar("facilyst_execution_config", default=None)
+
+# The BLAS and OpenMP thread pools are shared by the whole process, so their cap is reference counted across every
+# active `execution_context` and only applied by the first one entered.
+_native_limits = {"active": 0, "limiter": None, "global_limiter": None}
+_native_lock = threading.Lock()
+
+
+def _resolve_n_jobs(n_jobs: Optional[int]) -> Optional[int]:
+    """Converts joblib style negative core counts into a positive number of cores."""
+    if n_jobs is None:
+        return None
+    if n_jobs == 0:
+        raise ValueError("The number of cores `n_jobs` cannot be 0.")
+    num_cpus = os.cpu_count() or 1
+    if n_jobs < 0:
+        return max(num_cpus + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def get_execution_config() -> dict:
+    """Returns the execution configuration currently in effect.
+
+    :return: The current execution configuration.
+    :rtype dict:
+    """
+    return dict(_execution_config.get() or _global_execution_config)
+
+
+def set_execution_config(n_jobs: Optional[int] = None) -> None:
+    """Sets the total core budget shared by every model in facilyst, across all threads.
+
+    The native BLAS and OpenMP thread pools of the process are capped to the budget until it is removed.
+
+    :param n_jobs: The total number of cores that all models and native thread pools can use together, -1 uses all
+    available cores. None removes the budget so that models use their own `n_jobs` settings.
+    :type n_jobs: int, optional
+    """
+    n_jobs = _resolve_n_jobs(n_jobs)
+    _global_execution_config["n_jobs"] = n_jobs
+    with _native_lock:
+        if _native_limits["global_limiter"] is not None:
+            _native_limits["global_limiter"].restore_original_limits()
+            _native_limits["global_limiter"] = None
+        if n_jobs is not None:
+            _native_limits["global_limiter"] = threadpool_limits(limits=n_jobs)
+
+
+def _acquire_native_limit(limit: Optional[int]) -> None:
+    with _native_lock:
+        _native_limits["active"] += 1
+        if _native_limits["active"] == 1 and limit is not None:
+            _native_limits["limiter"] = threadpool_limits(limits=limit)
+
+
+def _release_native_limit() -> None:
+    with _native_lock:
+        _native_limits["active"] -= 1
+        if _native_limits["active"] == 0 and _native_limits["limiter"] is not None:
+            _native_limits["limiter"].restore_original_limits()
+            _native_limits["limiter"] = None
+
+
+@contextmanager
+def execution_context(n_jobs: Optional[int] = None) -> Iterator[dict]:
+    """Context manager that sets the total core budget for the duration of the block, overriding the global budget.
+
+    The budget passed to models only applies to the current thread or asyncio task, so each concurrently running job
+    can be given its own share of the cores. The cap on the native BLAS and OpenMP thread pools is process-wide
+    however, so it is applied once by the first active block and kept until the last active block exits.
+
+    :param n_jobs: The total number of cores that all models and native thread pools can use together, -1 uses all
+    available cores. None removes the budget so that models use their own `n_jobs` settings.
+    :type n_jobs: int, optional
+    :return: The execution configuration in effect inside the block.
+    :rtype dict:
+    """
+    token = _execution_config.set({"n_jobs": _resolve_n_jobs(n_jobs)})
+    _acquire_native_limit(get_thread_budget())
+    try:
+        yield get_execution_config()
+    finally:
+        _release_native_limit()
+        _execution_config.reset(token)
+
+
+def get_thread_budget() -> Optional[int]:
+    """Returns the total number of cores that can currently be used, or None if no budget has been set.
+
+    :return: The core budget.
+    :rtype int:
+    """
+    return get_execution_config()["n_jobs"]
+
+
+def split_thread_budget(
+    num_tasks: int, budget: Optional[int] = None
+) -> Tuple[int, int]:
+    """Splits the core budget between concurrently running tasks and the threads used inside each task.
+
+    :param num_tasks: The number of tasks that could run concurrently.
+    :type num_tasks: int
+    :param budget: The number of cores to split. Defaults to the current core budget, or every core if none is set.
+    :type budget: int, optional
+    :return: The number of tasks to run concurrently and the number of threads each task can use.
+    :rtype tuple: int, int
+    """
+    budget = budget or get_thread_budget() or _resolve_n_jobs(-1)
+    outer = max(min(num_tasks, budget), 1)
+    inner = max(budget // outer, 1)
+    return outer, inner
+
+
+@contextmanager
+def limit_native_threads(limit: Optional[int] = None) -> Iterator[None]:
+    """Context manager that caps the BLAS and OpenMP thread pools to the core budget.
+
+    The cap is process-wide, so it also applies to any other thread running at the same time.
+
+    :param limit: The maximum number of native threads. Defaults to the current core budget. If neither is set, the
+    native thread pools are left untouched.
+    :type limit: int, optional
+    """
+    limit = limit or get_thread_budget()
+    if limit is None:
+        yield
+    else:
+        with threadpool_limits(limits=limit):
+            yield
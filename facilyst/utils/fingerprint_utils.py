@@ -0,0 +1,193 @@
+"""Utility functions that compute fast, content-based fingerprints of datasets."""
+import hashlib
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.gen_utils import import_errors_dict, import_or_raise
+
+_BLOCK_WORDS = 1 << 15
+_MIX_SHIFT = np.uint64(29)
+
+
+def _splitmix64(seed: int, size: int) -> np.ndarray:
+    """Deterministic pseudo-random odd 64-bit words, identical on every platform and numpy version."""
+    with np.errstate(over="ignore"):
+        state = np.uint64(seed) + np.arange(1, size + 1, dtype=np.uint64) * np.uint64(
+            0x9E3779B97F4A7C15
+        )
+        state = (state ^ (state >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        state = (state ^ (state >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        state = state ^ (state >> np.uint64(31))
+    return state | np.uint64(1)
+
+
+_WEIGHTS = (_splitmix64(0, _BLOCK_WORDS), _splitmix64(1, _BLOCK_WORDS))
+
+
+def _update_with_buffer(hasher: Any, values: np.ndarray) -> None:
+    """Feeds the raw bytes of an array to the hasher through a vectorized multilinear hash.
+
+    The buffer is viewed as 64-bit words and split into blocks that fit in the CPU cache. Every word is mixed with its
+    own high bits and each block is reduced to two sums of the words multiplied by fixed random odd weights, so any
+    single changed word always changes both sums. Only the 16 bytes of sums per block go through the hasher, which
+    makes the whole pass several times faster than hashing the bytes themselves.
+    """
+    data = np.ascontiguousarray(values).reshape(-1).view(np.uint8)
+    num_words = len(data) // 8
+    words = data[: num_words * 8].view(np.uint64)
+    block_words = min(num_words, _BLOCK_WORDS)
+    mixed = np.empty(block_words, dtype=np.uint64)
+    products = np.empty(block_words, dtype=np.uint64)
+    sums = np.empty((-(-num_words // _BLOCK_WORDS), 2), dtype=np.uint64)
+    for index, start in enumerate(range(0, num_words, _BLOCK_WORDS)):
+        block = words[start : start + _BLOCK_WORDS]
+        block_mixed, block_products = mixed[: len(block)], products[: len(block)]
+        np.right_shift(block, _MIX_SHIFT, out=block_mixed)
+        np.bitwise_xor(block_mixed, block, out=block_mixed)
+        for lane, weights in enumerate(_WEIGHTS):
+            np.multiply(block_mixed, weights[: len(block)], out=block_products)
+            sums[index, lane] = block_products.sum(dtype=np.uint64)
+    hasher.update(np.uint64(len(data)).tobytes())
+    hasher.update(sums.tobytes())
+    hasher.update(data[num_words * 8 :].tobytes())
+
+
+def _column_block_sums(values: np.ndarray) -> np.ndarray:
+    """The block sums of `_update_with_buffer` for every column of a 2D array of 8-byte values at once.
+
+    Hashing the columns of a row-major array one at a time reads a single value per cache line. Instead, the rows are
+    processed in chunks that fit in the CPU cache and the partial sums of every column are accumulated, which gives the
+    same sums as hashing each column by itself.
+    """
+    words = values.view(np.uint64)
+    num_rows, num_columns = words.shape
+    chunk_rows = 1 << max(0, (_BLOCK_WORDS // num_columns).bit_length() - 1)
+    sums = np.zeros((num_columns, -(-num_rows // _BLOCK_WORDS), 2), dtype=np.uint64)
+    for start in range(0, num_rows, chunk_rows):
+        chunk = words[start : start + chunk_rows]
+        mixed = np.bitwise_xor(chunk, np.right_shift(chunk, _MIX_SHIFT))
+        block, offset = divmod(start, _BLOCK_WORDS)
+        for lane, weights in enumerate(_WEIGHTS):
+            chunk_weights = weights[offset : offset + len(chunk), np.newaxis]
+            sums[:, block, lane] += np.multiply(mixed, chunk_weights).sum(
+                axis=0, dtype=np.uint64
+            )
+    return sums
+
+
+def _update_with_arrow(hasher: Any, chunked_array: Any) -> None:
+    """Feeds the validity, offset, and data buffers of an Arrow array to the hasher, independent of its chunking."""
+    chunks = chunked_array.chunks
+    if len(chunks) != 1 or chunks[0].offset:
+        pyarrow = import_or_raise("pyarrow", import_errors_dict["pyarrow"])
+        chunks = [pyarrow.concat_arrays(chunks)] if chunks else []
+    for chunk in chunks:
+        hasher.update(str(chunk.type).encode())
+        for position, buffer in enumerate(chunk.buffers()):
+            if buffer is None:
+                hasher.update(b"\x00")
+                continue
+            values = np.frombuffer(buffer, dtype=np.uint8)
+            if position == 0:
+                # The bits of the validity bitmap past the last value are undefined.
+                values = np.unpackbits(values, bitorder="little")[: len(chunk)]
+            _update_with_buffer(hasher, values)
+
+
+def _update_with_column(hasher: Any, column: pd.Series) -> None:
+    """Feeds a column to the hasher through the buffers that back it, avoiding conversions wherever possible."""
+    array = column.array
+    hasher.update(str(column.dtype).encode())
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        _update_with_buffer(hasher, column.cat.codes.to_numpy())
+        _update_with_column(hasher, pd.Series(column.cat.categories))
+        return
+    arrow_data = getattr(array, "_pa_array", getattr(array, "_data", None))
+    if hasattr(arrow_data, "chunks"):
+        _update_with_arrow(hasher, arrow_data)
+        return
+    if hasattr(array, "_data") and hasattr(array, "_mask"):
+        # Nullable integer, float, and boolean arrays, whose values under the mask are undefined.
+        values = np.where(array._mask, 0, array._data)
+        _update_with_buffer(hasher, values)
+        _update_with_buffer(hasher, array._mask)
+        return
+    if hasattr(array, "asi8"):
+        # Datetime, timedelta, and period arrays, including timezone aware ones.
+        _update_with_buffer(hasher, array.asi8)
+        return
+    values = column.to_numpy()
+    if values.dtype.kind not in "biufcmM":
+        values = pd.util.hash_pandas_object(column, index=False).to_numpy()
+    _update_with_buffer(hasher, values)
+
+
+def _sample_rows(data: Any, sample_rows: int) -> Any:
+    """Evenly spaced rows of the data, always including the first and the last."""
+    positions = np.unique(np.linspace(0, len(data) - 1, sample_rows).astype(np.int64))
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[positions]
+    return data[positions]
+
+
+def fingerprint(
+    data: Any, sample_rows: Optional[int] = None, include_index: bool = False
+) -> str:
+    """Computes a fast, content-based fingerprint of a dataset, suitable as a cache key.
+
+    Every column is hashed through the buffers that back it: the raw values of numpy columns, the values and mask of
+    nullable columns, the codes and categories of categorical columns, and the buffers of Arrow columns. Object columns
+    fall back to `pd.util.hash_pandas_object`. The shape, column names, and dtypes are part of the fingerprint, so two
+    datasets with the same values but different dtypes don't collide. The hash is not cryptographic, so fingerprints
+    shouldn't be relied on to detect deliberate tampering.
+
+    :param data: The data to fingerprint.
+    :type data: pd.DataFrame, pd.Series, np.ndarray, or list
+    :param sample_rows: Only hash this many evenly spaced rows, for inputs too large to hash in full. The shape is still
+    part of the fingerprint, but edits to rows that aren't sampled go unnoticed. Defaults to hashing every row.
+    :type sample_rows: int, optional
+    :param include_index: Whether the index of a DataFrame or Series is part of the fingerprint.
+    :type include_index: bool
+    :return: The hex digest of the fingerprint.
+    :rtype str:
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        data = np.asarray(data)
+    hasher.update(repr((type(data).__name__, data.shape, sample_rows)).encode())
+    if sample_rows is not None and np.ndim(data) and len(data) > sample_rows:
+        data = _sample_rows(data, sample_rows)
+
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if isinstance(data, pd.DataFrame):
+        hasher.update(repr(list(data.columns)).encode())
+        if include_index:
+            _update_with_column(
+                hasher, data.index.to_series(index=pd.RangeIndex(len(data)))
+            )
+        dtypes = set(data.dtypes)
+        dtype = next(iter(dtypes), None)
+        if (
+            data.shape[1] > 1
+            and len(dtypes) == 1
+            and isinstance(dtype, np.dtype)
+            and dtype.kind in "iuf"
+            and dtype.itemsize == 8
+        ):
+            column_sums = _column_block_sums(data.to_numpy())
+            for sums in column_sums:
+                hasher.update(str(dtype).encode())
+                hasher.update(np.uint64(len(data) * 8).tobytes())
+                hasher.update(sums.tobytes())
+        else:
+            for _, column in data.items():
+                _update_with_column(hasher, column)
+    else:
+        hasher.update(str(data.dtype).encode())
+        if data.dtype.kind not in "biufcmM":
+            data = pd.util.hash_array(data.ravel())
+        _update_with_buffer(hasher, data)
+    return hasher.hexdigest()
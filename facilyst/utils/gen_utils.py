@@ -35,6 +35,8 @@ import_errors_dict = {
     "transformers": error_str.format(name="transformers"),
     "sentencepiece": error_str.format(name="sentencepiece"),
     "keras_preprocessing": error_str.format(name="keras_preprocessing"),
+    "pynndescent": error_str.format(name="pynndescent"),
+    "pyarrow": error_str.format(name="pyarrow"),
 }
 
 
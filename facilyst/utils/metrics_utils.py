@@ -0,0 +1,293 @@
+"""Utility functions that compute many metrics from a single set of predictions."""
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+
+from facilyst.utils.conversion_utils import to_array
+
+
+def _shared(method: Callable) -> property:
+    """Turns the method into a property that is only computed the first time it is accessed."""
+
+    @wraps(method)
+    def _get_or_compute(self):
+        if method.__name__ not in self._values:
+            self._values[method.__name__] = method(self)
+        return self._values[method.__name__]
+
+    return property(_get_or_compute)
+
+
+class _Intermediates:
+    """Lazily computed values shared between metrics, so that each is only computed once per evaluation."""
+
+    def __init__(
+        self,
+        y_actual: np.ndarray,
+        predictions: Optional[np.ndarray] = None,
+        probabilities: Optional[np.ndarray] = None,
+        classes: Optional[np.ndarray] = None,
+        y_train: Optional[np.ndarray] = None,
+        season_length: int = 1,
+    ) -> None:
+        self.y_actual = y_actual
+        self.predictions = predictions
+        self.probabilities = probabilities
+        self._classes = classes
+        self.y_train = y_train
+        self.season_length = season_length
+        self._values = {}
+
+    @_shared
+    def residuals(self) -> np.ndarray:
+        return self.y_actual.astype(np.float64) - self.predictions.astype(np.float64)
+
+    @_shared
+    def absolute_residuals(self) -> np.ndarray:
+        return np.abs(self.residuals)
+
+    @_shared
+    def squared_residuals(self) -> np.ndarray:
+        return np.square(self.residuals)
+
+    @_shared
+    def classes(self) -> np.ndarray:
+        if self._classes is not None:
+            return np.asarray(self._classes)
+        return np.unique(np.concatenate([self.y_actual, self.predictions]))
+
+    @_shared
+    def actual_codes(self) -> np.ndarray:
+        codes = pd.Categorical(self.y_actual, categories=self.classes).codes
+        if np.any(codes < 0):
+            raise ValueError(
+                "y_actual contains labels that the model was not fitted on."
+            )
+        return codes
+
+    @_shared
+    def predicted_codes(self) -> np.ndarray:
+        codes = pd.Categorical(self.predictions, categories=self.classes).codes
+        if np.any(codes < 0):
+            raise ValueError(
+                "The predictions contain labels that the model was not fitted on."
+            )
+        return codes
+
+    @_shared
+    def confusion_counts(self) -> np.ndarray:
+        num_classes = len(self.classes)
+        counts = np.bincount(
+            self.actual_codes * num_classes + self.predicted_codes,
+            minlength=num_classes * num_classes,
+        )
+        return counts.reshape(num_classes, num_classes)
+
+    @_shared
+    def score_ranks(self) -> np.ndarray:
+        """Ranks of the predicted probabilities of each class, with ties averaged."""
+        return rankdata(self.probabilities, axis=0)
+
+    @_shared
+    def naive_seasonal_error(self) -> float:
+        if self.y_train is None:
+            raise ValueError(
+                "MASE requires `y_train` to compute the naive seasonal error."
+            )
+        y_train = self.y_train.astype(np.float64)
+        return float(
+            np.mean(
+                np.abs(y_train[self.season_length :] - y_train[: -self.season_length])
+            )
+        )
+
+
+def _mse(intermediates: _Intermediates) -> float:
+    return float(np.mean(intermediates.squared_residuals))
+
+
+def _rmse(intermediates: _Intermediates) -> float:
+    return float(np.sqrt(_mse(intermediates)))
+
+
+def _mae(intermediates: _Intermediates) -> float:
+    return float(np.mean(intermediates.absolute_residuals))
+
+
+def _r2(intermediates: _Intermediates) -> float:
+    y_actual = intermediates.y_actual.astype(np.float64)
+    total_sum_of_squares = np.sum(np.square(y_actual - y_actual.mean()))
+    residual_sum_of_squares = np.sum(intermediates.squared_residuals)
+    if total_sum_of_squares == 0:
+        return 1.0 if residual_sum_of_squares == 0 else 0.0
+    return float(1 - residual_sum_of_squares / total_sum_of_squares)
+
+
+def _mase(intermediates: _Intermediates) -> float:
+    return _mae(intermediates) / intermediates.naive_seasonal_error
+
+
+def _accuracy(intermediates: _Intermediates) -> float:
+    counts = intermediates.confusion_counts
+    return float(np.trace(counts) / counts.sum())
+
+
+def _macro_precision_recall(intermediates: _Intermediates) -> tuple:
+    counts = intermediates.confusion_counts
+    true_positives = np.diag(counts).astype(np.float64)
+    predicted_positives = counts.sum(axis=0)
+    actual_positives = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(
+            predicted_positives > 0, true_positives / predicted_positives, 0.0
+        )
+        recall = np.where(actual_positives > 0, true_positives / actual_positives, 0.0)
+    return precision, recall
+
+
+def _precision(intermediates: _Intermediates) -> float:
+    return float(np.mean(_macro_precision_recall(intermediates)[0]))
+
+
+def _recall(intermediates: _Intermediates) -> float:
+    return float(np.mean(_macro_precision_recall(intermediates)[1]))
+
+
+def _f1(intermediates: _Intermediates) -> float:
+    precision, recall = _macro_precision_recall(intermediates)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f1 = np.where(
+            precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0
+        )
+    return float(np.mean(f1))
+
+
+def _log_loss(intermediates: _Intermediates) -> float:
+    probabilities = np.clip(intermediates.probabilities, 1e-15, 1 - 1e-15)
+    probabilities = probabilities / probabilities.sum(axis=1, keepdims=True)
+    true_probabilities = probabilities[
+        np.arange(len(probabilities)), intermediates.actual_codes
+    ]
+    return float(-np.mean(np.log(true_probabilities)))
+
+
+def _auc(intermediates: _Intermediates) -> float:
+    actual_codes = intermediates.actual_codes
+    ranks = intermediates.score_ranks
+    num_classes = len(intermediates.classes)
+    class_indices = [1] if num_classes == 2 else range(num_classes)
+    aucs = []
+    for class_index in class_indices:
+        is_positive = actual_codes == class_index
+        num_positive = np.count_nonzero(is_positive)
+        num_negative = len(actual_codes) - num_positive
+        if num_positive == 0 or num_negative == 0:
+            raise ValueError(
+                "AUC is not defined when only one class is present in y_actual."
+            )
+        positive_rank_sum = ranks[is_positive, class_index].sum()
+        aucs.append(
+            (positive_rank_sum - num_positive * (num_positive + 1) / 2)
+            / (num_positive * num_negative)
+        )
+    return float(np.mean(aucs))
+
+
+# Every metric maps to the function computing it, whether greater values are better, and whether it needs the
+# predicted probabilities.
+metrics_dict: Dict[str, tuple] = {
+    "mse": (_mse, False, False),
+    "rmse": (_rmse, False, False),
+    "mae": (_mae, False, False),
+    "r2": (_r2, True, False),
+    "mase": (_mase, False, False),
+    "accuracy": (_accuracy, True, False),
+    "precision": (_precision, True, False),
+    "recall": (_recall, True, False),
+    "f1": (_f1, True, False),
+    "log_loss": (_log_loss, False, True),
+    "auc": (_auc, True, True),
+}
+
+
+def _get_metric(metric: str) -> tuple:
+    """Returns the entry of the metric in `metrics_dict`, raising an error listing the options if it is unknown."""
+    try:
+        return metrics_dict[metric.lower()]
+    except KeyError:
+        raise ValueError(
+            f"The metric `{metric}` isn't recognized! Available metrics are: {sorted(metrics_dict)}"
+        )
+
+
+def needs_probabilities(metrics: List[str]) -> bool:
+    """Checks whether any of the metrics needs predicted probabilities.
+
+    :param metrics: The names of the metrics.
+    :type metrics: list
+    :return: True if predicted probabilities are needed.
+    :rtype bool:
+    """
+    return any(_get_metric(metric)[2] for metric in metrics)
+
+
+def metric_to_loss(metric: str, value: float) -> float:
+    """Converts the value of a metric into a loss to be minimized.
+
+    :param metric: The name of the metric.
+    :type metric: str
+    :param value: The value of the metric.
+    :type value: float
+    :return: The loss.
+    :rtype float:
+    """
+    return -value if _get_metric(metric)[1] else value
+
+
+def evaluate_predictions(
+    y_actual: Union[pd.Series, np.ndarray],
+    metrics: List[str],
+    predictions: Optional[Union[pd.Series, np.ndarray]] = None,
+    probabilities: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    classes: Optional[np.ndarray] = None,
+    y_train: Optional[Union[pd.Series, np.ndarray]] = None,
+    season_length: Optional[int] = 1,
+) -> Dict[str, float]:
+    """Computes every metric requested from one set of predictions, sharing intermediate values between them.
+
+    Residuals, confusion counts, and the ranks of the predicted probabilities are each computed at most once, no matter
+    how many metrics use them.
+
+    :param y_actual: The actual target values.
+    :type y_actual: pd.Series or np.ndarray
+    :param metrics: The names of the metrics to compute. Options are the keys of `metrics_dict`.
+    :type metrics: list
+    :param predictions: The predicted values or labels.
+    :type predictions: pd.Series or np.ndarray, optional
+    :param probabilities: The predicted probability of each class, needed for `log_loss` and `auc`.
+    :type probabilities: pd.DataFrame or np.ndarray, optional
+    :param classes: The classes that correspond to the columns of the probabilities.
+    :type classes: np.ndarray, optional
+    :param y_train: The training targets, needed for `mase`.
+    :type y_train: pd.Series or np.ndarray, optional
+    :param season_length: The season length used by the naive forecast in `mase`. Defaults to 1.
+    :type season_length: int, optional
+    :return: The value of each metric.
+    :rtype dict:
+    """
+    intermediates = _Intermediates(
+        y_actual=to_array(y_actual),
+        predictions=to_array(predictions),
+        probabilities=to_array(probabilities),
+        classes=classes,
+        y_train=to_array(y_train),
+        season_length=season_length,
+    )
+    results = {}
+    for metric in metrics:
+        metric_function: Callable = _get_metric(metric)[0]
+        results[metric] = metric_function(intermediates)
+    return results
@@ -0,0 +1,177 @@
+"""Utility functions for panels of many time series stored in a single long-format DataFrame."""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.execution_utils import (
+    _resolve_n_jobs,
+    execution_context,
+    split_thread_budget,
+)
+
+
+@dataclass
+class Panel:
+    """Many time series sorted by series and time, with the targets of all series in one contiguous array.
+
+    The targets of series `i` are `values[offsets[i]:offsets[i + 1]]`, so every series is a view into `values` and
+    never copied.
+
+    :param ids: The id of each series, in order of first appearance.
+    :type ids: np.ndarray
+    :param values: The targets of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :param times: The time of every value, aligned with `values`.
+    :type times: np.ndarray
+    :param frequency: The frequency of the time column, or None if it isn't made of dates.
+    :type frequency: str, optional
+    """
+
+    ids: np.ndarray
+    values: np.ndarray
+    offsets: np.ndarray
+    times: np.ndarray
+    frequency: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def series(self, index: int) -> np.ndarray:
+        """The targets of one series, as a view."""
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    @property
+    def last_times(self) -> np.ndarray:
+        """The last time of every series."""
+        return self.times[self.offsets[1:] - 1]
+
+
+def split_panel(
+    data: pd.DataFrame,
+    id_column: str,
+    time_column: str,
+    target_column: str,
+    frequency: Optional[str] = None,
+) -> Panel:
+    """Sorts a long-format DataFrame of many series by series and time and splits it into contiguous arrays.
+
+    The frequency is inferred once, from the first series long enough to infer it from, instead of once per series.
+
+    :param data: The series, with one row per series and time.
+    :type data: pd.DataFrame
+    :param id_column: The column that identifies each series.
+    :type id_column: str
+    :param time_column: The column holding the time of each row.
+    :type time_column: str
+    :param target_column: The column holding the target values.
+    :type target_column: str
+    :param frequency: The frequency of the time column. Inferred if not passed.
+    :type frequency: str, optional
+    :return: The panel.
+    :rtype Panel:
+    """
+    codes, ids = pd.factorize(data[id_column], sort=False)
+    times = data[time_column].to_numpy()
+    order = np.lexsort((times, codes))
+    if np.any(order != np.arange(len(order))):
+        codes, times = codes[order], times[order]
+        values = data[target_column].to_numpy(dtype=np.float64)[order]
+    else:
+        values = np.ascontiguousarray(data[target_column].to_numpy(dtype=np.float64))
+    offsets = np.searchsorted(codes, np.arange(len(ids) + 1))
+
+    if frequency is None and np.issubdtype(times.dtype, np.datetime64):
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            if end - start >= 3:
+                frequency = pd.infer_freq(pd.DatetimeIndex(times[start:end]))
+                break
+    return Panel(
+        ids=np.asarray(ids),
+        values=values,
+        offsets=offsets,
+        times=times,
+        frequency=frequency,
+    )
+
+
+def future_times(
+    last_times: np.ndarray, horizon: int, frequency: Optional[str]
+) -> np.ndarray:
+    """The `horizon` times that follow each of the last times, as one flat array with the steps of each series together.
+
+    Dates are advanced by the frequency, and any other times by one per step.
+
+    :param last_times: The last time of each series.
+    :type last_times: np.ndarray
+    :param horizon: The number of steps.
+    :type horizon: int
+    :param frequency: The frequency of dates.
+    :type frequency: str, optional
+    :return: The future times.
+    :rtype np.ndarray:
+    """
+    steps = np.arange(1, horizon + 1)
+    if not np.issubdtype(np.asarray(last_times).dtype, np.datetime64):
+        return (np.asarray(last_times)[:, np.newaxis] + steps).ravel()
+    if frequency is None:
+        raise ValueError(
+            "The frequency of the time column couldn't be inferred, please pass it."
+        )
+    offset = pd.tseries.frequencies.to_offset(frequency)
+    last_times = pd.DatetimeIndex(last_times)
+    columns = [(last_times + step * offset).to_numpy() for step in steps]
+    return np.stack(columns, axis=1).ravel()
+
+
+def _run_with_budget(function: Callable, threads: int, *args) -> Any:
+    with execution_context(n_jobs=threads):
+        return function(*args)
+
+
+def map_shards(
+    function: Callable,
+    num_items: int,
+    arguments: Callable[[int, int], tuple],
+    n_jobs: Optional[int] = None,
+    shards_per_process: int = 4,
+) -> List[Any]:
+    """Splits items into contiguous shards and runs the function on each shard across worker processes.
+
+    The core budget is split between the processes and the threads each of them uses. With a single process the
+    shards run in the calling process.
+
+    :param function: The function to run on each shard. It must be picklable.
+    :type function: callable
+    :param num_items: The number of items to shard.
+    :type num_items: int
+    :param arguments: Called with the start and end of each shard, returning the arguments to pass to the function.
+    :type arguments: callable
+    :param n_jobs: The number of cores to use, -1 uses all available cores. Defaults to the current core budget, or
+    every core if none is set.
+    :type n_jobs: int, optional
+    :param shards_per_process: The number of shards per process, so that processes finishing early can pick up more.
+    :type shards_per_process: int
+    :return: The result of each shard, in order.
+    :rtype list:
+    """
+    processes, threads = split_thread_budget(
+        max(num_items, 1), budget=_resolve_n_jobs(n_jobs)
+    )
+    num_shards = min(max(processes * shards_per_process, 1), max(num_items, 1))
+    bounds = np.linspace(0, num_items, num_shards + 1).astype(np.int64)
+    shard_arguments = [
+        arguments(start, end) for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    if processes == 1:
+        return [_run_with_budget(function, threads, *each) for each in shard_arguments]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(_run_with_budget, function, threads, *each)
+            for each in shard_arguments
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,249 @@
+"""Utility functions that stream large CSV or Parquet files through a saved model in chunks."""
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.gen_utils import import_errors_dict, import_or_raise
+
+_PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+_worker_state = {}
+
+
+def _is_parquet(path: str) -> bool:
+    return os.path.splitext(str(path))[1].lower() in _PARQUET_EXTENSIONS
+
+
+def read_chunks(path: str, chunk_size: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Reads a CSV or Parquet file as a sequence of DataFrames of at most `chunk_size` rows each.
+
+    The format is chosen from the file extension, with `.parquet` and `.pq` files read as Parquet and any other file
+    read as CSV.
+
+    :param path: The file to read.
+    :type path: str
+    :param chunk_size: The maximum number of rows per chunk.
+    :type chunk_size: int
+    :return: The chunks of the file, in order.
+    :rtype Iterator[pd.DataFrame]:
+    """
+    if _is_parquet(path):
+        parquet = import_or_raise("pyarrow.parquet", import_errors_dict["pyarrow"])
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class ChunkWriter:
+    """Writes DataFrames to a CSV or Parquet file one chunk at a time, so only one chunk is held in memory.
+
+    :param path: The file to write. The format is chosen from the file extension as in `read_chunks`.
+    :type path: str
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._parquet_writer = None
+        self._started = False
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Appends a chunk to the file."""
+        if _is_parquet(self.path):
+            pyarrow = import_or_raise("pyarrow", import_errors_dict["pyarrow"])
+            parquet = import_or_raise("pyarrow.parquet", import_errors_dict["pyarrow"])
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = parquet.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(
+                self.path,
+                mode="a" if self._started else "w",
+                header=not self._started,
+                index=False,
+            )
+        self._started = True
+
+    def close(self) -> None:
+        """Finishes the file."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _series_chunks(
+    chunks: Iterator[pd.DataFrame], id_column: Optional[str]
+) -> Iterator[pd.DataFrame]:
+    """Regroups chunks so that no series is split across two of them, assuming the rows of each series are contiguous.
+
+    The rows of the last series in a chunk are held back and prepended to the next chunk. Without an `id_column` the
+    whole file is a single series, so it is yielded as one chunk.
+    """
+    if id_column is None:
+        chunks = list(chunks)
+        if chunks:
+            yield pd.concat(chunks, ignore_index=True)
+        return
+    carry = None
+    for chunk in chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        ids = chunk[id_column].to_numpy()
+        not_last = ids[::-1] != ids[-1]
+        last_start = len(ids) - int(np.argmax(not_last)) if not_last.any() else 0
+        carry = chunk.iloc[last_start:]
+        if last_start:
+            yield chunk.iloc[:last_start]
+    if carry is not None and len(carry):
+        yield carry
+
+
+def _load_worker_model(model_path: str) -> None:
+    from facilyst.models.utils import load_model
+
+    _worker_state["model"] = load_model(model_path)
+
+
+def _score_chunk(
+    chunk: pd.DataFrame,
+    id_column: Optional[str] = None,
+    target_column: Optional[str] = None,
+    horizon: Optional[int] = None,
+) -> pd.DataFrame:
+    """Predicts on a chunk with the model loaded in this process, or forecasts every series in it for time series."""
+    from facilyst.models import TimeSeriesModelBase
+
+    model = _worker_state["model"]
+    if isinstance(model, TimeSeriesModelBase):
+        groups = chunk.groupby(id_column, sort=False) if id_column else [(None, chunk)]
+        forecasts = []
+        for series_id, series in groups:
+            forecast = model.forecast(
+                y_train=series[target_column].to_numpy(), horizon=horizon, as_array=True
+            )
+            frame = pd.DataFrame(
+                {"step": np.arange(1, horizon + 1), "forecast": forecast}
+            )
+            if id_column:
+                frame.insert(0, id_column, series_id)
+            forecasts.append(frame)
+        return pd.concat(forecasts, ignore_index=True)
+
+    features = chunk.drop(columns=[id_column]) if id_column else chunk
+    scored = pd.DataFrame({"prediction": model.predict(features, as_array=True)})
+    if id_column:
+        scored.insert(0, id_column, chunk[id_column].to_numpy())
+    return scored
+
+
+def score_file(
+    model_path: str,
+    input_path: str,
+    output_path: str,
+    chunk_size: int = 100_000,
+    workers: int = 1,
+    id_column: Optional[str] = None,
+    target_column: Optional[str] = None,
+    horizon: Optional[int] = None,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> dict:
+    """Streams a CSV or Parquet file through a model saved with `ModelBase.save` and writes the results as it goes.
+
+    The input is read in chunks that are scored in parallel worker processes, each of which loads the model once. At
+    most two chunks per worker are in flight at a time and results are written in input order as soon as they are
+    ready, so memory stays bounded by the chunk size rather than the file size.
+
+    For regular models the output has a `prediction` column for every input row. For time series models every input
+    series is used to `forecast` `horizon` steps ahead with the model's parameters, and the output has a `step` and a
+    `forecast` column for each step of each series. The rows of a series must be contiguous in the input.
+
+    :param model_path: The saved model.
+    :type model_path: str
+    :param input_path: The CSV or Parquet file to score.
+    :type input_path: str
+    :param output_path: The CSV or Parquet file to write the results to.
+    :type output_path: str
+    :param chunk_size: The number of input rows read and scored at a time.
+    :type chunk_size: int
+    :param workers: The number of worker processes. If 1, chunks are scored in the calling process.
+    :type workers: int
+    :param id_column: A column copied to the output instead of being used as a feature. For time series models, the
+    column that identifies each series. Without it, the whole file is forecast as a single series.
+    :type id_column: str, optional
+    :param target_column: The column holding the target values of each series. Required for time series models.
+    :type target_column: str, optional
+    :param horizon: The number of steps to forecast per series. Required for time series models.
+    :type horizon: int, optional
+    :param progress: Called after every written chunk with the number of input rows scored so far and the seconds
+    elapsed.
+    :type progress: callable, optional
+    :return: The number of input rows scored, the seconds elapsed, and the rows scored per second.
+    :rtype dict:
+    :raises ValueError: If a time series model is scored without a `target_column` and a `horizon`.
+    """
+    from facilyst.models import TimeSeriesModelBase
+
+    _load_worker_model(model_path)
+    chunks = read_chunks(input_path, chunk_size)
+    if isinstance(_worker_state["model"], TimeSeriesModelBase):
+        if target_column is None or horizon is None:
+            raise ValueError(
+                "Time series models need a `target_column` and a `horizon` to forecast."
+            )
+        chunks = _series_chunks(chunks, id_column)
+    options = {
+        "id_column": id_column,
+        "target_column": target_column,
+        "horizon": horizon,
+    }
+
+    start = time.perf_counter()
+    num_rows = 0
+
+    def write_result(
+        writer: ChunkWriter, result: pd.DataFrame, chunk_rows: int
+    ) -> None:
+        nonlocal num_rows
+        writer.write(result)
+        num_rows += chunk_rows
+        if progress is not None:
+            progress(num_rows, time.perf_counter() - start)
+
+    with ChunkWriter(output_path) as writer:
+        if workers <= 1:
+            for chunk in chunks:
+                write_result(writer, _score_chunk(chunk, **options), len(chunk))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_load_worker_model,
+                initargs=(model_path,),
+            ) as executor:
+                in_flight = deque()
+                for chunk in chunks:
+                    future: Future = executor.submit(_score_chunk, chunk, **options)
+                    in_flight.append((future, len(chunk)))
+                    if len(in_flight) >= 2 * workers:
+                        future, chunk_rows = in_flight.popleft()
+                        write_result(writer, future.result(), chunk_rows)
+                while in_flight:
+                    future, chunk_rows = in_flight.popleft()
+                    write_result(writer, future.result(), chunk_rows)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": num_rows,
+        "seconds": elapsed,
+        "rows_per_second": num_rows / elapsed if elapsed else 0.0,
+    }
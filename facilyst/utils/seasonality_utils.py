@@ -0,0 +1,131 @@
+"""Utility functions that detect the season length of many time series at once from their autocorrelation."""
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy import fft
+
+
+def _autocorrelations(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The autocorrelation of every detrended series at every lag, computed for all series with one FFT."""
+    lengths = np.diff(offsets)
+    series = np.repeat(np.arange(len(lengths)), lengths)
+    times = np.arange(len(values)) - offsets[series]
+
+    # The linear trend of each series is removed, so it doesn't show up as autocorrelation at every lag.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        counts = np.maximum(lengths, 1)
+        mean_times = (lengths - 1) / 2
+        means = np.bincount(series, weights=values, minlength=len(lengths)) / counts
+        centered_times = times - mean_times[series]
+        slopes = np.bincount(
+            series, weights=centered_times * values, minlength=len(lengths)
+        ) / np.bincount(
+            series, weights=np.square(centered_times), minlength=len(lengths)
+        )
+    slopes = np.nan_to_num(slopes, nan=0.0, posinf=0.0, neginf=0.0)
+    residuals = values - means[series] - slopes[series] * centered_times
+
+    width = int(lengths.max(initial=0))
+    padded = np.zeros((len(lengths), width))
+    padded[series, times] = residuals
+    # Zero padding up to twice the width keeps the circular correlation of the FFT from wrapping around.
+    fft_size = fft.next_fast_len(max(2 * width - 1, 1), real=True)
+    spectrum = fft.rfft(padded, n=fft_size, axis=1, workers=-1)
+    power = np.square(spectrum.real) + np.square(spectrum.imag)
+    covariances = fft.irfft(power, n=fft_size, axis=1, workers=-1)[:, :width]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.nan_to_num(covariances / covariances[:, :1], nan=0.0)
+
+
+def season_length_candidates(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    max_season_length: Optional[int] = None,
+    num_candidates: int = 3,
+    min_autocorrelation: float = 0.3,
+    chunk_size: int = 2**22,
+) -> np.ndarray:
+    """Detects the most likely season lengths of many series at once from the peaks of their autocorrelation.
+
+    The series are stored one after the other, like the targets of a `Panel`. Each series is detrended, and the
+    autocorrelation of all series is computed with one FFT per chunk of series. The candidates are the lags where the
+    autocorrelation peaks above `min_autocorrelation`, strongest first, among the lags that fit at least two full seasons
+    into the series. Multiples of a season length peak less than the season length itself, as the autocorrelation
+    decays with the lag.
+
+    :param values: The targets of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :param max_season_length: The longest season length to consider. Defaults to half the length of each series.
+    :type max_season_length: int, optional
+    :param num_candidates: The number of season lengths to return for each series.
+    :type num_candidates: int
+    :param min_autocorrelation: The autocorrelation a season length must reach.
+    :type min_autocorrelation: float
+    :param chunk_size: The number of values of the padded autocorrelation matrix computed at once, to bound memory.
+    :type chunk_size: int
+    :return: The candidate season lengths of each series, strongest first, padded with zeros when fewer are found.
+    :rtype np.ndarray:
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    candidates = np.zeros((len(lengths), num_candidates), dtype=np.int64)
+    width = int(lengths.max(initial=0))
+    rows_per_chunk = max(1, chunk_size // max(4 * width, 1))
+
+    for start in range(0, len(lengths), rows_per_chunk):
+        end = min(start + rows_per_chunk, len(lengths))
+        chunk_offsets = offsets[start : end + 1]
+        acf = _autocorrelations(
+            values[chunk_offsets[0] : chunk_offsets[-1]],
+            chunk_offsets - chunk_offsets[0],
+        )
+        if acf.shape[1] < 4:
+            continue
+        max_lags = lengths[start:end] // 2
+        if max_season_length is not None:
+            max_lags = np.minimum(max_lags, max_season_length)
+
+        lags = np.arange(acf.shape[1])
+        inner = acf[:, 1:-1]
+        peaks = (inner > acf[:, :-2]) & (inner >= acf[:, 2:])
+        peaks &= inner >= min_autocorrelation
+        peaks &= (lags[1:-1] >= 2) & (lags[1:-1] <= max_lags[:, np.newaxis])
+        scores = np.where(peaks, inner, -np.inf)
+
+        count = min(num_candidates, scores.shape[1])
+        strongest = np.argsort(-scores, axis=1, kind="stable")[:, :count]
+        found = np.take_along_axis(scores, strongest, axis=1) > -np.inf
+        candidates[start:end, :count] = np.where(found, strongest + 1, 0)
+    return candidates
+
+
+def detect_season_length(
+    y: Union[pd.Series, np.ndarray],
+    max_season_length: Optional[int] = None,
+    min_autocorrelation: float = 0.3,
+) -> int:
+    """Detects the season length of a single series from the strongest peak of its autocorrelation.
+
+    :param y: The series.
+    :type y: pd.Series or np.ndarray
+    :param max_season_length: The longest season length to consider. Defaults to half the length of the series.
+    :type max_season_length: int, optional
+    :param min_autocorrelation: The autocorrelation a season length must reach.
+    :type min_autocorrelation: float
+    :return: The season length, or 1 if the series isn't seasonal.
+    :rtype int:
+    """
+    values = np.asarray(y, dtype=np.float64).reshape(-1)
+    values = values[~np.isnan(values)]
+    candidates = season_length_candidates(
+        values,
+        np.array([0, len(values)]),
+        max_season_length=max_season_length,
+        num_candidates=1,
+        min_autocorrelation=min_autocorrelation,
+    )
+    return int(candidates[0, 0]) or 1
@@ -0,0 +1,394 @@
+"""Utility functions that serve a model over HTTP, coalescing concurrent requests into micro-batches."""
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class Histogram:
+    """A thread-safe histogram with fixed upper bucket bounds and an overflow bucket.
+
+    :param buckets: The inclusive upper bound of each bucket, in increasing order.
+    :type buckets: tuple
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, count: int = 1) -> None:
+        """Records a value, `count` times."""
+        index = int(np.searchsorted(self.buckets, value, side="left"))
+        with self._lock:
+            self.counts[index] += count
+            self.total += value * count
+
+    def to_dict(self) -> dict:
+        """The bucket counts keyed by their upper bound, along with the number and mean of the recorded values."""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.total
+        num_values = sum(counts)
+        labels = [f"<={bound}" for bound in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            "count": num_values,
+            "mean": total / num_values if num_values else 0.0,
+            "buckets": dict(zip(labels, counts)),
+        }
+
+
+class ServingMetrics:
+    """Throughput, latency, and batch size statistics of a running server."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.latency_ms = Histogram(_LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(_BATCH_SIZE_BUCKETS)
+        self._lock = threading.Lock()
+
+    def record_batch(self, num_requests: int, num_rows: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.requests += num_requests
+            self.rows += num_rows
+        self.batch_size.observe(num_rows)
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def to_dict(self) -> dict:
+        """A JSON serializable summary of the statistics."""
+        elapsed = time.perf_counter() - self.started
+        with self._lock:
+            requests, rows, batches, errors = (
+                self.requests,
+                self.rows,
+                self.batches,
+                self.errors,
+            )
+        return {
+            "uptime_seconds": elapsed,
+            "requests": requests,
+            "rows": rows,
+            "batches": batches,
+            "errors": errors,
+            "requests_per_second": requests / elapsed if elapsed else 0.0,
+            "rows_per_second": rows / elapsed if elapsed else 0.0,
+            "latency_ms": self.latency_ms.to_dict(),
+            "batch_size": self.batch_size.to_dict(),
+        }
+
+
+class MicroBatcher:
+    """Coalesces concurrent prediction requests into batches that are predicted on together.
+
+    A batch is closed once it holds `max_batch_size` rows, or once `max_wait_ms` has passed since its first request
+    arrived, whichever comes first. Closed batches are predicted on in a pool of `num_workers` threads, so the event
+    loop keeps accepting requests while the model is busy.
+
+    :param predict: The function that predicts on a DataFrame of rows, returning one output per row.
+    :type predict: callable
+    :param max_batch_size: The maximum number of rows in a batch. A single request with more rows is predicted on as its
+    own batch. Defaults to 64.
+    :type max_batch_size: int, optional
+    :param max_wait_ms: The maximum time in milliseconds that a request waits for other requests to join its batch.
+    Defaults to 5.
+    :type max_wait_ms: float, optional
+    :param num_workers: The number of batches that can be predicted on at the same time. Defaults to 1.
+    :type num_workers: int, optional
+    :param metrics: The statistics to record the batches in. Defaults to new statistics.
+    :type metrics: ServingMetrics, optional
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[pd.DataFrame], Any],
+        max_batch_size: Optional[int] = 64,
+        max_wait_ms: Optional[float] = 5.0,
+        num_workers: Optional[int] = 1,
+        metrics: Optional[ServingMetrics] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be at least 1.")
+        if num_workers < 1:
+            raise ValueError("`num_workers` must be at least 1.")
+        self.predict = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self.num_workers = num_workers
+        self.metrics = metrics or ServingMetrics()
+        self._queue = None
+        self._executor = None
+        self._workers = None
+        self._collector = None
+
+    async def start(self) -> None:
+        """Starts collecting requests into batches on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._workers = asyncio.Semaphore(self.num_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        self._collector = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        """Stops collecting requests and waits for the batches being predicted on to finish."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        for _ in range(self.num_workers):
+            await self._workers.acquire()
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, rows: pd.DataFrame) -> np.ndarray:
+        """Queues the rows to be predicted on in the next batch, and waits for their predictions.
+
+        :param rows: The rows to predict on.
+        :type rows: pd.DataFrame
+        :return: The predictions for the rows.
+        :rtype np.ndarray:
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((rows, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        carried = None
+        while True:
+            batch = [carried if carried is not None else await self._queue.get()]
+            carried = None
+            num_rows = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+            while num_rows < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        request = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    request = self._queue.get_nowait()
+                if num_rows + len(request[0]) > self.max_batch_size:
+                    carried = request
+                    break
+                batch.append(request)
+                num_rows += len(request[0])
+            await self._workers.acquire()
+            asyncio.create_task(self._run(batch))
+
+    async def _run(self, batch: List[tuple]) -> None:
+        try:
+            frames = [rows for rows, _, _ in batch]
+            data = (
+                frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            )
+            try:
+                outputs = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self.predict, data
+                )
+            except Exception as error:
+                for _, future, _ in batch:
+                    self.metrics.record_error()
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            outputs = np.asarray(outputs)
+            self.metrics.record_batch(len(batch), len(data))
+            finished = time.perf_counter()
+            start = 0
+            for rows, future, enqueued in batch:
+                end = start + len(rows)
+                self.metrics.latency_ms.observe((finished - enqueued) * 1000)
+                if not future.done():
+                    future.set_result(outputs[start:end])
+                start = end
+        finally:
+            self._workers.release()
+
+
+def _parse_instances(body: bytes) -> pd.DataFrame:
+    """The rows of a JSON body of the form `{"instances": [...]}`, where each instance is a list or a dict."""
+    payload = json.loads(body)
+    instances = payload.get("instances") if isinstance(payload, dict) else None
+    if not isinstance(instances, list) or not instances:
+        raise ValueError(
+            'The body must be a JSON object with a non-empty "instances" list.'
+        )
+    return pd.DataFrame(instances)
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool
+) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode() + body)
+    await writer.drain()
+
+
+def _make_handler(batcher: MicroBatcher, max_body_bytes: int) -> Callable:
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode().split()
+                except ValueError:
+                    await _write_response(
+                        writer, 400, {"error": "Malformed request line."}, False
+                    )
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and (
+                    version == "HTTP/1.1"
+                )
+                try:
+                    content_length = int(headers.get("content-length", 0))
+                    if content_length < 0:
+                        raise ValueError
+                except ValueError:
+                    await _write_response(
+                        writer,
+                        400,
+                        {"error": "Malformed Content-Length header."},
+                        False,
+                    )
+                    break
+                if content_length > max_body_bytes:
+                    await _write_response(
+                        writer, 413, {"error": "The body is too large."}, False
+                    )
+                    break
+                body = await reader.readexactly(content_length)
+
+                path = path.split("?")[0]
+                if path == "/predict" and method == "POST":
+                    try:
+                        rows = _parse_instances(body)
+                    except ValueError as error:
+                        status, payload = 400, {"error": str(error)}
+                    else:
+                        try:
+                            predictions = await batcher.submit(rows)
+                            status, payload = 200, {"predictions": predictions.tolist()}
+                        except Exception as error:
+                            status, payload = 500, {"error": str(error)}
+                elif path == "/metrics" and method == "GET":
+                    status, payload = 200, batcher.metrics.to_dict()
+                elif path == "/health" and method == "GET":
+                    status, payload = 200, {"status": "ok"}
+                elif path in ("/predict", "/metrics", "/health"):
+                    status, payload = 405, {"error": f"{method} isn't allowed."}
+                else:
+                    status, payload = 404, {"error": f"{path} doesn't exist."}
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return _handle
+
+
+async def start_server(
+    model: Any,
+    host: Optional[str] = "127.0.0.1",
+    port: Optional[int] = 8000,
+    max_batch_size: Optional[int] = 64,
+    max_wait_ms: Optional[float] = 5.0,
+    num_workers: Optional[int] = 1,
+    max_body_bytes: Optional[int] = 16 * 1024**2,
+) -> Tuple[asyncio.AbstractServer, MicroBatcher]:
+    """Starts serving a fitted model over HTTP on the running event loop.
+
+    The server answers `POST /predict` with a JSON body of the form `{"instances": [...]}`, where each instance is either
+    a list of feature values or a dict of feature names to values, with `{"predictions": [...]}`. `GET /metrics` returns
+    the throughput, the latency histogram in milliseconds, and the batch size histogram, and `GET /health` returns
+    whether the server is up. Concurrent requests are coalesced into micro-batches by a `MicroBatcher`.
+
+    :param model: The fitted model to serve.
+    :type model: ModelBase
+    :param host: The host to listen on. Defaults to 127.0.0.1.
+    :type host: str, optional
+    :param port: The port to listen on, 0 picks a free port. Defaults to 8000.
+    :type port: int, optional
+    :param max_batch_size: The maximum number of rows predicted on together. Defaults to 64.
+    :type max_batch_size: int, optional
+    :param max_wait_ms: The maximum time in milliseconds a request waits for others to join its batch. Defaults to 5.
+    :type max_wait_ms: float, optional
+    :param num_workers: The number of batches that can be predicted on at the same time. Defaults to 1.
+    :type num_workers: int, optional
+    :param max_body_bytes: The maximum size of a request body in bytes. Defaults to 16 MB.
+    :type max_body_bytes: int, optional
+    :return: The running server and its batcher, which should be stopped once the server is closed.
+    :rtype tuple:
+    """
+    batcher = MicroBatcher(
+        predict=lambda rows: model.predict(rows, as_array=True),
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        num_workers=num_workers,
+    )
+    await batcher.start()
+    server = await asyncio.start_server(
+        _make_handler(batcher, max_body_bytes), host=host, port=port
+    )
+    return server, batcher
+
+
+async def serve_model(model: Any, **kwargs) -> None:
+    """Serves a fitted model over HTTP until the task is cancelled, see `start_server` for the options.
+
+    :param model: The fitted model to serve.
+    :type model: ModelBase
+    """
+    server, batcher = await start_server(model, **kwargs)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
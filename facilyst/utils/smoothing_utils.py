@@ -0,0 +1,477 @@
+"""Utility functions that keep the simple exponential smoothing state of the sparse time series models up to date.
+
+The Croston, TSB, ADIDA, and IMAPA models of statsforecast only keep their final forecast once fitted. The functions
+here compute the constant-size state behind that forecast with the same kernels statsforecast uses, and advance it one
+observation at a time, so new observations don't require refitting on the whole history. The batch functions run the
+same recursions for many series at once, vectorized across the series, for the batch mode of `forecast_many`.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import minimize
+from statsforecast.models import _chunk_sums, _intervals, _ses_forecast, _ses_mse
+
+
+def optimized_ses_alpha(values: np.ndarray) -> float:
+    """The smoothing parameter of statsforecast's optimized SES, searched between 0.1 and 0.3.
+
+    :param values: The values to smooth.
+    :type values: np.ndarray
+    :return: The smoothing parameter.
+    :rtype float:
+    """
+    return float(
+        minimize(
+            fun=_ses_mse,
+            x0=(0,),
+            args=(values,),
+            bounds=[(0.1, 0.3)],
+            method="L-BFGS-B",
+        ).x[0]
+    )
+
+
+def ses_level(values: np.ndarray, alpha: float) -> float:
+    """The SES level after all the values, which is also the one step ahead forecast, or NaN without values.
+
+    :param values: The values to smooth.
+    :type values: np.ndarray
+    :param alpha: The smoothing parameter.
+    :type alpha: float
+    :return: The level.
+    :rtype float:
+    """
+    if not len(values):
+        return np.nan
+    return float(_ses_forecast(values, alpha)[0])
+
+
+def ses_update(level: float, value: float, alpha: float) -> float:
+    """Advances a SES level by one value. A NaN level, from no values so far, starts at the value.
+
+    :param level: The current level.
+    :type level: float
+    :param value: The new value.
+    :type value: float
+    :param alpha: The smoothing parameter.
+    :type alpha: float
+    :return: The new level.
+    :rtype float:
+    """
+    if np.isnan(level):
+        return float(value)
+    return alpha * value + (1 - alpha) * level
+
+
+def _periods_since_demand(y: np.ndarray) -> int:
+    """The interval the next demand would close, counting the periods since the last non-zero value."""
+    nonzero = np.flatnonzero(y)
+    return len(y) - (nonzero[-1] if len(nonzero) else -1)
+
+
+def croston_state(y: np.ndarray) -> Dict[str, float]:
+    """The state of the optimized Croston method: the smoothed demand sizes and intervals.
+
+    :param y: The series the model is fitted on.
+    :type y: np.ndarray
+    :return: The state.
+    :rtype dict:
+    """
+    demands = y[y > 0]
+    intervals = _intervals(y)
+    state = {"last": float(y[-1]), "periods": _periods_since_demand(y)}
+    for key, values in [("demand", demands), ("interval", intervals)]:
+        # A single value is smoothed with the lower bound, as the optimizer never moves from it.
+        alpha = optimized_ses_alpha(values) if len(values) else 0.1
+        state[f"{key}_alpha"] = alpha
+        state[key] = ses_level(values, alpha)
+    return state
+
+
+def update_croston_state(state: Dict[str, float], y_new: np.ndarray) -> float:
+    """Advances the state of the optimized Croston method with new observations and returns the new forecast.
+
+    :param state: The state, updated in place.
+    :type state: dict
+    :param y_new: The new observations.
+    :type y_new: np.ndarray
+    :return: The forecast.
+    :rtype float:
+    """
+    for value in y_new:
+        if value > 0:
+            state["demand"] = ses_update(state["demand"], value, state["demand_alpha"])
+        if value != 0:
+            state["interval"] = ses_update(
+                state["interval"], state["periods"], state["interval_alpha"]
+            )
+            state["periods"] = 1
+        else:
+            state["periods"] += 1
+        state["last"] = float(value)
+    if np.isnan(state["demand"]):
+        return state["last"]
+    if state["interval"] != 0.0:
+        return state["demand"] / state["interval"]
+    return state["demand"]
+
+
+def tsb_state(y: np.ndarray, alpha_d: float, alpha_p: float) -> Dict[str, float]:
+    """The state of the TSB method: the smoothed demand sizes and demand probability.
+
+    :param y: The series the model is fitted on.
+    :type y: np.ndarray
+    :param alpha_d: The smoothing parameter of the demand sizes.
+    :type alpha_d: float
+    :param alpha_p: The smoothing parameter of the demand probability.
+    :type alpha_p: float
+    :return: The state.
+    :rtype dict:
+    """
+    return {
+        "demand_alpha": alpha_d,
+        "probability_alpha": alpha_p,
+        "demand": ses_level(y[y > 0], alpha_d),
+        "probability": ses_level((y != 0).astype(np.int32), alpha_p),
+    }
+
+
+def update_tsb_state(state: Dict[str, float], y_new: np.ndarray) -> float:
+    """Advances the state of the TSB method with new observations and returns the new forecast.
+
+    :param state: The state, updated in place.
+    :type state: dict
+    :param y_new: The new observations.
+    :type y_new: np.ndarray
+    :return: The forecast.
+    :rtype float:
+    """
+    for value in y_new:
+        if value > 0:
+            state["demand"] = ses_update(state["demand"], value, state["demand_alpha"])
+        state["probability"] = ses_update(
+            state["probability"], float(value != 0), state["probability_alpha"]
+        )
+    if np.isnan(state["demand"]):
+        return 0.0
+    return float(np.float32(state["probability"] * state["demand"]))
+
+
+def aggregation_level(y: np.ndarray) -> int:
+    """The aggregation level of ADIDA and the largest one of IMAPA, the rounded mean interval between demands.
+
+    :param y: The series.
+    :type y: np.ndarray
+    :return: The aggregation level, or 1 if the series has no demand.
+    :rtype int:
+    """
+    if not y.any():
+        return 1
+    return int(round(_intervals(y).mean().item()))
+
+
+def aggregate_state(y: np.ndarray, level: int) -> Dict[str, float]:
+    """The state of SES over the sums of non-overlapping buckets of `level` observations, aligned with the end.
+
+    :param y: The series the model is fitted on.
+    :type y: np.ndarray
+    :param level: The number of observations summed in each bucket.
+    :type level: int
+    :return: The state, along with the sum and size of the bucket being filled.
+    :rtype dict:
+    """
+    sums = _chunk_sums(y[len(y) % level :], level)
+    alpha = optimized_ses_alpha(sums) if len(sums) else 0.1
+    return {
+        "aggregation_level": level,
+        "alpha": alpha,
+        "level": ses_level(sums, alpha),
+        "bucket": 0.0,
+        "count": 0,
+    }
+
+
+def update_aggregate_state(state: Dict[str, float], y_new: np.ndarray) -> float:
+    """Advances an aggregated SES state with new observations and returns the new per-observation forecast.
+
+    :param state: The state, updated in place.
+    :type state: dict
+    :param y_new: The new observations.
+    :type y_new: np.ndarray
+    :return: The forecast.
+    :rtype float:
+    """
+    for value in y_new:
+        state["bucket"] += float(value)
+        state["count"] += 1
+        if state["count"] == state["aggregation_level"]:
+            state["level"] = ses_update(state["level"], state["bucket"], state["alpha"])
+            state["bucket"], state["count"] = 0.0, 0
+    if np.isnan(state["level"]):
+        return 0.0
+    return state["level"] / state["aggregation_level"]
+
+
+def imapa_states(y: np.ndarray) -> List[Dict[str, float]]:
+    """The aggregated SES states of IMAPA, one for every aggregation level up to the mean interval between demands.
+
+    :param y: The series the model is fitted on.
+    :type y: np.ndarray
+    :return: The states.
+    :rtype list:
+    """
+    return [aggregate_state(y, level) for level in range(1, aggregation_level(y) + 1)]
+
+
+def update_imapa_states(states: List[Dict[str, float]], y_new: np.ndarray) -> float:
+    """Advances the states of IMAPA with new observations and returns the new forecast, the mean over all levels.
+
+    :param states: The states, updated in place.
+    :type states: list
+    :param y_new: The new observations.
+    :type y_new: np.ndarray
+    :return: The forecast.
+    :rtype float:
+    """
+    forecasts = np.array(
+        [update_aggregate_state(state, y_new) for state in states], dtype=np.float32
+    )
+    return float(forecasts.mean())
+
+
+def _select(
+    values: np.ndarray, offsets: np.ndarray, mask: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The masked values of many series stored one after the other, along with the offsets of each series in them."""
+    return values[mask], np.r_[0, np.cumsum(mask)][offsets]
+
+
+def _positions(offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """The series of every value of many series stored one after the other, and its position in that series."""
+    lengths = np.diff(offsets)
+    series = np.repeat(np.arange(len(lengths)), lengths)
+    return series, np.arange(offsets[-1]) - offsets[series]
+
+
+def batch_ses(
+    values: np.ndarray, offsets: np.ndarray, alphas: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Runs SES over many series at once, for every smoothing parameter, vectorized across the series.
+
+    The series are stored one after the other, like the targets of a `Panel`. They are sorted by decreasing length, so
+    the series still running at any step are a prefix of the states, and every step costs one vectorized operation over
+    them. The recursion and the mean squared error match statsforecast's SES.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :param alphas: The smoothing parameters to run, the same for every series, or one row of parameters per series.
+    :type alphas: np.ndarray
+    :return: The one step ahead forecast and the mean squared error of each series for each smoothing parameter, NaN for
+    empty series.
+    :rtype tuple: np.ndarray, np.ndarray
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    order = np.argsort(-lengths, kind="stable")
+    starts, sorted_lengths = offsets[:-1][order], lengths[order]
+    running = int((sorted_lengths > 0).sum())
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+    alphas = np.broadcast_to(alphas, (len(lengths), alphas.shape[-1]))[order]
+
+    levels = np.repeat(values[starts[:running], np.newaxis], alphas.shape[1], axis=1)
+    errors = np.zeros_like(levels)
+    for step in range(1, int(sorted_lengths[0]) if running else 0):
+        running = np.searchsorted(-sorted_lengths, -step, side="left")
+        previous = values[starts[:running] + step - 1, np.newaxis]
+        levels[:running] = (
+            alphas[:running] * previous + (1 - alphas[:running]) * levels[:running]
+        )
+        errors[:running] += np.square(
+            values[starts[:running] + step, np.newaxis] - levels[:running]
+        )
+
+    running = len(levels)
+    last = values[starts[:running] + sorted_lengths[:running] - 1, np.newaxis]
+    forecasts = np.full(alphas.shape, np.nan)
+    mse = np.full(alphas.shape, np.nan)
+    forecasts[order[:running]] = (
+        alphas[:running] * last + (1 - alphas[:running]) * levels
+    )
+    mse[order[:running]] = errors / sorted_lengths[:running, np.newaxis]
+    return forecasts, mse
+
+
+def batch_optimized_ses(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    bounds: Tuple[float, float] = (0.1, 0.3),
+    grid_size: int = 21,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Runs SES over many series at once with the smoothing parameter of each series optimized on a grid.
+
+    The mean squared error is minimized on an evenly spaced grid over the bounds, and then on a finer grid around the
+    best parameter of each series, which searches all series together instead of running an optimizer for each one.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :param bounds: The smallest and largest smoothing parameters. Defaults to the bounds of statsforecast's optimized SES.
+    :type bounds: tuple
+    :param grid_size: The number of smoothing parameters of each grid.
+    :type grid_size: int
+    :return: The one step ahead forecast, NaN for empty series, and the smoothing parameter of each series. Ties go to
+    the smallest parameter, as series of a single value are smoothed with the lower bound.
+    :rtype tuple: np.ndarray, np.ndarray
+    """
+    grid = np.linspace(*bounds, grid_size)
+    step = grid[1] - grid[0]
+    forecasts, mse = batch_ses(values, offsets, grid)
+    best = grid[np.argmin(np.nan_to_num(mse, nan=np.inf), axis=1)]
+    fine_grid = np.clip(
+        best[:, np.newaxis] + np.linspace(-step, step, grid_size), *bounds
+    )
+    forecasts, mse = batch_ses(values, offsets, fine_grid)
+    best = np.argmin(np.nan_to_num(mse, nan=np.inf), axis=1)
+    rows = np.arange(len(best))
+    return forecasts[rows, best], fine_grid[rows, best]
+
+
+def batch_croston_forecasts(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The forecasts of the optimized Croston method for many series at once.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :return: The forecast of each series, NaN for empty series.
+    :rtype np.ndarray:
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    demands, demand_offsets = _select(values, offsets, values > 0)
+    nonzero = values != 0
+    _, positions = _positions(offsets)
+    ends, interval_offsets = _select(positions + 1, offsets, nonzero)
+    intervals = np.diff(ends, prepend=0).astype(np.float64)
+    firsts = interval_offsets[:-1][np.diff(interval_offsets) > 0]
+    intervals[firsts] = ends[firsts]
+
+    demand, _ = batch_optimized_ses(demands, demand_offsets)
+    interval, _ = batch_optimized_ses(intervals, interval_offsets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        forecasts = np.where(interval != 0, demand / interval, demand)
+    last = np.where(
+        np.diff(offsets) > 0, np.append(values, np.nan)[offsets[1:] - 1], np.nan
+    )
+    return np.where(np.diff(demand_offsets) > 0, forecasts, last)
+
+
+def batch_tsb_forecasts(
+    values: np.ndarray, offsets: np.ndarray, alpha_d: float, alpha_p: float
+) -> np.ndarray:
+    """The forecasts of the TSB method for many series at once.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :param alpha_d: The smoothing parameter of the demand sizes.
+    :type alpha_d: float
+    :param alpha_p: The smoothing parameter of the demand probability.
+    :type alpha_p: float
+    :return: The forecast of each series, zero for series without demand.
+    :rtype np.ndarray:
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    demands, demand_offsets = _select(values, offsets, values > 0)
+    demand = batch_ses(demands, demand_offsets, alpha_d)[0][:, 0]
+    probability = batch_ses((values != 0).astype(np.float64), offsets, alpha_p)[0][:, 0]
+    forecasts = (probability * demand).astype(np.float32).astype(np.float64)
+    return np.where(
+        np.diff(np.r_[0, np.cumsum(values != 0)][offsets]) > 0, forecasts, 0.0
+    )
+
+
+def _aggregation_levels(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The rounded mean interval between demands of many series at once, or 0 for series without demand."""
+    nonzero = values != 0
+    counts = np.diff(np.r_[0, np.cumsum(nonzero)][offsets])
+    series, positions = _positions(offsets)
+    ends = np.zeros(len(counts))
+    np.maximum.at(ends, series[nonzero], positions[nonzero] + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, np.round(ends / counts), 0).astype(np.int64)
+
+
+def _batch_aggregate_forecasts(
+    values: np.ndarray, offsets: np.ndarray, levels: np.ndarray
+) -> np.ndarray:
+    """The per-observation forecasts of optimized SES over the bucket sums of many series, each with its own level."""
+    lengths = np.diff(offsets)
+    series, positions = _positions(offsets)
+    remainders = (lengths % levels)[series]
+    kept = positions >= remainders
+    sum_offsets = np.r_[0, np.cumsum(lengths // levels)]
+    buckets = sum_offsets[series] + (positions - remainders) // levels[series]
+    sums = np.bincount(
+        buckets[kept], weights=values[kept], minlength=int(sum_offsets[-1])
+    )
+    forecasts, _ = batch_optimized_ses(sums, sum_offsets)
+    return forecasts / levels
+
+
+def batch_adida_forecasts(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The forecasts of the ADIDA method for many series at once.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :return: The forecast of each series, zero for series without demand.
+    :rtype np.ndarray:
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    levels = _aggregation_levels(values, offsets)
+    forecasts = _batch_aggregate_forecasts(values, offsets, np.maximum(levels, 1))
+    return np.where(levels > 0, forecasts, 0.0)
+
+
+def batch_imapa_forecasts(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """The forecasts of the IMAPA method for many series at once.
+
+    Every series is repeated once for each of its aggregation levels, and all the repetitions are smoothed together.
+
+    :param values: The values of every series, one series after the other.
+    :type values: np.ndarray
+    :param offsets: The start of each series in `values`, followed by the total number of values.
+    :type offsets: np.ndarray
+    :return: The forecast of each series, zero for series without demand.
+    :rtype np.ndarray:
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    max_levels = _aggregation_levels(values, offsets)
+    sources = np.repeat(np.arange(len(max_levels)), max_levels)
+    levels = (
+        np.arange(len(sources))
+        - np.repeat(np.cumsum(max_levels) - max_levels, max_levels)
+        + 1
+    )
+    lengths = np.diff(offsets)[sources]
+    repeated_offsets = np.r_[0, np.cumsum(lengths)]
+    _, positions = _positions(repeated_offsets)
+    repeated = values[np.repeat(offsets[:-1][sources], lengths) + positions]
+
+    level_forecasts = _batch_aggregate_forecasts(
+        repeated, repeated_offsets, levels
+    ).astype(np.float32)
+    totals = np.bincount(sources, weights=level_forecasts, minlength=len(max_levels))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        forecasts = (totals / max_levels).astype(np.float32).astype(np.float64)
+    return np.where(max_levels > 0, forecasts, 0.0)
@@ -0,0 +1,292 @@
+"""Utility classes that stream observations of many intermittent demand series into constant-size smoothing states."""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from facilyst.utils.panel_utils import split_panel
+
+_methods: Dict[str, str] = {
+    "Croston Optimized Regressor": "croston",
+    "TSB Regressor": "tsb",
+    "ADIDA Regressor": "adida",
+    "IMAPA Regressor": "imapa",
+}
+
+
+def _ses(level: np.ndarray, value: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """Advances SES levels by one value each, where NaN levels, from no values so far, start at the value."""
+    return np.where(np.isnan(level), value, alpha * value + (1 - alpha) * level)
+
+
+class StreamingSparseForecaster:
+    """Tracks the Croston, TSB, ADIDA, or IMAPA forecasts of many series as new observations arrive.
+
+    Each series only keeps the constant-size state of its smoothing recursions, so an observation is folded in with a
+    few arithmetic operations and the forecasts are always ready, however long the series. The states of all series are
+    packed into one structure of arrays with a slot per series, so that millions of series fit in a few arrays and a
+    batch of observations of many series updates them with vectorized operations.
+
+    :param model: The sparse time series model to stream, whose parameters are used for every series. One of
+    `CrostonOptimizedRegressor`, `TSBRegressor`, `ADIDARegressor`, or `IMAPARegressor`.
+    :type model: TimeSeriesModelBase
+    :raises ValueError: If the model can't be streamed.
+    """
+
+    def __init__(self, model: Any) -> None:
+        if getattr(model, "name", None) not in _methods:
+            raise ValueError(f"Only the {', '.join(_methods)} models can be streamed.")
+        self.model = model
+        self.method = _methods[model.name]
+        self.ids = pd.Index([])
+        self.fields: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _empty_state(self) -> Any:
+        """The state of a series without any observations."""
+        if self.method == "croston":
+            return {
+                "last": 0.0,
+                "periods": 1,
+                "demand_alpha": 0.1,
+                "demand": np.nan,
+                "interval_alpha": 0.1,
+                "interval": np.nan,
+            }
+        if self.method == "tsb":
+            return {
+                "demand_alpha": self.model.parameters["alpha_d"],
+                "probability_alpha": self.model.parameters["alpha_p"],
+                "demand": np.nan,
+                "probability": np.nan,
+            }
+        state = {
+            "aggregation_level": 1,
+            "alpha": 0.1,
+            "level": np.nan,
+            "bucket": 0.0,
+            "count": 0,
+        }
+        return [state] if self.method == "imapa" else state
+
+    def _pack(self, states: List[Any]) -> Dict[str, np.ndarray]:
+        """Packs the states of the wrapped model, one per series, into one array per field."""
+        if self.method != "imapa":
+            return (
+                {
+                    field: np.array(
+                        [state[field] for state in states], dtype=np.float64
+                    )
+                    for field in states[0]
+                }
+                if states
+                else {field: np.empty(0) for field in self._empty_state()}
+            )
+        num_levels = max((len(levels) for levels in states), default=1)
+        fields = {
+            "levels": np.array([len(levels) for levels in states], dtype=np.float64),
+            "alpha": np.full((len(states), num_levels), 0.1),
+            "level": np.full((len(states), num_levels), np.nan),
+            "bucket": np.zeros((len(states), num_levels)),
+            "count": np.zeros((len(states), num_levels)),
+        }
+        for row, levels in enumerate(states):
+            for column, state in enumerate(levels):
+                for field in ["alpha", "level", "bucket", "count"]:
+                    fields[field][row, column] = state[field]
+        return fields
+
+    def _append(self, ids: np.ndarray, states: List[Any]) -> None:
+        """Adds series to the packed states, widening the IMAPA levels if the new series have more."""
+        packed = self._pack(states)
+        if not self.fields:
+            self.fields = packed
+        else:
+            for field, values in packed.items():
+                current = self.fields[field]
+                if values.ndim == 2 and values.shape[1] != current.shape[1]:
+                    width = max(values.shape[1], current.shape[1])
+                    fill = {"alpha": 0.1, "level": np.nan}.get(field, 0.0)
+                    current, values = (
+                        np.pad(
+                            each,
+                            ((0, 0), (0, width - each.shape[1])),
+                            constant_values=fill,
+                        )
+                        for each in (current, values)
+                    )
+                self.fields[field] = np.concatenate([current, values])
+        self.ids = self.ids.append(pd.Index(ids))
+
+    def fit(
+        self,
+        data: pd.DataFrame,
+        id_column: str,
+        time_column: str,
+        target_column: str,
+    ) -> "StreamingSparseForecaster":
+        """Computes the state of every series of a long-format DataFrame from its history, replacing any tracked series.
+
+        :param data: The series, with one row per series and time.
+        :type data: pd.DataFrame
+        :param id_column: The column that identifies each series.
+        :type id_column: str
+        :param time_column: The column holding the time of each row.
+        :type time_column: str
+        :param target_column: The column holding the target values.
+        :type target_column: str
+        :return: Returns self.
+        :rtype StreamingSparseForecaster:
+        """
+        panel = split_panel(data, id_column, time_column, target_column)
+        self.ids, self.fields = pd.Index([]), {}
+        self._append(
+            panel.ids,
+            [
+                self.model._initial_state(panel.series(index))
+                for index in range(len(panel))
+            ],
+        )
+        return self
+
+    def _rows(self, ids: np.ndarray, add_missing: bool) -> np.ndarray:
+        rows = self.ids.get_indexer(ids)
+        missing = rows < 0
+        if missing.any():
+            if not add_missing:
+                raise ValueError(
+                    f"The series {list(pd.unique(ids[missing]))[:5]} aren't tracked."
+                )
+            new_ids = pd.unique(ids[missing])
+            self._append(new_ids, [self._empty_state() for _ in new_ids])
+            rows = self.ids.get_indexer(ids)
+        return rows
+
+    def _update_rows(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """Folds one observation into each of the rows, which are all different."""
+        fields = self.fields
+        if self.method == "croston":
+            demand, nonzero = values > 0, values != 0
+            demand_rows, interval_rows = rows[demand], rows[nonzero]
+            fields["demand"][demand_rows] = _ses(
+                fields["demand"][demand_rows],
+                values[demand],
+                fields["demand_alpha"][demand_rows],
+            )
+            fields["interval"][interval_rows] = _ses(
+                fields["interval"][interval_rows],
+                fields["periods"][interval_rows],
+                fields["interval_alpha"][interval_rows],
+            )
+            fields["periods"][interval_rows] = 1
+            fields["periods"][rows[~nonzero]] += 1
+            fields["last"][rows] = values
+        elif self.method == "tsb":
+            demand = values > 0
+            demand_rows = rows[demand]
+            fields["demand"][demand_rows] = _ses(
+                fields["demand"][demand_rows],
+                values[demand],
+                fields["demand_alpha"][demand_rows],
+            )
+            fields["probability"][rows] = _ses(
+                fields["probability"][rows],
+                (values != 0).astype(np.float64),
+                fields["probability_alpha"][rows],
+            )
+        elif self.method == "adida":
+            fields["bucket"][rows] += values
+            fields["count"][rows] += 1
+            full = rows[fields["count"][rows] == fields["aggregation_level"][rows]]
+            fields["level"][full] = _ses(
+                fields["level"][full], fields["bucket"][full], fields["alpha"][full]
+            )
+            fields["bucket"][full] = 0
+            fields["count"][full] = 0
+        else:
+            aggregation_levels = np.arange(1, fields["level"].shape[1] + 1)
+            valid = aggregation_levels <= fields["levels"][rows, np.newaxis]
+            buckets = np.where(valid, fields["bucket"][rows] + values[:, np.newaxis], 0)
+            counts = np.where(valid, fields["count"][rows] + 1, 0)
+            full = valid & (counts == aggregation_levels)
+            levels = fields["level"][rows]
+            fields["level"][rows] = np.where(
+                full, _ses(levels, buckets, fields["alpha"][rows]), levels
+            )
+            fields["bucket"][rows] = np.where(full, 0, buckets)
+            fields["count"][rows] = np.where(full, 0, counts)
+
+    def update(self, ids: Any, values: Any) -> "StreamingSparseForecaster":
+        """Folds a batch of observations into the states of their series, in order.
+
+        Every observation costs a constant amount of work. Observations of different series are applied together, and
+        the observations of a series that appears several times in the batch are applied in the order they're passed.
+        Series that aren't tracked yet are added without history.
+
+        :param ids: The series of each observation.
+        :type ids: array-like
+        :param values: The observations.
+        :type values: array-like
+        :return: Returns self.
+        :rtype StreamingSparseForecaster:
+        """
+        ids = np.atleast_1d(np.asarray(ids))
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        rows = self._rows(ids, add_missing=True)
+
+        # The n-th observation of every series in the batch is applied in the n-th round.
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        starts = np.r_[True, sorted_rows[1:] != sorted_rows[:-1]]
+        first = np.maximum.accumulate(np.where(starts, np.arange(len(rows)), 0))
+        rounds = np.empty(len(rows), dtype=np.int64)
+        rounds[order] = np.arange(len(rows)) - first
+        by_round = np.argsort(rounds, kind="stable")
+        boundaries = np.cumsum(np.bincount(rounds))[:-1]
+        for events in np.split(by_round, boundaries):
+            self._update_rows(rows[events], values[events])
+        return self
+
+    def forecast(self, ids: Optional[Any] = None) -> np.ndarray:
+        """The forecasts of the series, which are the same for every step ahead.
+
+        :param ids: The series to forecast. Defaults to every tracked series, in the order they were added.
+        :type ids: array-like, optional
+        :return: The forecast of each series.
+        :rtype np.ndarray:
+        :raises ValueError: If a series isn't tracked.
+        """
+        rows = (
+            np.arange(len(self.ids))
+            if ids is None
+            else self._rows(np.atleast_1d(np.asarray(ids)), add_missing=False)
+        )
+        fields = {field: values[rows] for field, values in self.fields.items()}
+        if self.method == "croston":
+            demand, interval = fields["demand"], fields["interval"]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                smoothed = np.where(interval != 0, demand / interval, demand)
+            return np.where(np.isnan(demand), fields["last"], smoothed)
+        if self.method == "tsb":
+            return np.where(
+                np.isnan(fields["demand"]),
+                0.0,
+                (fields["probability"] * fields["demand"]).astype(np.float32),
+            )
+        if self.method == "adida":
+            return np.where(
+                np.isnan(fields["level"]),
+                0.0,
+                fields["level"] / fields["aggregation_level"],
+            )
+        aggregation_levels = np.arange(1, fields["level"].shape[1] + 1)
+        level_forecasts = np.where(
+            np.isnan(fields["level"]), 0.0, fields["level"] / aggregation_levels
+        ).astype(np.float32)
+        valid = aggregation_levels <= fields["levels"][:, np.newaxis]
+        return (
+            np.where(valid, level_forecasts, 0).sum(axis=1, dtype=np.float32)
+            / valid.sum(axis=1)
+        ).astype(np.float64)